@@ -0,0 +1,86 @@
+"""
+Memória ocupada pela AST de um programa sintético grande: nós com __slots__ (pascal_ast)
+contra a representação antiga em tuples (obtida com Node.as_tuple).
+Conta-se o tamanho (sys.getsizeof) de cada nó/tuple e de cada lista da árvore;
+nomes, literais e tipos são partilhados pelas duas representações e ficam de fora.
+
+    python3 bench/bench_ast_memory.py                     # forma por omissão
+    python3 bench/bench_ast_memory.py --statements 50000 --json ast.json
+"""
+import os
+import sys
+import json
+import argparse
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+
+from bench_compile import Gerador
+
+
+def tamanho(raiz, e_no):
+    """(nº de nós, bytes) dos nós e listas alcançáveis a partir da raiz"""
+    vistos = set()
+    nos = 0
+    total = 0
+    pendentes = [raiz]
+    while pendentes:
+        obj = pendentes.pop()
+        if id(obj) in vistos:
+            continue
+        if isinstance(obj, list):
+            filhos = obj
+        elif e_no(obj):
+            nos += 1
+            filhos = [getattr(obj, c) for c in obj.__slots__] if hasattr(obj, '__slots__') else obj
+        else:
+            continue
+        vistos.add(id(obj))
+        total += sys.getsizeof(obj)
+        pendentes.extend(filhos)
+    return nos, total
+
+
+def main():
+    argp = argparse.ArgumentParser()
+    argp.add_argument('--statements', type=int, default=20000, help='comandos no bloco principal')
+    argp.add_argument('--depth', type=int, default=3, help='profundidade máxima de aninhamento')
+    argp.add_argument('--subprograms', type=int, default=50, help='número de funções/procedimentos')
+    argp.add_argument('--seed', type=int, default=1)
+    argp.add_argument('--json', default=None, help='ficheiro onde guardar os resultados')
+    args = argp.parse_args()
+
+    from pascal_compiler import Compiler
+    from pascal_ast import Node
+
+    fonte = Gerador(args.statements, args.depth, args.subprograms, 6, 100, args.seed).programa()
+    compiler = Compiler()
+    ast = compiler.parse(fonte)
+    if ast is None or compiler.errors:
+        raise SystemExit("o programa gerado tem erros de compilação")
+
+    nos, classes = tamanho(ast, lambda o: isinstance(o, Node))
+    # nos tuples antigos o primeiro elemento é o nome do nó (os tipos eram tuples partilhados)
+    _, tuples = tamanho(ast.as_tuple(), lambda o: isinstance(o, tuple) and o and isinstance(o[0], str))
+
+    resultado = {
+        'benchmark': 'ast_memory',
+        'linhas': fonte.count("\n"),
+        'nos': nos,
+        'tuples_kb': tuples / 1024,
+        'slots_kb': classes / 1024,
+        'bytes_por_no_tuples': tuples / nos,
+        'bytes_por_no_slots': classes / nos,
+        'reducao': 1 - classes / tuples,
+    }
+    print(f"programa: {resultado['linhas']} linhas, {nos} nós")
+    print(f"  tuples   {resultado['tuples_kb']:10.1f} KB  ({resultado['bytes_por_no_tuples']:.1f} bytes/nó)")
+    print(f"  __slots__{resultado['slots_kb']:10.1f} KB  ({resultado['bytes_por_no_slots']:.1f} bytes/nó)")
+    print(f"  redução  {resultado['reducao'] * 100:9.1f} %")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""
+Benchmark do débito do compilador sobre programas Pascal sintéticos de forma controlada.
+Mede separadamente a análise léxica, o parse (que inclui a leitura dos tokens pelo parser)
+e a geração de código (resolução dos identificadores, CodeGenerator.generate e a escrita
+do texto EWVM, sem as otimizações da AST nem as do código).
+Com --inline as chamadas são expandidas antes da geração (fase inline): cada expansão
+acrescenta variáveis escondidas ao frame do chamador, que a fase codegen tem de dispor.
+
+    python3 bench/bench_compile.py                          # forma por omissão, 10 repetições
+    python3 bench/bench_compile.py --statements 5000 --depth 4 --subprograms 50
+    python3 bench/bench_compile.py --statements 16000 --inline  # muitos temporários num frame
+    python3 bench/bench_compile.py --json atual.json --compare anterior.json
+    python3 bench/bench_compile.py --dump programa.pas      # guarda o programa gerado
+"""
+import os
+import sys
+import json
+import random
+import argparse
+import platform
+import statistics
+import time
+import tracemalloc
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+
+FASES = ('lex', 'parse', 'inline', 'codegen')
+
+
+def gerar(ast):
+    """fase codegen: resolução dos identificadores + geração + texto"""
+    from pascal_resolve import Resolver
+    from pascal_codegen import CodeGenerator
+    from pascal_ir import serialize
+
+    return serialize(CodeGenerator(Resolver().resolve(ast)).generate())
+
+
+def expandir(ast):
+    """fase inline: expansão das chamadas (Inliner com o orçamento por omissão)"""
+    from pascal_inline import Inliner, DEFAULT_BUDGET
+
+    return Inliner(DEFAULT_BUDGET).inline(ast)
+
+
+class Gerador:
+    def __init__(self, statements, depth, subprograms, width, nvars, seed):
+        """
+        Gera um programa com:
+        - statements: nº de comandos do bloco principal (contando os comandos compostos)
+        - depth: profundidade máxima de aninhamento de if/while/for/begin
+        - subprograms: nº de funções e procedimentos
+        - width: nº de argumentos de cada writeln
+        - nvars: nº de variáveis inteiras globais (bloco var grande)
+        """
+        self.statements = statements
+        self.depth = depth
+        self.subprograms = subprograms
+        self.width = width
+        self.vars = [f"v{i}" for i in range(max(nvars, 2))]
+        self.rnd = random.Random(seed)
+        self.funcs = [] # funções que podem ser usadas em expressões
+
+    def var(self):
+        return self.rnd.choice(self.vars)
+
+    def expr(self, nivel=2):
+        """expressão inteira"""
+        escolha = self.rnd.random()
+        if nivel == 0 or escolha < 0.3:
+            return self.var() if self.rnd.random() < 0.6 else str(self.rnd.randint(0, 99))
+        if escolha < 0.4 and self.funcs:
+            return f"{self.rnd.choice(self.funcs)}({self.expr(nivel - 1)})"
+        op = self.rnd.choice(['+', '-', '*', 'div', 'mod'])
+        if op in ('div', 'mod'):
+            return f"({self.expr(nivel - 1)}) {op} {self.rnd.randint(2, 9)}"
+        return f"{self.expr(nivel - 1)} {op} {self.expr(nivel - 1)}"
+
+    def cond(self):
+        op = self.rnd.choice(['<', '>', '<=', '>=', '=', '<>'])
+        return f"{self.expr(1)} {op} {self.expr(1)}"
+
+    def simples(self):
+        escolha = self.rnd.random()
+        if escolha < 0.7:
+            return f"{self.var()} := {self.expr()}"
+        if escolha < 0.85:
+            args = ', '.join(f"'x{i} = '" if i % 2 == 0 else self.var() for i in range(self.width))
+            return f"writeln({args})"
+        return f"a[{self.rnd.randint(1, 10)}] := {self.expr(1)}"
+
+    def comando(self, nivel, restantes, ind):
+        """devolve (linhas, nº de comandos gastos)"""
+        pad = '  ' * ind
+        if nivel >= self.depth or restantes < 3 or self.rnd.random() < 0.6:
+            return [pad + self.simples()], 1
+
+        corpo, gastos = self.sequencia(nivel + 1, min(restantes - 1, self.rnd.randint(2, 6)), ind + 1)
+        tipo = self.rnd.choice(['if', 'while', 'for'])
+        if tipo == 'if':
+            cabeca = f"if {self.cond()} then"
+        elif tipo == 'while':
+            cabeca = f"while {self.cond()} do"
+        else:
+            cabeca = f"for {self.var()} := 1 to {self.rnd.randint(2, 20)} do"
+        return [pad + cabeca, pad + 'begin'] + corpo + [pad + 'end'], gastos + 1
+
+    def sequencia(self, nivel, n, ind):
+        linhas = []
+        gastos = 0
+        while gastos < n:
+            novas, k = self.comando(nivel, n - gastos, ind)
+            if linhas:
+                linhas[-1] += ';'
+            linhas += novas
+            gastos += k
+        return linhas, gastos
+
+    def subprograma(self, i):
+        if i % 2 == 0:
+            nome = f"F{i}"
+            linhas = [f"function {nome}(x: integer): integer;", "var", "  t, u: integer;", "begin",
+                      "  t := x * 2 + 1;",
+                      "  u := 0;",
+                      "  while t > 0 do",
+                      "  begin",
+                      "    u := u + t mod 10;",
+                      "    t := t div 10",
+                      "  end;",
+                      f"  {nome} := u",
+                      "end;", ""]
+            self.funcs.append(nome)
+        else:
+            nome = f"P{i}"
+            linhas = [f"procedure {nome}(x: integer);", "begin",
+                      "  if x > 0 then",
+                      f"    writeln('{nome}: ', x)",
+                      "end;", ""]
+        return linhas
+
+    def programa(self):
+        linhas = ["program Bench;", "var"]
+        for i in range(0, len(self.vars), 10):
+            linhas.append(f"  {', '.join(self.vars[i:i + 10])}: integer;")
+        linhas += ["  a: array[1..10] of integer;", ""]
+
+        for i in range(self.subprograms):
+            linhas += self.subprograma(i)
+
+        corpo, _ = self.sequencia(0, self.statements, 1)
+        procs = [f"  P{i}({self.var()});" for i in range(1, self.subprograms, 2)]
+        linhas += ["begin"] + procs + corpo + ["end."]
+        return "\n".join(linhas) + "\n"
+
+
+def medir_fases(fonte, inline=False):
+    """uma compilação completa, fase a fase. Devolve ({fase: segundos}, nº de tokens)."""
+    from pascal_compiler import Compiler
+
+    compiler = Compiler()
+    tempos = {}
+
+    compiler.reset()
+    lexer = compiler.lexer
+    t = time.perf_counter()
+    lexer.input(fonte)
+    tokens = 0
+    while lexer.token() is not None:
+        tokens += 1
+    tempos['lex'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    ast = compiler.parse(fonte)
+    tempos['parse'] = time.perf_counter() - t
+    if ast is None or compiler.errors:
+        raise SystemExit("o programa gerado tem erros de compilação")
+
+    if inline:
+        t = time.perf_counter()
+        ast = expandir(ast)
+        tempos['inline'] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    gerar(ast)
+    tempos['codegen'] = time.perf_counter() - t
+    return tempos, tokens
+
+
+def medir_memoria(fonte, inline=False):
+    """pico de memória alocada (tracemalloc) em cada fase, numa compilação à parte"""
+    from pascal_compiler import Compiler
+
+    compiler = Compiler()
+    picos = {}
+    tracemalloc.start()
+
+    compiler.reset()
+    tracemalloc.reset_peak()
+    compiler.lexer.input(fonte)
+    while compiler.lexer.token() is not None:
+        pass
+    picos['lex'] = tracemalloc.get_traced_memory()[1]
+
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    ast = compiler.parse(fonte)
+    picos['parse'] = tracemalloc.get_traced_memory()[1] - base
+
+    if inline:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        ast = expandir(ast)
+        picos['inline'] = tracemalloc.get_traced_memory()[1] - base
+
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    gerar(ast)
+    picos['codegen'] = tracemalloc.get_traced_memory()[1] - base
+
+    tracemalloc.stop()
+    return picos
+
+
+def comparar(resultado, ficheiro):
+    with open(ficheiro) as f:
+        anterior = json.load(f)
+    print(f"\ncomparação com {ficheiro} (versão {anterior.get('versao')}):")
+    for fase in resultado['fases']:
+        antes = anterior['fases'].get(fase, {}).get('mediana_ms')
+        agora = resultado['fases'][fase]['mediana_ms']
+        if antes:
+            print(f"  {fase:8} {antes:9.2f} ms -> {agora:9.2f} ms  ({agora / antes:5.2f}x)")
+
+
+def main():
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', type=int, default=10, help='número de repetições')
+    argp.add_argument('--statements', type=int, default=2000, help='comandos no bloco principal')
+    argp.add_argument('--depth', type=int, default=3, help='profundidade máxima de aninhamento')
+    argp.add_argument('--subprograms', type=int, default=20, help='número de funções/procedimentos')
+    argp.add_argument('--width', type=int, default=6, help='argumentos de cada writeln')
+    argp.add_argument('--vars', type=int, default=100, help='variáveis globais no bloco var')
+    argp.add_argument('--seed', type=int, default=1)
+    argp.add_argument('--inline', action='store_true',
+                      help='expande as chamadas antes da geração (fase inline)')
+    argp.add_argument('--dump', default=None, help='ficheiro onde guardar o programa gerado')
+    argp.add_argument('--json', default=None, help='ficheiro onde guardar os resultados')
+    argp.add_argument('--compare', default=None, help='resultados anteriores (JSON) a comparar')
+    args = argp.parse_args()
+
+    forma = {'statements': args.statements, 'depth': args.depth, 'subprograms': args.subprograms,
+             'width': args.width, 'vars': args.vars, 'seed': args.seed, 'inline': args.inline}
+    fonte = Gerador(args.statements, args.depth, args.subprograms, args.width,
+                    args.vars, args.seed).programa()
+    if args.dump:
+        with open(args.dump, 'w') as f:
+            f.write(fonte)
+    linhas = fonte.count("\n")
+
+    fases = [fase for fase in FASES if fase != 'inline' or args.inline]
+    medidas = {fase: [] for fase in fases}
+    tokens = 0
+    for _ in range(args.n):
+        tempos, tokens = medir_fases(fonte, args.inline)
+        for fase in fases:
+            medidas[fase].append(tempos[fase])
+    picos = medir_memoria(fonte, args.inline)
+
+    from pascal_compiler import VERSION
+    resultado = {
+        'benchmark': 'compile',
+        'versao': VERSION,
+        'python': platform.python_version(),
+        'repeticoes': args.n,
+        'forma': forma,
+        'linhas': linhas,
+        'tokens': tokens,
+        'fases': {},
+    }
+    print(f"programa: {linhas} linhas, {tokens} tokens ({args.n} repetições)")
+    for fase in fases:
+        mediana = statistics.median(medidas[fase])
+        resultado['fases'][fase] = {
+            'min_ms': min(medidas[fase]) * 1000,
+            'mediana_ms': mediana * 1000,
+            'tokens_s': tokens / mediana,
+            'linhas_s': linhas / mediana,
+            'pico_kb': picos[fase] / 1024,
+        }
+        r = resultado['fases'][fase]
+        print(f"  {fase:8} mediana {r['mediana_ms']:9.2f} ms  {r['tokens_s']:12.0f} tokens/s  "
+              f"{r['linhas_s']:10.0f} linhas/s  pico {r['pico_kb']:9.1f} KB")
+
+    if args.compare:
+        comparar(resultado, args.compare)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
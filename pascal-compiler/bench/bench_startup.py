@@ -0,0 +1,53 @@
+"""
+Benchmark do custo de arranque do compilador: mede `import pascal_anasin`
+(lexer + parser prontos a usar) num interpretador novo, várias vezes.
+
+    python3 bench/bench_startup.py            # 20 repetições
+    python3 bench/bench_startup.py -n 50 --json startup.json
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# corre dentro do processo filho: só conta o import, não o arranque do interpretador
+SNIPPET = (
+    "import time; t = time.perf_counter(); import pascal_anasin; "
+    "print(time.perf_counter() - t)"
+)
+
+def medir(repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        out = subprocess.run([sys.executable, '-c', SNIPPET], cwd=SRC,
+                             capture_output=True, text=True, check=True)
+        tempos.append(float(out.stdout.strip().splitlines()[-1]))
+    return tempos
+
+def main():
+    argp = argparse.ArgumentParser()
+    argp.add_argument('-n', type=int, default=20, help='número de repetições')
+    argp.add_argument('--json', default=None, help='ficheiro onde guardar os resultados')
+    args = argp.parse_args()
+
+    tempos = medir(args.n)
+    resultado = {
+        'benchmark': 'import pascal_anasin',
+        'repeticoes': args.n,
+        'min_ms': min(tempos) * 1000,
+        'mediana_ms': statistics.median(tempos) * 1000,
+        'media_ms': statistics.mean(tempos) * 1000,
+    }
+
+    print(f"import pascal_anasin ({args.n}x): min {resultado['min_ms']:.2f} ms, "
+          f"mediana {resultado['mediana_ms']:.2f} ms, média {resultado['media_ms']:.2f} ms")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(resultado, f, indent=2)
+
+if __name__ == '__main__':
+    main()
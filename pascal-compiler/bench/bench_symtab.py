@@ -0,0 +1,150 @@
+"""
+Micro-benchmark da tabela de símbolos: consultas com vários níveis de aninhamento.
+Compara a SymbolTable atual (uma stack de declarações por nome) com a implementação
+anterior (uma stack de dicionários percorrida do scope mais interno para o global),
+copiada abaixo como TabelaPorScopes.
+
+    python3 bench/bench_symtab.py                         # profundidades 1, 4, 16 e 64
+    python3 bench/bench_symtab.py --depths 1 8 32 --lookups 200000 --json symtab.json
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+
+from pascal_ast import INTEGER, VOID, ArrayType
+from pascal_anasem import SymbolTable, BUILTINS, array_layout
+
+
+class TabelaPorScopes:
+    """implementação anterior: lookup percorre os scopes abertos (O(profundidade))"""
+    def __init__(self):
+        self.scope_stack = [{}]
+        self.offset_stack = [0]
+        self.errors = 0
+        self.lookups = 0
+        for name, type_info, category in BUILTINS:
+            self.add(name, type_info, category)
+
+    def enter_scope(self):
+        self.scope_stack.append({})
+        self.offset_stack.append(0)
+
+    def exit_scope(self):
+        if len(self.scope_stack) > 1:
+            self.scope_stack.pop()
+            self.offset_stack.pop()
+
+    def add(self, name, type_info, category):
+        current_scope = self.scope_stack[-1]
+        name = name.lower()
+        if name in current_scope:
+            print(f"Aviso: O nome '{name}' já está a ser usado neste scope.")
+        current_offset = self.offset_stack[-1]
+        if category == 'VAR':
+            self.offset_stack[-1] += 1
+        current_scope[name] = {'type': type_info, 'category': category, 'offset': current_offset}
+        if category == 'VAR' and isinstance(type_info, ArrayType):
+            current_scope[name]['layout'] = array_layout(type_info)
+
+    def lookup(self, name, line=0):
+        self.lookups += 1
+        name_lower = name.lower()
+        for i, scope in enumerate(reversed(self.scope_stack)):
+            if name_lower in scope:
+                symbol = scope[name_lower]
+                is_global = (i == len(self.scope_stack) - 1)
+                symbol['scope'] = 'GLOBAL' if is_global else 'LOCAL'
+                return symbol
+        return None
+
+    def update_type(self, name, new_type):
+        name = name.lower()
+        if len(self.scope_stack) >= 2:
+            parent_scope = self.scope_stack[-2]
+            if name in parent_scope:
+                parent_scope[name]['type'] = new_type
+
+
+def preparar(classe, depth, width):
+    """tabela com depth scopes abertos, cada um com width variáveis (e o subprograma que o abre)"""
+    ts = classe()
+    for nivel in range(depth + 1):
+        if nivel:
+            ts.add(f"Sub{nivel}", VOID, 'PROCEDURE')
+            ts.enter_scope()
+        for i in range(width):
+            ts.add(f"V{nivel}_{i}", INTEGER, 'VAR')
+    return ts
+
+
+def medir(classe, depth, width, nomes, repeticoes):
+    """(ns por lookup, ns por ciclo enter/add/exit de um scope) — melhor de várias repetições"""
+    ts = preparar(classe, depth, width)
+    lookup = ts.lookup
+    tempos = []
+    for _ in range(repeticoes):
+        t = time.perf_counter()
+        for nome in nomes:
+            lookup(nome)
+        tempos.append((time.perf_counter() - t) / len(nomes) * 1e9)
+
+    locais = [f"T{i}" for i in range(width)]
+    scopes = max(1, len(nomes) // (width * 10))
+    ciclos = []
+    for _ in range(repeticoes):
+        t = time.perf_counter()
+        for _ in range(scopes):
+            ts.enter_scope()
+            for nome in locais:
+                ts.add(nome, INTEGER, 'VAR')
+            ts.exit_scope()
+        ciclos.append((time.perf_counter() - t) / scopes * 1e9)
+    return min(tempos), min(ciclos)
+
+
+def main():
+    argp = argparse.ArgumentParser()
+    argp.add_argument('--depths', type=int, nargs='+', default=[1, 4, 16, 64],
+                      help='níveis de aninhamento a medir')
+    argp.add_argument('--width', type=int, default=10, help='variáveis declaradas em cada scope')
+    argp.add_argument('--lookups', type=int, default=100000, help='consultas por repetição')
+    argp.add_argument('-n', type=int, default=5, help='número de repetições')
+    argp.add_argument('--json', default=None, help='ficheiro onde guardar os resultados')
+    args = argp.parse_args()
+
+    resultado = {'benchmark': 'symtab', 'width': args.width, 'lookups': args.lookups, 'profundidades': {}}
+    print(f"{'prof.':>5}  {'por scopes':>12}  {'bindings':>12}  {'ganho':>6}   enter/add/exit por scope")
+    for depth in args.depths:
+        # mistura de usos: metade globais (o pior caso da implementação anterior), o resto
+        # espalhado pelos scopes abertos; grafias variadas como num programa real
+        nomes = []
+        for i in range(args.lookups):
+            nivel = 0 if i % 2 == 0 else (i // 2) % (depth + 1)
+            nome = f"V{nivel}_{i % args.width}"
+            nomes.append(nome if i % 3 else nome.lower())
+
+        antigo, ciclo_antigo = medir(TabelaPorScopes, depth, args.width, nomes, args.n)
+        atual, ciclo_atual = medir(SymbolTable, depth, args.width, nomes, args.n)
+        resultado['profundidades'][depth] = {
+            'por_scopes_ns': antigo,
+            'bindings_ns': atual,
+            'ganho': antigo / atual,
+            'scope_por_scopes_ns': ciclo_antigo,
+            'scope_bindings_ns': ciclo_atual,
+        }
+        print(f"{depth:5}  {antigo:9.0f} ns  {atual:9.0f} ns  {antigo / atual:5.2f}x   "
+              f"{ciclo_antigo:8.0f} ns -> {ciclo_atual:8.0f} ns")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Regenera as tabelas pré-construídas do lexer (lextab.py) e do parser (parsetab.py).
+Correr sempre que se alterarem as regras de pascal_analex.py ou a gramática de pascal_anasin.py:
+
+    python3 build_tables.py          # só as tabelas
+    python3 build_tables.py --debug  # também escreve parser.out (autómato LALR)
+"""
+import os
+import sys
+import ply.lex as lex
+import ply.yacc as yacc
+
+SRC = os.path.dirname(os.path.abspath(__file__))
+
+def build(debug=False):
+    import pascal_analex
+    import pascal_anasin
+
+    # lextab.py: escrito pelo ply em modo optimize, mais a assinatura das regras
+    lextab = os.path.join(SRC, 'lextab.py')
+    if os.path.exists(lextab):
+        os.remove(lextab)
+    sys.modules.pop('lextab', None)
+    lex.lex(module=pascal_analex, optimize=True, lextab='lextab', outputdir=SRC)
+    with open(lextab, 'a') as f:
+        f.write(f"_lexsignature = {pascal_analex.assinatura_lexer()!r}\n")
+
+    # parsetab.py (e parser.out se debug)
+    parsetab = os.path.join(SRC, 'parsetab.py')
+    if os.path.exists(parsetab):
+        os.remove(parsetab)
+    sys.modules.pop('parsetab', None)
+    yacc.yacc(module=pascal_anasin, debug=debug, write_tables=True, outputdir=SRC)
+
+    print(f"Tabelas escritas em {SRC}")
+
+
+if __name__ == "__main__":
+    build(debug='--debug' in sys.argv[1:])
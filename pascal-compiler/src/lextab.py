@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ARRAY', 'BEGIN', 'BOOLEAN', 'BOOL_LITERAL', 'DIV', 'DO', 'DOWNTO', 'ELSE', 'END', 'FOR', 'FUNCTION', 'ID', 'IF', 'INTEGER', 'INT_LITERAL', 'MOD', 'NOT', 'OF', 'OP_ASSIGN', 'OP_DOTDOT', 'OP_GE', 'OP_LE', 'OP_NE', 'OR', 'PROCEDURE', 'PROGRAM', 'READLN', 'STRING', 'STR_LITERAL', 'THEN', 'TO', 'VAR', 'WHILE', 'WRITELN'))
+_lexreflags   = 64
+_lexliterals  = ';:.,()[]=<>+-*'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_STR_LITERAL>'([^']|'')*')|(?P<t_INT_LITERAL>\\d+)|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_COMMENT>(\\(\\*[\\s\\S]*?\\*\\))|(\\{[\\s\\S]*?\\})|(//[^\\n]*))|(?P<t_newline>\\n+)|(?P<t_OP_DOTDOT>\\.\\.)|(?P<t_OP_ASSIGN>:=)|(?P<t_OP_GE>>=)|(?P<t_OP_LE><=)|(?P<t_OP_NE><>)", [None, ('t_STR_LITERAL', 'STR_LITERAL'), None, ('t_INT_LITERAL', 'INT_LITERAL'), ('t_ID', 'ID'), ('t_COMMENT', 'COMMENT'), None, None, None, ('t_newline', 'newline'), (None, 'OP_DOTDOT'), (None, 'OP_ASSIGN'), (None, 'OP_GE'), (None, 'OP_LE'), (None, 'OP_NE')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = 'cb061e2e18ce98a585d96f7795f8028ce166589ec04b52df2ff9c23a9894d83f'
@@ -1,22 +1,249 @@
+import io
+import os
 import sys
-from pascal_analex import lexer
-from pascal_anasin import parser, ts
-from pascal_codegen import CodeGenerator
+import json
+import argparse
+import contextlib
+from pascal_compiler import Compiler
+from pascal_cache import CompileCache
+from pascal_codegen import write_code, code_to_text
+
+# sessão de compilação de cada processo (reutilizada para todos os ficheiros desse processo)
+_compiler = None
+# configuração das sessões deste processo:
+# - cache: (diretoria, tamanho máximo) ou None se desativada
+# - options: opções de compilação (ver Compiler)
+# - stats: recolha de estatísticas (ver Compiler)
+_config = {'cache': None, 'options': {}, 'stats': None}
+
+def configurar(config):
+    """define a configuração das sessões deste processo (também serve de initializer da pool)"""
+    global _config, _compiler
+    _config = config
+    _compiler = None
+
+def obter_compiler():
+    global _compiler
+    if _compiler is None:
+        cache = CompileCache(*_config['cache']) if _config['cache'] else None
+        _compiler = Compiler(cache=cache, options=_config['options'], stats=_config.get('stats'))
+    return _compiler
+
+
+def imprimir_relatorios(compiler, destino=None):
+    """escreve os relatórios das otimizações da última compilação"""
+    for texto in compiler.reports.values():
+        print(texto, file=destino)
+
+
+def executar(code, max_steps=None):
+    """executa o código gerado (stdin/stdout do processo). Devolve o código de saída."""
+    from pascal_vm import VM, VMError
+
+    vm = VM(code_to_text(code), max_steps=max_steps)
+    try:
+        vm.run()
+    except VMError as e:
+        print(f"Erro de execução: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def expandir_entradas(caminhos):
+    """
+    Transforma a lista de caminhos (ficheiros e/ou diretorias) numa lista de pares
+    (ficheiro .pas, caminho relativo usado para o nome da saída).
+    """
+    entradas = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            for raiz, _, ficheiros in os.walk(caminho):
+                for nome in sorted(ficheiros):
+                    if nome.lower().endswith('.pas'):
+                        completo = os.path.join(raiz, nome)
+                        entradas.append((completo, os.path.relpath(completo, caminho)))
+        else:
+            entradas.append((caminho, os.path.basename(caminho)))
+    return sorted(entradas)
+
+
+def caminho_saida(entrada, relativo, dir_saida):
+    """ficheiro .vm de uma entrada: ao lado do .pas, ou dentro de dir_saida (mantendo subdiretorias)"""
+    if dir_saida is None:
+        return os.path.splitext(entrada)[0] + '.vm'
+    return os.path.join(dir_saida, os.path.splitext(relativo)[0] + '.vm')
+
+
+def escrever_stats(stats, destino):
+    """guarda as estatísticas (de um ficheiro ou de um lote) em JSON"""
+    with open(destino, 'w') as f:
+        json.dump(stats, f, indent=2)
+
+
+def compilar_ficheiro(entrada, saida, relatorio=False):
+    """
+    Compila um ficheiro e escreve o resultado em saida.
+    Devolve (entrada, saida, ok, mensagens, estatísticas) — as mensagens de erro (e os relatórios,
+    se pedidos) são capturadas para não se misturarem entre processos.
+    """
+    stats = None
+    mensagens = io.StringIO()
+    with contextlib.redirect_stdout(mensagens):
+        try:
+            compiler = obter_compiler()
+            code = compiler.compile_file(entrada)
+            ok = code is not None and compiler.errors == 0
+            if ok:
+                if os.path.dirname(saida):
+                    os.makedirs(os.path.dirname(saida), exist_ok=True)
+                write_code(code, saida)
+                if relatorio:
+                    imprimir_relatorios(compiler)
+            elif code is None:
+                print("Erro na compilação.")
+            if compiler.stats is not None:
+                stats = compiler.stats.as_dict()
+                if relatorio:
+                    print(compiler.stats.report())
+        except Exception as e:
+            print(f"Erro interno: {e}")
+            ok = False
+    return entrada, saida, ok, mensagens.getvalue(), stats
+
+
+def compilar_lote(entradas, dir_saida, jobs, relatorio=False, stats_json=None):
+    """
+    compila vários ficheiros numa pool de processos e imprime um resumo. Devolve o nº de falhas.
+    Com stats_json, as estatísticas de cada ficheiro são guardadas nesse ficheiro.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    tarefas = [(e, caminho_saida(e, r, dir_saida)) for e, r in entradas]
+    falhas = 0
+    todas_stats = {}
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=configurar,
+                             initargs=(_config,)) as pool:
+        futuros = [pool.submit(compilar_ficheiro, e, s, relatorio) for e, s in tarefas]
+        for futuro in futuros:
+            entrada, saida, ok, mensagens, stats = futuro.result()
+            if stats is not None:
+                todas_stats[entrada] = stats
+            if ok:
+                print(f"OK    {entrada} -> {saida}")
+            else:
+                falhas += 1
+                print(f"FALHA {entrada}")
+            for linha in mensagens.splitlines():
+                print(f"      {linha}")
+
+    print(f"\n{len(tarefas) - falhas} compilado(s), {falhas} falhado(s), {len(tarefas)} no total")
+    if stats_json:
+        escrever_stats(todas_stats, stats_json)
+    return falhas
+
+
+def main(argv=None):
+    argp = argparse.ArgumentParser(usage="python3 main.py <ficheiro.pas | diretoria>... [-o saida] [-j N]")
+    argp.add_argument("entradas", nargs='+', help="programas Pascal (ou diretorias com .pas) a compilar")
+    argp.add_argument("-o", dest="saida", default=None,
+                      help="com um só ficheiro: ficheiro .vm de saída (por omissão, stdout); "
+                           "com vários: diretoria de saída (por omissão, ao lado de cada .pas)")
+    argp.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                      help="número de processos em modo lote (por omissão, todos os cores)")
+    argp.add_argument("--cache-dir", default=os.environ.get("PASCAL_CACHE_DIR"),
+                      help="ativa a cache de compilação nesta diretoria (ou variável PASCAL_CACHE_DIR)")
+    argp.add_argument("--cache-size", type=int, default=64,
+                      help="tamanho máximo da cache em MB (por omissão, 64)")
+    argp.add_argument("--no-cache", action="store_true",
+                      help="ignora a cache mesmo que esteja configurada")
+    argp.add_argument("--no-constfold", action="store_true",
+                      help="desativa a dobragem e propagação de constantes")
+    argp.add_argument("--keep-unused", action="store_true",
+                      help="mantém os subprogramas que nunca são chamados")
+    argp.add_argument("--no-cfg", action="store_true",
+                      help="desativa o grafo de fluxo de controlo (encadeamento de saltos e ordem dos blocos)")
+    argp.add_argument("--no-peephole", action="store_true",
+                      help="desativa o otimizador peephole")
+    argp.add_argument("--peephole-rules", default=None,
+                      help="regras peephole a aplicar, separadas por vírgulas (por omissão, todas)")
+    argp.add_argument("--no-slot-reuse", action="store_true",
+                      help="cada variável local e temporário fica com o seu próprio slot do frame")
+    argp.add_argument("--no-tail-calls", action="store_true",
+                      help="mantém as chamadas recursivas finais como CALL (sem as trocar por saltos)")
+    argp.add_argument("--no-inline", nargs='?', const='*', default=None, metavar="NOMES",
+                      help="sem nomes, desativa a expansão inline; com nomes separados por vírgulas "
+                           "(--no-inline=F,G), só esses subprogramas deixam de ser expandidos")
+    argp.add_argument("--inline-budget", type=int, default=None,
+                      help="nº máximo de nós da AST no corpo de um subprograma expandido")
+    argp.add_argument("--lines", action="store_true",
+                      help="acrescenta ao código gerado comentários '// linha N' com a linha de cada comando")
+    argp.add_argument("--run", action="store_true",
+                      help="com um só ficheiro: executa o código gerado no executor local (pascal_vm)")
+    argp.add_argument("--max-steps", type=int, default=None,
+                      help="com --run: limite de instruções executadas")
+    argp.add_argument("--report", action="store_true",
+                      help="mostra (no stderr) o relatório das otimizações")
+    argp.add_argument("--stats", action="store_true",
+                      help="mostra (no stderr) o tempo e a memória de cada fase e os contadores da compilação")
+    argp.add_argument("--stats-json", default=None,
+                      help="guarda as estatísticas neste ficheiro JSON (em modo lote, uma entrada por ficheiro)")
+    args = argp.parse_args(argv)
+
+    options = {'constfold': not args.no_constfold, 'prune': not args.keep_unused,
+               'cfg': not args.no_cfg, 'peephole': not args.no_peephole, 'reuse_slots': not args.no_slot_reuse,
+               'tail_calls': not args.no_tail_calls}
+    if args.no_inline == '*':
+        options['inline'] = False
+    elif args.no_inline is not None:
+        options['no_inline'] = [n.strip() for n in args.no_inline.split(',') if n.strip()]
+    if args.inline_budget is not None:
+        options['inline_budget'] = args.inline_budget
+    if args.lines:
+        options['lines'] = True
+    if args.peephole_rules is not None:
+        options['peephole_rules'] = [r.strip() for r in args.peephole_rules.split(',') if r.strip()]
+
+    cache = None
+    if args.cache_dir and not args.no_cache:
+        cache = (args.cache_dir, args.cache_size * 1024 * 1024)
+    stats = 'memory' if args.stats or args.stats_json else None
+    configurar({'cache': cache, 'options': options, 'stats': stats})
+
+    # modo simples: um único ficheiro, compilado neste processo
+    if len(args.entradas) == 1 and not os.path.isdir(args.entradas[0]):
+        # analise léxica, sintática e semântica + geração de código
+        # (o ficheiro é lido por blocos, sem ficar todo em memória)
+        compiler = obter_compiler()
+        code = compiler.compile_file(args.entradas[0])
+
+        if code is not None:
+            # as instruções são escritas de uma só vez no fim
+            # (com --run só se houver -o, para não se misturarem com o output do programa)
+            if args.saida is not None or not args.run:
+                write_code(code, args.saida)
+            if args.report:
+                imprimir_relatorios(compiler, sys.stderr)
+            if args.stats:
+                print(compiler.stats.report(), file=sys.stderr)
+            if args.stats_json:
+                escrever_stats(compiler.stats.as_dict(), args.stats_json)
+            if compiler.errors:
+                return 1
+            if args.run:
+                return executar(code, args.max_steps)
+            return 0
+        print("Erro na compilação.")
+        return 1
+
+    # modo lote: vários ficheiros e/ou diretorias, um .vm por entrada
+    entradas = expandir_entradas(args.entradas)
+    if not entradas:
+        print("Nenhum ficheiro .pas encontrado.")
+        return 1
+    falhas = compilar_lote(entradas, args.saida, args.jobs, args.report or args.stats, args.stats_json)
+    return 1 if falhas else 0
+
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Uso: python3 main.py <ficheiro.pas>")
-        sys.exit(1)
-
-    with open(sys.argv[1], 'r') as f:
-        content = f.read()
-
-    #analise léxica e sintática (constroi a AST)
-    result = parser.parse(content, lexer=lexer)
-
-    if result:
-        # geração de código
-        codegen = CodeGenerator(result, ts)
-        codegen.generate()
-    else:
-        print("Erro na compilação.")
\ No newline at end of file
+    sys.exit(main())
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = "leftANDleft=OP_NEOP_LEOP_GE<>left+-left*DIVMODAND ARRAY BEGIN BOOLEAN BOOL_LITERAL DIV DO DOWNTO ELSE END FOR FUNCTION ID IF INTEGER INT_LITERAL MOD OF OP_ASSIGN OP_DOTDOT OP_GE OP_LE OP_NE PROCEDURE PROGRAM READLN STRING STR_LITERAL THEN TO VAR WHILE WRITELN\nprograma : PROGRAM ID ';' lista_definicoes bloco '.'\n\nlista_definicoes : lista_definicoes definicao\n                 | empty\n\ndefinicao : declaracoes_var\n          | subprograma\n\ndeclaracoes_var : VAR lista_declaracoes_tipo\n\nlista_declaracoes_tipo : lista_declaracoes_tipo declaracao_tipo ';'\n                       | declaracao_tipo ';'\n\ndeclaracao_tipo : lista_ids ':' tipo\n\nlista_ids : lista_ids ',' ID\n          | ID\n\ntipo : INTEGER\n     | BOOLEAN\n     | STRING\n     | ARRAY '[' INT_LITERAL OP_DOTDOT INT_LITERAL ']' OF tipo\nconfig_decl_func : FUNCTION IDconfig_decl_proc : PROCEDURE IDcabecalho_func : config_decl_func '(' parametros_opt ')' ':' tipo ';' cabecalho_proc : config_decl_proc '(' parametros_opt ')' ';' \nsubprograma : cabecalho_func lista_definicoes bloco ';'\n            | cabecalho_proc lista_definicoes bloco ';'\n\nparametros_opt : lista_parametros\n               | empty\n\nlista_parametros : lista_parametros ';' declaracao_tipo\n                 | declaracao_tipo\n\nbloco : BEGIN lista_comandos END\n\nlista_comandos : lista_comandos ';' comando\n               | comando\n\ncomando : atribuicao\n        | leitura\n        | escrita\n        | condicional\n        | ciclo_for\n        | ciclo_while\n        | bloco\n        | chamada_subprograma\n        | empty\n\natribuicao : ID OP_ASSIGN expressao\n           | ID '[' expressao ']' OP_ASSIGN expressao\n\nleitura : READLN '(' lista_expressoes_opt ')'\n\nescrita : WRITELN '(' lista_expressoes_opt ')'\n\ncondicional : IF expressao THEN comando\n            | IF expressao THEN comando ELSE comando\n\nciclo_for : FOR ID OP_ASSIGN expressao TO expressao DO comando\n          | FOR ID OP_ASSIGN expressao DOWNTO expressao DO comando\n\nciclo_while : WHILE expressao DO comando\n\nchamada_subprograma : ID '(' lista_expressoes_opt ')'\n\nexpressao : expressao '+' expressao\n          | expressao '-' expressao\n          | expressao '*' expressao\n          | expressao DIV expressao\n          | expressao MOD expressao\n          | expressao '<' expressao\n          | expressao '>' expressao\n          | expressao OP_LE expressao\n          | expressao OP_GE expressao\n          | expressao OP_NE expressao\n          | expressao '=' expressao\n          | expressao AND expressao\n\nexpressao : '(' expressao ')'\n\nexpressao : ID\n          | INT_LITERAL\n          | STR_LITERAL\n          | BOOL_LITERAL\n          | ID '[' expressao ']'\n          | ID '(' lista_expressoes_opt ')'\n\nlista_expressoes_opt : lista_expressoes\n                     | empty\n\nlista_expressoes : lista_expressoes ',' expressao\n                 | expressao\nempty :"
+_lr_signature = "leftORleftANDrightNOTleft=OP_NEOP_LEOP_GE<>left+-left*DIVMODAND ARRAY BEGIN BOOLEAN BOOL_LITERAL DIV DO DOWNTO ELSE END FOR FUNCTION ID IF INTEGER INT_LITERAL MOD NOT OF OP_ASSIGN OP_DOTDOT OP_GE OP_LE OP_NE OR PROCEDURE PROGRAM READLN STRING STR_LITERAL THEN TO VAR WHILE WRITELN\n    programa : PROGRAM ID ';' lista_definicoes bloco '.'\n    \n    lista_definicoes : lista_definicoes definicao\n                     | empty\n    \n    definicao : declaracoes_var\n              | subprograma\n    \n    declaracoes_var : VAR lista_declaracoes_tipo\n    \n    lista_declaracoes_tipo : lista_declaracoes_tipo declaracao_tipo ';'\n                           | declaracao_tipo ';'\n    \n    declaracao_tipo : lista_ids ':' tipo\n    \n    lista_ids : lista_ids ',' ID\n              | ID\n    \n    tipo : INTEGER\n         | BOOLEAN\n         | STRING\n         | ARRAY '[' INT_LITERAL OP_DOTDOT INT_LITERAL ']' OF tipo\n    config_decl_func : FUNCTION IDconfig_decl_proc : PROCEDURE IDcabecalho_func : config_decl_func '(' parametros_opt ')' ':' tipo ';' cabecalho_proc : config_decl_proc '(' parametros_opt ')' ';' \n    subprograma : cabecalho_func lista_definicoes bloco ';'\n                | cabecalho_proc lista_definicoes bloco ';'\n    \n    parametros_opt : lista_parametros\n                   | empty\n    \n    lista_parametros : lista_parametros ';' declaracao_tipo\n                     | declaracao_tipo\n    \n    bloco : BEGIN lista_comandos END\n    \n    lista_comandos : lista_comandos ';' comando\n                   | comando\n    \n    comando : atribuicao\n            | leitura\n            | escrita\n            | condicional\n            | ciclo_for\n            | ciclo_while\n            | bloco\n            | chamada_subprograma\n            | empty\n    \n    atribuicao : ID OP_ASSIGN expressao\n               | ID '[' expressao ']' OP_ASSIGN expressao\n    \n    leitura : READLN '(' lista_expressoes_opt ')'\n    \n    escrita : WRITELN '(' lista_expressoes_opt ')'\n    \n    condicional : IF expressao THEN comando\n                | IF expressao THEN comando ELSE comando\n    \n    ciclo_for : FOR ID OP_ASSIGN expressao TO expressao DO comando\n              | FOR ID OP_ASSIGN expressao DOWNTO expressao DO comando\n    \n    ciclo_while : WHILE expressao DO comando\n    \n    chamada_subprograma : ID '(' lista_expressoes_opt ')'\n    \n    expressao : expressao '+' expressao\n              | expressao '-' expressao\n              | expressao '*' expressao\n              | expressao DIV expressao\n              | expressao MOD expressao\n              | expressao '<' expressao\n              | expressao '>' expressao\n              | expressao OP_LE expressao\n              | expressao OP_GE expressao\n              | expressao OP_NE expressao\n              | expressao '=' expressao\n              | expressao AND expressao\n              | expressao OR expressao\n    \n    expressao : NOT expressao\n    \n    expressao : '(' expressao ')'\n    \n    expressao : ID\n              | INT_LITERAL\n              | STR_LITERAL\n              | BOOL_LITERAL\n              | ID '[' expressao ']'\n              | ID '(' lista_expressoes_opt ')'\n    \n    lista_expressoes_opt : lista_expressoes\n                         | empty\n    \n    lista_expressoes : lista_expressoes ',' expressao\n                     | expressao\n    empty :"
     
-_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,19,],[0,-1,]),'ID':([2,9,12,17,18,34,35,36,37,43,44,48,49,50,51,52,53,55,63,65,82,83,84,85,86,87,88,89,90,91,92,93,94,96,97,98,99,100,110,114,139,141,144,145,154,155,],[3,31,40,45,46,56,60,56,40,40,40,31,56,56,56,56,56,56,-8,106,31,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,31,-7,40,56,56,31,56,56,31,31,]),';':([3,9,20,21,22,23,24,25,26,27,28,29,30,38,47,48,56,57,58,59,62,66,67,69,71,73,74,82,99,101,102,103,104,111,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,134,137,141,142,143,147,148,149,154,155,157,158,161,],[4,-71,48,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,63,-26,-71,-61,-62,-63,-64,100,107,108,110,-25,-27,-38,-71,-71,-9,-12,-13,-14,138,-47,-40,-41,-42,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-46,-24,-71,-65,-66,153,-39,-43,-71,-71,-44,-45,-15,]),'BEGIN':([4,5,6,8,9,10,11,13,14,37,41,42,48,63,82,99,100,107,108,138,141,153,154,155,],[-71,9,-3,-2,9,-4,-5,-71,-71,-6,9,9,9,-8,9,9,-7,-20,-21,-19,9,-18,9,9,]),'VAR':([4,5,6,8,10,11,13,14,37,41,42,63,100,107,108,138,153,],[-71,12,-3,-2,-4,-5,-71,-71,-6,12,12,-8,-7,-20,-21,-19,-18,]),'FUNCTION':([4,5,6,8,10,11,13,14,37,41,42,63,100,107,108,138,153,],[-71,17,-3,-2,-4,-5,-71,-71,-6,17,17,-8,-7,-20,-21,-19,-18,]),'PROCEDURE':([4,5,6,8,10,11,13,14,37,41,42,63,100,107,108,138,153,],[-71,18,-3,-2,-4,-5,-71,-71,-6,18,18,-8,-7,-20,-21,-19,-18,]),'.':([7,47,],[19,-26,]),'READLN':([9,48,82,99,141,154,155,],[32,32,32,32,32,32,32,]),'WRITELN':([9,48,82,99,141,154,155,],[33,33,33,33,33,33,33,]),'IF':([9,48,82,99,141,154,155,],[34,34,34,34,34,34,34,]),'FOR':([9,48,82,99,141,154,155,],[35,35,35,35,35,35,35,]),'WHILE':([9,48,82,99,141,154,155,],[36,36,36,36,36,36,36,]),'END':([9,20,21,22,23,24,25,26,27,28,29,30,47,48,56,57,58,59,73,74,82,99,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,134,141,142,143,148,149,154,155,157,158,],[-71,47,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-26,-71,-61,-62,-63,-64,-27,-38,-71,-71,-47,-40,-41,-42,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-46,-71,-65,-66,-39,-43,-71,-71,-44,-45,]),'(':([15,16,31,32,33,34,36,45,46,49,50,51,52,53,55,56,83,84,85,86,87,88,89,90,91,92,93,94,96,97,98,114,139,144,145,],[43,44,51,52,53,55,55,-16,-17,55,55,55,55,55,55,97,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'ELSE':([22,23,24,25,26,27,28,29,30,47,56,57,58,59,74,82,99,113,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,134,141,142,143,148,149,154,155,157,158,],[-29,-30,-31,-32,-33,-34,-35,-36,-37,-26,-61,-62,-63,-64,-38,-71,-71,-47,-40,-41,141,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-46,-71,-65,-66,-39,-43,-71,-71,-44,-45,]),'OP_ASSIGN':([31,60,112,],[49,98,139,]),'[':([31,56,105,],[50,96,135,]),'INT_LITERAL':([34,36,49,50,51,52,53,55,83,84,85,86,87,88,89,90,91,92,93,94,96,97,98,114,135,139,144,145,152,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,146,57,57,57,156,]),'STR_LITERAL':([34,36,49,50,51,52,53,55,83,84,85,86,87,88,89,90,91,92,93,94,96,97,98,114,139,144,145,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'BOOL_LITERAL':([34,36,49,50,51,52,53,55,83,84,85,86,87,88,89,90,91,92,93,94,96,97,98,114,139,144,145,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),':':([39,40,106,109,],[64,-11,-10,136,]),',':([39,40,56,57,58,59,77,79,106,118,119,120,121,122,123,124,125,126,127,128,129,130,140,142,143,],[65,-11,-61,-62,-63,-64,114,-70,-10,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-69,-65,-66,]),')':([43,44,51,52,53,56,57,58,59,68,69,70,71,72,76,77,78,79,80,81,95,97,101,102,103,104,118,119,120,121,122,123,124,125,126,127,128,129,130,132,137,140,142,143,161,],[-71,-71,-71,-71,-71,-61,-62,-63,-64,109,-22,-23,-25,111,113,-67,-68,-70,115,116,130,-71,-9,-12,-13,-14,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,143,-24,-69,-65,-66,-15,]),'THEN':([54,56,57,58,59,118,119,120,121,122,123,124,125,126,127,128,129,130,142,143,],[82,-61,-62,-63,-64,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-65,-66,]),'+':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[83,-61,-62,-63,-64,83,83,83,83,83,-48,-49,-50,-51,-52,83,83,83,83,83,83,83,-60,83,83,83,-65,-66,83,83,83,]),'-':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[84,-61,-62,-63,-64,84,84,84,84,84,-48,-49,-50,-51,-52,84,84,84,84,84,84,84,-60,84,84,84,-65,-66,84,84,84,]),'*':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[85,-61,-62,-63,-64,85,85,85,85,85,85,85,-50,-51,-52,85,85,85,85,85,85,85,-60,85,85,85,-65,-66,85,85,85,]),'DIV':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[86,-61,-62,-63,-64,86,86,86,86,86,86,86,-50,-51,-52,86,86,86,86,86,86,86,-60,86,86,86,-65,-66,86,86,86,]),'MOD':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[87,-61,-62,-63,-64,87,87,87,87,87,87,87,-50,-51,-52,87,87,87,87,87,87,87,-60,87,87,87,-65,-66,87,87,87,]),'<':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[88,-61,-62,-63,-64,88,88,88,88,88,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,88,-60,88,88,88,-65,-66,88,88,88,]),'>':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[89,-61,-62,-63,-64,89,89,89,89,89,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,89,-60,89,89,89,-65,-66,89,89,89,]),'OP_LE':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[90,-61,-62,-63,-64,90,90,90,90,90,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,90,-60,90,90,90,-65,-66,90,90,90,]),'OP_GE':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[91,-61,-62,-63,-64,91,91,91,91,91,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,91,-60,91,91,91,-65,-66,91,91,91,]),'OP_NE':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[92,-61,-62,-63,-64,92,92,92,92,92,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,92,-60,92,92,92,-65,-66,92,92,92,]),'=':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[93,-61,-62,-63,-64,93,93,93,93,93,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,93,-60,93,93,93,-65,-66,93,93,93,]),'AND':([54,56,57,58,59,61,74,75,79,95,118,119,120,121,122,123,124,125,126,127,128,129,130,131,133,140,142,143,148,150,151,],[94,-61,-62,-63,-64,94,94,94,94,94,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,94,94,94,-65,-66,94,94,94,]),'DO':([56,57,58,59,61,118,119,120,121,122,123,124,125,126,127,128,129,130,142,143,150,151,],[-61,-62,-63,-64,99,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-65,-66,154,155,]),']':([56,57,58,59,75,118,119,120,121,122,123,124,125,126,127,128,129,130,131,142,143,156,],[-61,-62,-63,-64,112,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,142,-65,-66,159,]),'TO':([56,57,58,59,118,119,120,121,122,123,124,125,126,127,128,129,130,133,142,143,],[-61,-62,-63,-64,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,144,-65,-66,]),'DOWNTO':([56,57,58,59,118,119,120,121,122,123,124,125,126,127,128,129,130,133,142,143,],[-61,-62,-63,-64,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,145,-65,-66,]),'INTEGER':([64,136,160,],[102,102,102,]),'BOOLEAN':([64,136,160,],[103,103,103,]),'STRING':([64,136,160,],[104,104,104,]),'ARRAY':([64,136,160,],[105,105,105,]),'OP_DOTDOT':([146,],[152,]),'OF':([159,],[160,]),}
+_lr_action_items = {'PROGRAM':([0,],[2,]),'$end':([1,19,],[0,-1,]),'ID':([2,9,12,17,18,34,35,36,37,43,44,48,49,50,51,52,53,55,56,64,66,83,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,102,103,113,117,143,145,148,149,158,159,],[3,31,40,45,46,57,61,57,40,40,40,31,57,57,57,57,57,57,57,-8,109,31,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,31,-7,40,57,57,31,57,57,31,31,]),';':([3,9,20,21,22,23,24,25,26,27,28,29,30,38,47,48,57,58,59,60,63,67,68,70,72,74,75,83,97,102,104,105,106,107,114,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,138,141,145,146,147,151,152,153,158,159,161,162,165,],[4,-73,48,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,64,-26,-73,-63,-64,-65,-66,103,110,111,113,-25,-27,-38,-73,-61,-73,-9,-12,-13,-14,142,-47,-40,-41,-42,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,-46,-24,-73,-67,-68,157,-39,-43,-73,-73,-44,-45,-15,]),'BEGIN':([4,5,6,8,9,10,11,13,14,37,41,42,48,64,83,102,103,110,111,142,145,157,158,159,],[-73,9,-3,-2,9,-4,-5,-73,-73,-6,9,9,9,-8,9,9,-7,-20,-21,-19,9,-18,9,9,]),'VAR':([4,5,6,8,10,11,13,14,37,41,42,64,103,110,111,142,157,],[-73,12,-3,-2,-4,-5,-73,-73,-6,12,12,-8,-7,-20,-21,-19,-18,]),'FUNCTION':([4,5,6,8,10,11,13,14,37,41,42,64,103,110,111,142,157,],[-73,17,-3,-2,-4,-5,-73,-73,-6,17,17,-8,-7,-20,-21,-19,-18,]),'PROCEDURE':([4,5,6,8,10,11,13,14,37,41,42,64,103,110,111,142,157,],[-73,18,-3,-2,-4,-5,-73,-73,-6,18,18,-8,-7,-20,-21,-19,-18,]),'.':([7,47,],[19,-26,]),'READLN':([9,48,83,102,145,158,159,],[32,32,32,32,32,32,32,]),'WRITELN':([9,48,83,102,145,158,159,],[33,33,33,33,33,33,33,]),'IF':([9,48,83,102,145,158,159,],[34,34,34,34,34,34,34,]),'FOR':([9,48,83,102,145,158,159,],[35,35,35,35,35,35,35,]),'WHILE':([9,48,83,102,145,158,159,],[36,36,36,36,36,36,36,]),'END':([9,20,21,22,23,24,25,26,27,28,29,30,47,48,57,58,59,60,74,75,83,97,102,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,138,145,146,147,152,153,158,159,161,162,],[-73,47,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-26,-73,-63,-64,-65,-66,-27,-38,-73,-61,-73,-47,-40,-41,-42,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,-46,-73,-67,-68,-39,-43,-73,-73,-44,-45,]),'(':([15,16,31,32,33,34,36,45,46,49,50,51,52,53,55,56,57,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,117,143,148,149,],[43,44,51,52,53,56,56,-16,-17,56,56,56,56,56,56,56,100,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'ELSE':([22,23,24,25,26,27,28,29,30,47,57,58,59,60,75,83,97,102,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,138,145,146,147,152,153,158,159,161,162,],[-29,-30,-31,-32,-33,-34,-35,-36,-37,-26,-63,-64,-65,-66,-38,-73,-61,-73,-47,-40,-41,145,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,-46,-73,-67,-68,-39,-43,-73,-73,-44,-45,]),'OP_ASSIGN':([31,61,115,],[49,101,143,]),'[':([31,57,108,],[50,99,139,]),'NOT':([34,36,49,50,51,52,53,55,56,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,117,143,148,149,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'INT_LITERAL':([34,36,49,50,51,52,53,55,56,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,117,139,143,148,149,156,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,150,58,58,58,160,]),'STR_LITERAL':([34,36,49,50,51,52,53,55,56,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,117,143,148,149,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'BOOL_LITERAL':([34,36,49,50,51,52,53,55,56,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,117,143,148,149,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),':':([39,40,109,112,],[65,-11,-10,140,]),',':([39,40,57,58,59,60,78,80,97,109,121,122,123,124,125,126,127,128,129,130,131,132,133,134,144,146,147,],[66,-11,-63,-64,-65,-66,117,-72,-61,-10,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,-71,-67,-68,]),')':([43,44,51,52,53,57,58,59,60,69,70,71,72,73,77,78,79,80,81,82,97,98,100,104,105,106,107,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,141,144,146,147,165,],[-73,-73,-73,-73,-73,-63,-64,-65,-66,112,-22,-23,-25,114,116,-69,-70,-72,118,119,-61,134,-73,-9,-12,-13,-14,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,147,-24,-71,-67,-68,-15,]),'THEN':([54,57,58,59,60,97,121,122,123,124,125,126,127,128,129,130,131,132,133,134,146,147,],[83,-63,-64,-65,-66,-61,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,-67,-68,]),'+':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[84,-63,-64,-65,-66,84,84,84,84,84,84,-48,-49,-50,-51,-52,84,84,84,84,84,84,84,84,-62,84,84,84,-67,-68,84,84,84,]),'-':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[85,-63,-64,-65,-66,85,85,85,85,85,85,-48,-49,-50,-51,-52,85,85,85,85,85,85,85,85,-62,85,85,85,-67,-68,85,85,85,]),'*':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[86,-63,-64,-65,-66,86,86,86,86,86,86,86,86,-50,-51,-52,86,86,86,86,86,86,86,86,-62,86,86,86,-67,-68,86,86,86,]),'DIV':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[87,-63,-64,-65,-66,87,87,87,87,87,87,87,87,-50,-51,-52,87,87,87,87,87,87,87,87,-62,87,87,87,-67,-68,87,87,87,]),'MOD':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[88,-63,-64,-65,-66,88,88,88,88,88,88,88,88,-50,-51,-52,88,88,88,88,88,88,88,88,-62,88,88,88,-67,-68,88,88,88,]),'<':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[89,-63,-64,-65,-66,89,89,89,89,89,89,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,89,89,-62,89,89,89,-67,-68,89,89,89,]),'>':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[90,-63,-64,-65,-66,90,90,90,90,90,90,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,90,90,-62,90,90,90,-67,-68,90,90,90,]),'OP_LE':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[91,-63,-64,-65,-66,91,91,91,91,91,91,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,91,91,-62,91,91,91,-67,-68,91,91,91,]),'OP_GE':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[92,-63,-64,-65,-66,92,92,92,92,92,92,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,92,92,-62,92,92,92,-67,-68,92,92,92,]),'OP_NE':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[93,-63,-64,-65,-66,93,93,93,93,93,93,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,93,93,-62,93,93,93,-67,-68,93,93,93,]),'=':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[94,-63,-64,-65,-66,94,94,94,94,94,94,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,94,94,-62,94,94,94,-67,-68,94,94,94,]),'AND':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[95,-63,-64,-65,-66,95,95,95,95,-61,95,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,95,-62,95,95,95,-67,-68,95,95,95,]),'OR':([54,57,58,59,60,62,75,76,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,137,144,146,147,152,154,155,],[96,-63,-64,-65,-66,96,96,96,96,-61,96,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,96,96,96,-67,-68,96,96,96,]),'DO':([57,58,59,60,62,97,121,122,123,124,125,126,127,128,129,130,131,132,133,134,146,147,154,155,],[-63,-64,-65,-66,102,-61,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,-67,-68,158,159,]),']':([57,58,59,60,76,97,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,146,147,160,],[-63,-64,-65,-66,115,-61,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,146,-67,-68,163,]),'TO':([57,58,59,60,97,121,122,123,124,125,126,127,128,129,130,131,132,133,134,137,146,147,],[-63,-64,-65,-66,-61,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,148,-67,-68,]),'DOWNTO':([57,58,59,60,97,121,122,123,124,125,126,127,128,129,130,131,132,133,134,137,146,147,],[-63,-64,-65,-66,-61,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-62,149,-67,-68,]),'INTEGER':([65,140,164,],[105,105,105,]),'BOOLEAN':([65,140,164,],[106,106,106,]),'STRING':([65,140,164,],[107,107,107,]),'ARRAY':([65,140,164,],[108,108,108,]),'OP_DOTDOT':([150,],[156,]),'OF':([163,],[164,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'programa':([0,],[1,]),'lista_definicoes':([4,13,14,],[5,41,42,]),'empty':([4,9,13,14,43,44,48,51,52,53,82,97,99,141,154,155,],[6,30,6,6,70,70,30,78,78,78,30,78,30,30,30,30,]),'bloco':([5,9,41,42,48,82,99,141,154,155,],[7,28,66,67,28,28,28,28,28,28,]),'definicao':([5,41,42,],[8,8,8,]),'declaracoes_var':([5,41,42,],[10,10,10,]),'subprograma':([5,41,42,],[11,11,11,]),'cabecalho_func':([5,41,42,],[13,13,13,]),'cabecalho_proc':([5,41,42,],[14,14,14,]),'config_decl_func':([5,41,42,],[15,15,15,]),'config_decl_proc':([5,41,42,],[16,16,16,]),'lista_comandos':([9,],[20,]),'comando':([9,48,82,99,141,154,155,],[21,73,117,134,149,157,158,]),'atribuicao':([9,48,82,99,141,154,155,],[22,22,22,22,22,22,22,]),'leitura':([9,48,82,99,141,154,155,],[23,23,23,23,23,23,23,]),'escrita':([9,48,82,99,141,154,155,],[24,24,24,24,24,24,24,]),'condicional':([9,48,82,99,141,154,155,],[25,25,25,25,25,25,25,]),'ciclo_for':([9,48,82,99,141,154,155,],[26,26,26,26,26,26,26,]),'ciclo_while':([9,48,82,99,141,154,155,],[27,27,27,27,27,27,27,]),'chamada_subprograma':([9,48,82,99,141,154,155,],[29,29,29,29,29,29,29,]),'lista_declaracoes_tipo':([12,],[37,]),'declaracao_tipo':([12,37,43,44,110,],[38,62,71,71,137,]),'lista_ids':([12,37,43,44,110,],[39,39,39,39,39,]),'expressao':([34,36,49,50,51,52,53,55,83,84,85,86,87,88,89,90,91,92,93,94,96,97,98,114,139,144,145,],[54,61,74,75,79,79,79,95,118,119,120,121,122,123,124,125,126,127,128,129,131,79,133,140,148,150,151,]),'parametros_opt':([43,44,],[68,72,]),'lista_parametros':([43,44,],[69,69,]),'lista_expressoes_opt':([51,52,53,97,],[76,80,81,132,]),'lista_expressoes':([51,52,53,97,],[77,77,77,77,]),'tipo':([64,136,160,],[101,147,161,]),}
+_lr_goto_items = {'programa':([0,],[1,]),'lista_definicoes':([4,13,14,],[5,41,42,]),'empty':([4,9,13,14,43,44,48,51,52,53,83,100,102,145,158,159,],[6,30,6,6,71,71,30,79,79,79,30,79,30,30,30,30,]),'bloco':([5,9,41,42,48,83,102,145,158,159,],[7,28,67,68,28,28,28,28,28,28,]),'definicao':([5,41,42,],[8,8,8,]),'declaracoes_var':([5,41,42,],[10,10,10,]),'subprograma':([5,41,42,],[11,11,11,]),'cabecalho_func':([5,41,42,],[13,13,13,]),'cabecalho_proc':([5,41,42,],[14,14,14,]),'config_decl_func':([5,41,42,],[15,15,15,]),'config_decl_proc':([5,41,42,],[16,16,16,]),'lista_comandos':([9,],[20,]),'comando':([9,48,83,102,145,158,159,],[21,74,120,138,153,161,162,]),'atribuicao':([9,48,83,102,145,158,159,],[22,22,22,22,22,22,22,]),'leitura':([9,48,83,102,145,158,159,],[23,23,23,23,23,23,23,]),'escrita':([9,48,83,102,145,158,159,],[24,24,24,24,24,24,24,]),'condicional':([9,48,83,102,145,158,159,],[25,25,25,25,25,25,25,]),'ciclo_for':([9,48,83,102,145,158,159,],[26,26,26,26,26,26,26,]),'ciclo_while':([9,48,83,102,145,158,159,],[27,27,27,27,27,27,27,]),'chamada_subprograma':([9,48,83,102,145,158,159,],[29,29,29,29,29,29,29,]),'lista_declaracoes_tipo':([12,],[37,]),'declaracao_tipo':([12,37,43,44,113,],[38,63,72,72,141,]),'lista_ids':([12,37,43,44,113,],[39,39,39,39,39,]),'expressao':([34,36,49,50,51,52,53,55,56,84,85,86,87,88,89,90,91,92,93,94,95,96,99,100,101,117,143,148,149,],[54,62,75,76,80,80,80,97,98,121,122,123,124,125,126,127,128,129,130,131,132,133,135,80,137,144,152,154,155,]),'parametros_opt':([43,44,],[69,73,]),'lista_parametros':([43,44,],[70,70,]),'lista_expressoes_opt':([51,52,53,100,],[77,81,82,136,]),'lista_expressoes':([51,52,53,100,],[78,78,78,78,]),'tipo':([65,140,164,],[104,151,165,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,75 +27,77 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> programa","S'",1,None,None,None),
-  ('programa -> PROGRAM ID ; lista_definicoes bloco .','programa',6,'p_programa','pascal_anasin.py',25),
-  ('lista_definicoes -> lista_definicoes definicao','lista_definicoes',2,'p_lista_definicoes','pascal_anasin.py',32),
-  ('lista_definicoes -> empty','lista_definicoes',1,'p_lista_definicoes','pascal_anasin.py',33),
-  ('definicao -> declaracoes_var','definicao',1,'p_definicao','pascal_anasin.py',42),
-  ('definicao -> subprograma','definicao',1,'p_definicao','pascal_anasin.py',43),
-  ('declaracoes_var -> VAR lista_declaracoes_tipo','declaracoes_var',2,'p_declaracoes_var','pascal_anasin.py',52),
-  ('lista_declaracoes_tipo -> lista_declaracoes_tipo declaracao_tipo ;','lista_declaracoes_tipo',3,'p_lista_declaracoes_tipo','pascal_anasin.py',58),
-  ('lista_declaracoes_tipo -> declaracao_tipo ;','lista_declaracoes_tipo',2,'p_lista_declaracoes_tipo','pascal_anasin.py',59),
-  ('declaracao_tipo -> lista_ids : tipo','declaracao_tipo',3,'p_declaracao_tipo','pascal_anasin.py',68),
-  ('lista_ids -> lista_ids , ID','lista_ids',3,'p_lista_ids','pascal_anasin.py',79),
-  ('lista_ids -> ID','lista_ids',1,'p_lista_ids','pascal_anasin.py',80),
-  ('tipo -> INTEGER','tipo',1,'p_tipo','pascal_anasin.py',92),
-  ('tipo -> BOOLEAN','tipo',1,'p_tipo','pascal_anasin.py',93),
-  ('tipo -> STRING','tipo',1,'p_tipo','pascal_anasin.py',94),
-  ('tipo -> ARRAY [ INT_LITERAL OP_DOTDOT INT_LITERAL ] OF tipo','tipo',8,'p_tipo','pascal_anasin.py',95),
-  ('config_decl_func -> FUNCTION ID','config_decl_func',2,'p_config_decl_func','pascal_anasin.py',105),
-  ('config_decl_proc -> PROCEDURE ID','config_decl_proc',2,'p_config_decl_proc','pascal_anasin.py',112),
-  ('cabecalho_func -> config_decl_func ( parametros_opt ) : tipo ;','cabecalho_func',7,'p_cabecalho_func','pascal_anasin.py',118),
-  ('cabecalho_proc -> config_decl_proc ( parametros_opt ) ;','cabecalho_proc',5,'p_cabecalho_proc','pascal_anasin.py',124),
-  ('subprograma -> cabecalho_func lista_definicoes bloco ;','subprograma',4,'p_subprograma','pascal_anasin.py',129),
-  ('subprograma -> cabecalho_proc lista_definicoes bloco ;','subprograma',4,'p_subprograma','pascal_anasin.py',130),
-  ('parametros_opt -> lista_parametros','parametros_opt',1,'p_parametros_opt','pascal_anasin.py',144),
-  ('parametros_opt -> empty','parametros_opt',1,'p_parametros_opt','pascal_anasin.py',145),
-  ('lista_parametros -> lista_parametros ; declaracao_tipo','lista_parametros',3,'p_lista_parametros','pascal_anasin.py',151),
-  ('lista_parametros -> declaracao_tipo','lista_parametros',1,'p_lista_parametros','pascal_anasin.py',152),
-  ('bloco -> BEGIN lista_comandos END','bloco',3,'p_bloco','pascal_anasin.py',164),
-  ('lista_comandos -> lista_comandos ; comando','lista_comandos',3,'p_lista_comandos','pascal_anasin.py',170),
-  ('lista_comandos -> comando','lista_comandos',1,'p_lista_comandos','pascal_anasin.py',171),
-  ('comando -> atribuicao','comando',1,'p_comando','pascal_anasin.py',183),
-  ('comando -> leitura','comando',1,'p_comando','pascal_anasin.py',184),
-  ('comando -> escrita','comando',1,'p_comando','pascal_anasin.py',185),
-  ('comando -> condicional','comando',1,'p_comando','pascal_anasin.py',186),
-  ('comando -> ciclo_for','comando',1,'p_comando','pascal_anasin.py',187),
-  ('comando -> ciclo_while','comando',1,'p_comando','pascal_anasin.py',188),
-  ('comando -> bloco','comando',1,'p_comando','pascal_anasin.py',189),
-  ('comando -> chamada_subprograma','comando',1,'p_comando','pascal_anasin.py',190),
-  ('comando -> empty','comando',1,'p_comando','pascal_anasin.py',191),
-  ('atribuicao -> ID OP_ASSIGN expressao','atribuicao',3,'p_atribuicao','pascal_anasin.py',200),
-  ('atribuicao -> ID [ expressao ] OP_ASSIGN expressao','atribuicao',6,'p_atribuicao','pascal_anasin.py',201),
-  ('leitura -> READLN ( lista_expressoes_opt )','leitura',4,'p_leitura','pascal_anasin.py',226),
-  ('escrita -> WRITELN ( lista_expressoes_opt )','escrita',4,'p_escrita','pascal_anasin.py',232),
-  ('condicional -> IF expressao THEN comando','condicional',4,'p_condicional','pascal_anasin.py',239),
-  ('condicional -> IF expressao THEN comando ELSE comando','condicional',6,'p_condicional','pascal_anasin.py',240),
-  ('ciclo_for -> FOR ID OP_ASSIGN expressao TO expressao DO comando','ciclo_for',8,'p_ciclo_for','pascal_anasin.py',249),
-  ('ciclo_for -> FOR ID OP_ASSIGN expressao DOWNTO expressao DO comando','ciclo_for',8,'p_ciclo_for','pascal_anasin.py',250),
-  ('ciclo_while -> WHILE expressao DO comando','ciclo_while',4,'p_ciclo_while','pascal_anasin.py',256),
-  ('chamada_subprograma -> ID ( lista_expressoes_opt )','chamada_subprograma',4,'p_chamada_subprograma','pascal_anasin.py',262),
-  ('expressao -> expressao + expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',271),
-  ('expressao -> expressao - expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',272),
-  ('expressao -> expressao * expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',273),
-  ('expressao -> expressao DIV expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',274),
-  ('expressao -> expressao MOD expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',275),
-  ('expressao -> expressao < expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',276),
-  ('expressao -> expressao > expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',277),
-  ('expressao -> expressao OP_LE expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',278),
-  ('expressao -> expressao OP_GE expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',279),
-  ('expressao -> expressao OP_NE expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',280),
-  ('expressao -> expressao = expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',281),
-  ('expressao -> expressao AND expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',282),
-  ('expressao -> ( expressao )','expressao',3,'p_expressao_grupo','pascal_anasin.py',315),
-  ('expressao -> ID','expressao',1,'p_expressao_valor','pascal_anasin.py',321),
-  ('expressao -> INT_LITERAL','expressao',1,'p_expressao_valor','pascal_anasin.py',322),
-  ('expressao -> STR_LITERAL','expressao',1,'p_expressao_valor','pascal_anasin.py',323),
-  ('expressao -> BOOL_LITERAL','expressao',1,'p_expressao_valor','pascal_anasin.py',324),
-  ('expressao -> ID [ expressao ]','expressao',4,'p_expressao_valor','pascal_anasin.py',325),
-  ('expressao -> ID ( lista_expressoes_opt )','expressao',4,'p_expressao_valor','pascal_anasin.py',326),
-  ('lista_expressoes_opt -> lista_expressoes','lista_expressoes_opt',1,'p_lista_expressoes_opt','pascal_anasin.py',370),
-  ('lista_expressoes_opt -> empty','lista_expressoes_opt',1,'p_lista_expressoes_opt','pascal_anasin.py',371),
-  ('lista_expressoes -> lista_expressoes , expressao','lista_expressoes',3,'p_lista_expressoes','pascal_anasin.py',377),
-  ('lista_expressoes -> expressao','lista_expressoes',1,'p_lista_expressoes','pascal_anasin.py',378),
-  ('empty -> <empty>','empty',0,'p_empty','pascal_anasin.py',389),
+  ('programa -> PROGRAM ID ; lista_definicoes bloco .','programa',6,'p_programa','pascal_anasin.py',36),
+  ('lista_definicoes -> lista_definicoes definicao','lista_definicoes',2,'p_lista_definicoes','pascal_anasin.py',43),
+  ('lista_definicoes -> empty','lista_definicoes',1,'p_lista_definicoes','pascal_anasin.py',44),
+  ('definicao -> declaracoes_var','definicao',1,'p_definicao','pascal_anasin.py',53),
+  ('definicao -> subprograma','definicao',1,'p_definicao','pascal_anasin.py',54),
+  ('declaracoes_var -> VAR lista_declaracoes_tipo','declaracoes_var',2,'p_declaracoes_var','pascal_anasin.py',61),
+  ('lista_declaracoes_tipo -> lista_declaracoes_tipo declaracao_tipo ;','lista_declaracoes_tipo',3,'p_lista_declaracoes_tipo','pascal_anasin.py',67),
+  ('lista_declaracoes_tipo -> declaracao_tipo ;','lista_declaracoes_tipo',2,'p_lista_declaracoes_tipo','pascal_anasin.py',68),
+  ('declaracao_tipo -> lista_ids : tipo','declaracao_tipo',3,'p_declaracao_tipo','pascal_anasin.py',77),
+  ('lista_ids -> lista_ids , ID','lista_ids',3,'p_lista_ids','pascal_anasin.py',88),
+  ('lista_ids -> ID','lista_ids',1,'p_lista_ids','pascal_anasin.py',89),
+  ('tipo -> INTEGER','tipo',1,'p_tipo','pascal_anasin.py',99),
+  ('tipo -> BOOLEAN','tipo',1,'p_tipo','pascal_anasin.py',100),
+  ('tipo -> STRING','tipo',1,'p_tipo','pascal_anasin.py',101),
+  ('tipo -> ARRAY [ INT_LITERAL OP_DOTDOT INT_LITERAL ] OF tipo','tipo',8,'p_tipo','pascal_anasin.py',102),
+  ('config_decl_func -> FUNCTION ID','config_decl_func',2,'p_config_decl_func','pascal_anasin.py',112),
+  ('config_decl_proc -> PROCEDURE ID','config_decl_proc',2,'p_config_decl_proc','pascal_anasin.py',120),
+  ('cabecalho_func -> config_decl_func ( parametros_opt ) : tipo ;','cabecalho_func',7,'p_cabecalho_func','pascal_anasin.py',126),
+  ('cabecalho_proc -> config_decl_proc ( parametros_opt ) ;','cabecalho_proc',5,'p_cabecalho_proc','pascal_anasin.py',132),
+  ('subprograma -> cabecalho_func lista_definicoes bloco ;','subprograma',4,'p_subprograma','pascal_anasin.py',137),
+  ('subprograma -> cabecalho_proc lista_definicoes bloco ;','subprograma',4,'p_subprograma','pascal_anasin.py',138),
+  ('parametros_opt -> lista_parametros','parametros_opt',1,'p_parametros_opt','pascal_anasin.py',152),
+  ('parametros_opt -> empty','parametros_opt',1,'p_parametros_opt','pascal_anasin.py',153),
+  ('lista_parametros -> lista_parametros ; declaracao_tipo','lista_parametros',3,'p_lista_parametros','pascal_anasin.py',159),
+  ('lista_parametros -> declaracao_tipo','lista_parametros',1,'p_lista_parametros','pascal_anasin.py',160),
+  ('bloco -> BEGIN lista_comandos END','bloco',3,'p_bloco','pascal_anasin.py',170),
+  ('lista_comandos -> lista_comandos ; comando','lista_comandos',3,'p_lista_comandos','pascal_anasin.py',176),
+  ('lista_comandos -> comando','lista_comandos',1,'p_lista_comandos','pascal_anasin.py',177),
+  ('comando -> atribuicao','comando',1,'p_comando','pascal_anasin.py',189),
+  ('comando -> leitura','comando',1,'p_comando','pascal_anasin.py',190),
+  ('comando -> escrita','comando',1,'p_comando','pascal_anasin.py',191),
+  ('comando -> condicional','comando',1,'p_comando','pascal_anasin.py',192),
+  ('comando -> ciclo_for','comando',1,'p_comando','pascal_anasin.py',193),
+  ('comando -> ciclo_while','comando',1,'p_comando','pascal_anasin.py',194),
+  ('comando -> bloco','comando',1,'p_comando','pascal_anasin.py',195),
+  ('comando -> chamada_subprograma','comando',1,'p_comando','pascal_anasin.py',196),
+  ('comando -> empty','comando',1,'p_comando','pascal_anasin.py',197),
+  ('atribuicao -> ID OP_ASSIGN expressao','atribuicao',3,'p_atribuicao','pascal_anasin.py',204),
+  ('atribuicao -> ID [ expressao ] OP_ASSIGN expressao','atribuicao',6,'p_atribuicao','pascal_anasin.py',205),
+  ('leitura -> READLN ( lista_expressoes_opt )','leitura',4,'p_leitura','pascal_anasin.py',230),
+  ('escrita -> WRITELN ( lista_expressoes_opt )','escrita',4,'p_escrita','pascal_anasin.py',236),
+  ('condicional -> IF expressao THEN comando','condicional',4,'p_condicional','pascal_anasin.py',243),
+  ('condicional -> IF expressao THEN comando ELSE comando','condicional',6,'p_condicional','pascal_anasin.py',244),
+  ('ciclo_for -> FOR ID OP_ASSIGN expressao TO expressao DO comando','ciclo_for',8,'p_ciclo_for','pascal_anasin.py',253),
+  ('ciclo_for -> FOR ID OP_ASSIGN expressao DOWNTO expressao DO comando','ciclo_for',8,'p_ciclo_for','pascal_anasin.py',254),
+  ('ciclo_while -> WHILE expressao DO comando','ciclo_while',4,'p_ciclo_while','pascal_anasin.py',260),
+  ('chamada_subprograma -> ID ( lista_expressoes_opt )','chamada_subprograma',4,'p_chamada_subprograma','pascal_anasin.py',266),
+  ('expressao -> expressao + expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',273),
+  ('expressao -> expressao - expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',274),
+  ('expressao -> expressao * expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',275),
+  ('expressao -> expressao DIV expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',276),
+  ('expressao -> expressao MOD expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',277),
+  ('expressao -> expressao < expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',278),
+  ('expressao -> expressao > expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',279),
+  ('expressao -> expressao OP_LE expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',280),
+  ('expressao -> expressao OP_GE expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',281),
+  ('expressao -> expressao OP_NE expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',282),
+  ('expressao -> expressao = expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',283),
+  ('expressao -> expressao AND expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',284),
+  ('expressao -> expressao OR expressao','expressao',3,'p_expressao_binaria','pascal_anasin.py',285),
+  ('expressao -> NOT expressao','expressao',2,'p_expressao_not','pascal_anasin.py',318),
+  ('expressao -> ( expressao )','expressao',3,'p_expressao_grupo','pascal_anasin.py',329),
+  ('expressao -> ID','expressao',1,'p_expressao_valor','pascal_anasin.py',335),
+  ('expressao -> INT_LITERAL','expressao',1,'p_expressao_valor','pascal_anasin.py',336),
+  ('expressao -> STR_LITERAL','expressao',1,'p_expressao_valor','pascal_anasin.py',337),
+  ('expressao -> BOOL_LITERAL','expressao',1,'p_expressao_valor','pascal_anasin.py',338),
+  ('expressao -> ID [ expressao ]','expressao',4,'p_expressao_valor','pascal_anasin.py',339),
+  ('expressao -> ID ( lista_expressoes_opt )','expressao',4,'p_expressao_valor','pascal_anasin.py',340),
+  ('lista_expressoes_opt -> lista_expressoes','lista_expressoes_opt',1,'p_lista_expressoes_opt','pascal_anasin.py',384),
+  ('lista_expressoes_opt -> empty','lista_expressoes_opt',1,'p_lista_expressoes_opt','pascal_anasin.py',385),
+  ('lista_expressoes -> lista_expressoes , expressao','lista_expressoes',3,'p_lista_expressoes','pascal_anasin.py',391),
+  ('lista_expressoes -> expressao','lista_expressoes',1,'p_lista_expressoes','pascal_anasin.py',392),
+  ('empty -> <empty>','empty',0,'p_empty','pascal_anasin.py',401),
 ]
@@ -1,6 +1,17 @@
 import ply.lex as lex
+import codecs
+import hashlib
+import io
+import mmap
+import os
+import re
 import sys
 
+# modo de desenvolvimento (PASCAL_DEBUG=1): valida as regras e reconstrói as tabelas a cada arranque.
+# em produção, carregam-se as tabelas pré-geradas (lextab.py / parsetab.py, ver build_tables.py),
+# sem escrever nada na diretoria src.
+DEBUG = os.environ.get('PASCAL_DEBUG') == '1'
+
 #palavras reservadas
 reserved_map = {
     'program': 'PROGRAM', 
@@ -19,6 +30,8 @@ reserved_map = {
     'div': 'DIV', 
     'mod': 'MOD', 
     'and': 'AND', 
+    'or': 'OR',
+    'not': 'NOT',
     'array': 'ARRAY', 
     'of': 'OF', 
     'function': 'FUNCTION', 
@@ -88,22 +101,153 @@ def t_error(t):
     t.lexer.skip(1) 
 
 
-lexer = lex.lex()
+def assinatura_lexer():
+    """
+    hash das regras do lexer (tokens, literais e expressões regulares).
+    é guardada em lextab.py para detetar tabelas desatualizadas.
+    """
+    g = globals()
+    regras = sorted(k for k in g if k.startswith('t_'))
+    partes = [repr(sorted(tokens)), repr(literals)]
+    for nome in regras:
+        regra = g[nome]
+        partes.append(nome + '=' + ((regra.__doc__ or '') if callable(regra) else regra))
+    return hashlib.sha256('\n'.join(partes).encode()).hexdigest()
+
+def tabela_lexer_valida():
+    """verifica se lextab.py existe e corresponde às regras atuais"""
+    try:
+        import lextab
+    except ImportError:
+        return False
+    return getattr(lextab, '_lexsignature', None) == assinatura_lexer()
+
+
+if not DEBUG and tabela_lexer_valida():
+    # tabela pré-gerada e atualizada: dispensa a validação das regras
+    lexer = lex.lex(optimize=True, lextab='lextab')
+else:
+    # constrói em memória (sem optimize o ply não escreve lextab.py)
+    lexer = lex.lex()
+
+
+#leitura por blocos (ficheiros muito grandes não são carregados inteiros)
+BLOCO = 1 << 20 # 1 MB de texto por bloco
+
+def blocos_ficheiro(caminho, tamanho=BLOCO):
+    """
+    lê um ficheiro UTF-8 por blocos de texto através de um mmap.
+    \r\n e \r passam a \n (como no open em modo texto), mesmo quando ficam entre dois blocos.
+    """
+    with open(caminho, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), True)
+            for inicio in range(0, len(mm), tamanho):
+                texto = decoder.decode(mm[inicio:inicio + tamanho])
+                if texto:
+                    yield texto
+            resto = decoder.decode(b'', final=True)
+            if resto:
+                yield resto
+
+def blocos_stream(f, tamanho=BLOCO):
+    """lê um ficheiro de texto já aberto (ex.: stdin) por blocos"""
+    while True:
+        texto = f.read(tamanho)
+        if not texto:
+            return
+        yield texto
+
+
+# esqueleto do texto: strings e comentários inteiros, o resto em pedaços sem \n.
+# Não apanha strings/comentários por fechar (nem '(' antes de '*'), que ficam para o próximo bloco.
+_ESQUELETO = re.compile(r"'(?:[^']|'')*'|\{[^}]*\}|\(\*[\s\S]*?\*\)|//[^\n]*"
+                        r"|[^'{(/\n]+|\n|\((?!\*)|/(?!/)")
+
+def corte_seguro(texto):
+    """
+    posição logo a seguir ao último \n que não está dentro de uma string ou comentário
+    (0 se não houver): até aí o texto pode ser analisado sem depender do bloco seguinte.
+    """
+    match = _ESQUELETO.match
+    pos = 0
+    corte = 0
+    fim = len(texto)
+    while pos < fim:
+        m = match(texto, pos)
+        if m is None:
+            break
+        pos = m.end()
+        if texto[pos - 1] == '\n' and m.end() - m.start() == 1:
+            corte = pos
+    return corte
+
+
+class TokenStream:
+    def __init__(self, lexer, blocos):
+        """
+        Tokens de um texto que chega por blocos, produzidos à medida que o parser os pede.
+        Cada bloco é cortado numa fronteira segura (ver corte_seguro) e o resto espera pelo
+        bloco seguinte; o lexer continua a contar as linhas de um segmento para o outro.
+        Só o segmento atual e os seus tokens estão em memória.
+        :param blocos: iterável de blocos de texto (ver blocos_ficheiro e blocos_stream)
+        """
+        self.lexer = lexer
+        self.blocos = iter(blocos)
+        self.pendente = ''
+        self.fim = False
+        self.ativo = False
+
+    def token(self):
+        """próximo token, ou None no fim (serve de tokenfunc para parser.parse)"""
+        while True:
+            if self.ativo:
+                tok = self.lexer.token()
+                if tok is not None:
+                    return tok
+                self.ativo = False
+            if not self.proximo_segmento():
+                return None
+
+    def proximo_segmento(self):
+        while not self.fim:
+            bloco = next(self.blocos, None)
+            if bloco is None:
+                self.fim = True
+                break
+            self.pendente += bloco
+            corte = corte_seguro(self.pendente)
+            if corte:
+                segmento = self.pendente[:corte]
+                self.pendente = self.pendente[corte:]
+                self.lexer.input(segmento)
+                self.ativo = True
+                return True
+
+        # no fim vai o que sobrou (inclui strings/comentários por fechar, que dão erro léxico)
+        if not self.pendente:
+            return False
+        self.lexer.input(self.pendente)
+        self.pendente = ''
+        self.ativo = True
+        return True
+
+    def __iter__(self):
+        return iter(self.token, None)
 
 
 if __name__ == "__main__":
     
     
-    input_code = sys.stdin.read()
-    lexer.input(input_code)
+    lexer.lineno = 1
+    tokens_stdin = TokenStream(lexer, blocos_stream(sys.stdin))
 
     print("{:<15} {:<20} {:<10}".format("TIPO DO TOKEN", "VALOR (LEXEMA)", "LINHA"))
     print("-" * 45)
 
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
+    for tok in tokens_stdin:
         print("{:<15} {:<20} {:<10}".format(tok.type, tok.value, tok.lineno))
 
 
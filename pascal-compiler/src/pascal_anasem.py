@@ -1,42 +1,93 @@
+import sys
+from pascal_ast import ArrayType, INTEGER, VOID
+
+
+def array_layout(type_info):
+    """
+    disposição em memória de um array: ArrayType(inicio, fim, tipo_elemento)
+    - low: limite inferior declarado (o elemento low fica no deslocamento 0 do bloco na heap)
+    - length: nº de elementos
+    - elem_size: nº de slots por elemento
+    """
+    low = type_info.low
+    high = type_info.high
+    return {'low': low, 'high': high, 'length': high - low + 1, 'elem_size': 1}
+
+
+# funções que são builtin no pascal: (nome, tipo, categoria)
+BUILTINS = (
+    #length dá return a um int
+    ('length', INTEGER, 'FUNCTION'),
+    #inputs sem return (não são exatamente funções, daí procedure)
+    ('writeln', VOID, 'PROCEDURE'),
+    ('readln', VOID, 'PROCEDURE'),
+    ('write', VOID, 'PROCEDURE'),
+    ('read', VOID, 'PROCEDURE'),
+)
+
+
 class SymbolTable:
     def __init__(self):
         """
         Inicializa a tabela de símbolos.
-        - scope_stack é uma stack de funçãoes (scopes)
-        - o indice 0 correspode ao proprio programa / scope global
+        - bindings guarda, para cada nome (minúsculas), a stack das suas declarações visíveis,
+          a mais interna no topo (cada símbolo guarda o nível do seu scope em 'level')
+        - undo_stack tem um registo por scope aberto com os nomes lá declarados
+          (exit_scope retira-os das stacks de bindings); o nível 0 é o scope global
         - offset_stack armazena contadores de endereços
+        - errors conta os erros reportados durante a análise
+        - lookups conta as consultas (estatísticas)
+        lookup, add e update_type custam O(1), seja qual for a profundidade de aninhamento.
         """
-        self.scope_stack = [{}]
+        self.bindings = {}
+        self.keys = {} # identificador como escrito -> nome em minúsculas (internado)
+        self.undo_stack = [[]]
         self.offset_stack = [0]
+        self.errors = 0
+        self.lookups = 0
         self._init_builtins()
 
     def _init_builtins(self):
         """
         carrega funções que são builtin no pascal
         """
-        #length dá return a um int
-        self.add('length', ('TYPE', 'INTEGER'), 'FUNCTION')
-        
-        #inputs sem return (não são exatamente funções, daí procedure)
-        self.add('writeln', ('TYPE', 'VOID'), 'PROCEDURE')
-        self.add('readln', ('TYPE', 'VOID'), 'PROCEDURE')
-        self.add('write', ('TYPE', 'VOID'), 'PROCEDURE')
-        self.add('read', ('TYPE', 'VOID'), 'PROCEDURE')
+        for name, type_info, category in BUILTINS:
+            self.add(name, type_info, category)
+
+    def error(self, message):
+        """
+        reporta um erro (léxico/sintático/semântico) e conta-o
+        """
+        self.errors += 1
+        print(message)
+
+    def key(self, name):
+        """
+        nome em minúsculas (Pascal não diferencia maiúsculas e minúsculas);
+        cada grafia só é convertida uma vez
+        """
+        key = self.keys.get(name)
+        if key is None:
+            key = self.keys[name] = sys.intern(name.lower())
+        return key
 
     def enter_scope(self):
         """
-        adiciona um dicionário que representa um scope\n
+        abre um scope novo (registo de nomes vazio)\n
         adiciona também um novo contador de endereços a 0.
         """
-        self.scope_stack.append({})
+        self.undo_stack.append([])
         self.offset_stack.append(0)
 
     def exit_scope(self):
         """
-        remove o scope e respectivo counter do topo da stack
+        fecha o scope do topo: desfaz as declarações lá feitas e remove o respectivo counter
         """
-        if len(self.scope_stack) > 1:
-            self.scope_stack.pop()
+        if len(self.undo_stack) > 1:
+            # as stacks que ficam vazias mantêm-se (o nome volta a ser declarado noutro subprograma)
+            bindings = self.bindings
+            for name in self.undo_stack.pop():
+                bindings[name].pop()
             self.offset_stack.pop()
         else:
             print("Erro: Tentativa de fechar o próprio programa!")
@@ -45,11 +96,9 @@ class SymbolTable:
         """
         guarda um identificador (variável ou função) no scope atual e dá um endereço.
         """
-        current_scope = self.scope_stack[-1]
-        name = name.lower() # Pascal não diferencia maiúsculas e minúsculas
-        
-        if name in current_scope:
-            print(f"Aviso: O nome '{name}' já está a ser usado neste scope.")
+        key = self.keys.get(name)
+        name = key if key is not None else self.key(name)
+        level = len(self.undo_stack) - 1
         
         current_offset = self.offset_stack[-1]
 
@@ -57,31 +106,44 @@ class SymbolTable:
             self.offset_stack[-1] += 1
 
         # grava os dados (tipo e categoria)
-        current_scope[name] = {
+        symbol = {
             'type': type_info, 
             'category': category,
-            'offset': current_offset
+            'offset': current_offset,
+            'level': level
             }
 
+        # arrays: o slot guarda o pointer (base) para o bloco na heap
+        if category == 'VAR' and isinstance(type_info, ArrayType):
+            symbol['layout'] = array_layout(type_info)
+
+        stack = self.bindings.get(name)
+        if stack is None:
+            stack = self.bindings[name] = []
+        if stack and stack[-1]['level'] == level:
+            print(f"Aviso: O nome '{name}' já está a ser usado neste scope.")
+            # substitui a declaração anterior do mesmo scope (o registo de undo já tem o nome)
+            stack[-1] = symbol
+        else:
+            stack.append(symbol)
+            self.undo_stack[-1].append(name)
+
     def lookup(self, name, line=0):
         """
-        Procura um identificador em todos os scopes abertos.
+        Procura um identificador (a declaração visível mais interna).
+        (só para a análise semântica: o gerador usa os símbolos ligados aos nós pelo Resolver)
         """
-        name_lower = name.lower()
-        
-        # percorre a stack ao contrário (do mais recente para o mais antigo)
-        for i, scope in enumerate(reversed(self.scope_stack)):
-            if name_lower in scope:
-                symbol = scope[name_lower]
-                # se i == len - 1, estamos no scope global
-                is_global = (i == len(self.scope_stack) - 1)
-                # flag para saber se é global ou local
-                symbol['scope'] = 'GLOBAL' if is_global else 'LOCAL'
-                return symbol
+        self.lookups += 1
+        key = self.keys.get(name)
+        if key is None:
+            key = self.key(name)
+        stack = self.bindings.get(key)
+        if stack:
+            return stack[-1]
         
         # se não encontrou em lado nenhum, mostra erro
         if line > 0:
-            print(f"Erro Semântico: '{name}' não foi declarado (linha {line})")
+            self.error(f"Erro Semântico: '{name}' não foi declarado (linha {line})")
         
         return None
 
@@ -90,9 +152,14 @@ class SymbolTable:
         Atualiza o tipo no scope principal.
         Usado para definir o tipo de retorno da função atual.
         """
-        name = name.lower()
         # precisa ter pelo menos 2 scopes (global + função atual)
-        if len(self.scope_stack) >= 2:
-            parent_scope = self.scope_stack[-2]
-            if name in parent_scope:
-                parent_scope[name]['type'] = new_type
\ No newline at end of file
+        parent = len(self.undo_stack) - 2
+        stack = self.bindings.get(self.key(name))
+        if parent < 0 or not stack:
+            return
+        # a declaração do scope pai está no topo ou logo abaixo (tapada por um parâmetro com o mesmo nome)
+        for symbol in reversed(stack):
+            if symbol['level'] == parent:
+                symbol['type'] = new_type
+            if symbol['level'] <= parent:
+                return
@@ -1,15 +1,30 @@
 import ply.yacc as yacc
-from pascal_analex import tokens, literals, lexer
+from pascal_analex import tokens, literals, lexer, DEBUG
 from pascal_anasem import SymbolTable
+from pascal_ast import (Type, ArrayType, INTEGER, BOOLEAN, STRING, UNKNOWN, ERROR,
+                        Program, Function, Procedure, VarBlock, Decl, Block, Assign, ArrayAssign,
+                        Readln, Writeln, If, While, For, CallStmt, CallExp, BinOp, UnOp, Id, ArrayAccess,
+                        Int, String, Bool)
 import sys
-import pprint
 
 # inicializar a análise semântica
+# (tabela global, usada quando o lexer não traz uma tabela própria de uma sessão Compiler)
 ts = SymbolTable()
 
+def obter_ts(p):
+    """
+    devolve a tabela de símbolos do parse atual.
+    cada sessão (ver pascal_compiler.Compiler) anexa a sua tabela ao clone do lexer que usa.
+    """
+    return getattr(p.lexer, 'ts', ts)
+
+
 # precedência (ordem) dos operadores
+# (os operadores lógicos ficam abaixo das relações: i <= n and not fim não precisa de parênteses)
 precedence = (
+    ('left', 'OR'),
     ('left', 'AND'),
+    ('right', 'NOT'),
     ('left', '=', 'OP_NE', 'OP_LE', 'OP_GE', '<', '>'),
     ('left', '+', '-'),
     ('left', '*', 'DIV', 'MOD'),
@@ -21,7 +36,7 @@ def p_programa(p):
     programa : PROGRAM ID ';' lista_definicoes bloco '.'
     '''
     # organiza a AST com o nome do programa, a lista de definições e o bloco principal
-    p[0] = ('PROGRAM', p[2], p[4], p[5])
+    p[0] = Program(p[2], p[4], p[5])
 
 def p_lista_definicoes(p):
     '''
@@ -45,7 +60,7 @@ def p_declaracoes_var(p):
     '''
     declaracoes_var : VAR lista_declaracoes_tipo
     '''
-    p[0] = ('VAR_BLOCK', p[2])
+    p[0] = VarBlock(p[2])
 
 def p_lista_declaracoes_tipo(p):
     '''
@@ -63,9 +78,9 @@ def p_declaracao_tipo(p):
     '''
     # registar variáveis na tabela de símbolos
     for nome_var in p[1]:
-        ts.add(nome_var, p[3], 'VAR')
+        obter_ts(p).add(nome_var, p[3], 'VAR')
     
-    p[0] = ('DECL', p[1], p[3])
+    p[0] = Decl(p[1], p[3])
 
 
 def p_lista_ids(p):
@@ -87,30 +102,30 @@ def p_tipo(p):
          | ARRAY '[' INT_LITERAL OP_DOTDOT INT_LITERAL ']' OF tipo
     '''
     if p.slice[1].type == 'ARRAY':
-        p[0] = ('ARRAY_TYPE', p[3], p[5], p[8])
+        p[0] = ArrayType(p[3], p[5], p[8])
     else:
-        # normalizar nome do tipo para MAIÚSCULAS
-        p[0] = ('TYPE', p[1].upper())
+        # normalizar nome do tipo para MAIÚSCULAS (tipos internados: um objeto por tipo)
+        p[0] = Type(p[1].upper())
 
 # regras auxiliares para gerir scopes
 def p_config_decl_func(p):
     '''config_decl_func : FUNCTION ID'''
     # declarar função no scope externo (tipo de retorno desconhecido ainda)
-    ts.add(p[2], ('TYPE', 'UNKNOWN'), 'FUNCTION')
+    obter_ts(p).add(p[2], UNKNOWN, 'FUNCTION')
     p[0] = p[2]
-    ts.enter_scope()
+    obter_ts(p).enter_scope()
 
 #igual mas para procedimentos em vez de funções
 def p_config_decl_proc(p):
     '''config_decl_proc : PROCEDURE ID'''
-    ts.add(p[2], ('TYPE', 'UNKNOWN'), 'PROCEDURE')
+    obter_ts(p).add(p[2], UNKNOWN, 'PROCEDURE')
     p[0] = p[2]
-    ts.enter_scope()
+    obter_ts(p).enter_scope()
 
 def p_cabecalho_func(p):
     '''cabecalho_func : config_decl_func '(' parametros_opt ')' ':' tipo ';' '''
     # atualizar tipo de retorno no scope externo
-    ts.update_type(p[1], p[6])
+    obter_ts(p).update_type(p[1], p[6])
     p[0] = (p[1], p[3], p[6]) # nome, params, tipo_retorno
 
 def p_cabecalho_proc(p):
@@ -122,14 +137,14 @@ def p_subprograma(p):
     subprograma : cabecalho_func lista_definicoes bloco ';'
                 | cabecalho_proc lista_definicoes bloco ';'
     '''
-    ts.exit_scope()
+    obter_ts(p).exit_scope()
 
     if p.slice[1].type == 'cabecalho_func':
         nome, params, tipo_retorno = p[1]
-        p[0] = ('FUNCTION', nome, params, tipo_retorno, p[2], p[3])
+        p[0] = Function(nome, params, tipo_retorno, p[2], p[3])
     else:
         nome, params = p[1]
-        p[0] = ('PROCEDURE', nome, params, p[2], p[3])
+        p[0] = Procedure(nome, params, p[2], p[3])
 
 
 def p_parametros_opt(p):
@@ -154,7 +169,7 @@ def p_bloco(p):
     '''
     bloco : BEGIN lista_comandos END
     '''
-    p[0] = ('BLOCK', p[2])
+    p[0] = Block(p[2])
 
 def p_lista_comandos(p):
     '''
@@ -195,32 +210,35 @@ def p_atribuicao(p):
         nodo_expr = p[3]
         
         # verificar existência
-        sym = ts.lookup(nome_var, p.lineno(1))
+        sym = obter_ts(p).lookup(nome_var, p.lineno(1))
         
         if sym:
             tipo_var = sym['type']
-            tipo_expr = nodo_expr[-1] # extrair tipo da expressão (que é o último elemento do tuple)
+            tipo_expr = nodo_expr.type # tipo da expressão
         
-            if tipo_var != tipo_expr:
-                print(f"ERRO SEMÂNTICO: Atribuição incompatível na linha {p.lineno(2)}. Esperado {tipo_var}, encontrado {tipo_expr}")
+            if tipo_var is not tipo_expr:
+                obter_ts(p).error(f"ERRO SEMÂNTICO: Atribuição incompatível na linha {p.lineno(2)}. Esperado {tipo_var}, encontrado {tipo_expr}")
             
-        p[0] = ('ASSIGN', p[1], p[3])
+        p[0] = Assign(p[1], p[3])
     else:
         # atribuição de Array
-        p[0] = ('ARRAY_ASSIGN', p[1], p[3], p[6])
+        p[0] = ArrayAssign(p[1], p[3], p[6])
+    p[0].line = p.lineno(1)
 
 
 def p_leitura(p):
     '''
     leitura : READLN '(' lista_expressoes_opt ')'
     '''
-    p[0] = ('READLN', p[3])
+    p[0] = Readln(p[3])
+    p[0].line = p.lineno(1)
 
 def p_escrita(p):
     '''
     escrita : WRITELN '(' lista_expressoes_opt ')'
     '''
-    p[0] = ('WRITELN', p[3])
+    p[0] = Writeln(p[3])
+    p[0].line = p.lineno(1)
 
 
 def p_condicional(p):
@@ -229,28 +247,32 @@ def p_condicional(p):
                 | IF expressao THEN comando ELSE comando
     '''
     if len(p) == 5:
-        p[0] = ('IF', p[2], p[4], None)
+        p[0] = If(p[2], p[4], None)
     else:
-        p[0] = ('IF', p[2], p[4], p[6])
+        p[0] = If(p[2], p[4], p[6])
+    p[0].line = p.lineno(1)
 
 def p_ciclo_for(p):
     '''
     ciclo_for : FOR ID OP_ASSIGN expressao TO expressao DO comando
               | FOR ID OP_ASSIGN expressao DOWNTO expressao DO comando
     '''
-    p[0] = ('FOR', p[2], p[4], p[6], p[8], p[5])
+    p[0] = For(p[2], p[4], p[6], p[8], p[5])
+    p[0].line = p.lineno(1)
 
 def p_ciclo_while(p):
     '''
     ciclo_while : WHILE expressao DO comando
     '''
-    p[0] = ('WHILE', p[2], p[4])
+    p[0] = While(p[2], p[4])
+    p[0].line = p.lineno(1)
 
 def p_chamada_subprograma(p):
     '''
     chamada_subprograma : ID '(' lista_expressoes_opt ')'
     '''
-    p[0] = ('CALL_STMT', p[1], p[3])
+    p[0] = CallStmt(p[1], p[3])
+    p[0].line = p.lineno(1)
 
 #expressões
 def p_expressao_binaria(p):
@@ -267,34 +289,46 @@ def p_expressao_binaria(p):
               | expressao OP_NE expressao
               | expressao '=' expressao
               | expressao AND expressao
+              | expressao OR expressao
     '''
     op = p[2].upper() #normalizar operadores para maiúsculas
     esq = p[1]
     dir = p[3]
     
-    tipo1 = esq[-1]
-    tipo2 = dir[-1]
+    tipo1 = esq.type
+    tipo2 = dir.type
     
     tipo_resultado = None
     
     # aritmética
     if op in ['+', '-', '*', 'DIV', 'MOD']:
-        if tipo1 == ('TYPE', 'INTEGER') and tipo2 == ('TYPE', 'INTEGER'):
-            tipo_resultado = ('TYPE', 'INTEGER')
+        if tipo1 is INTEGER and tipo2 is INTEGER:
+            tipo_resultado = INTEGER
         else:
-            print(f"ERRO SEMÂNTICO: Operação aritmética '{op}' requer INTEGERS. Encontrado {tipo1} e {tipo2} na linha {p.lineno(2)}")
-            tipo_resultado = ('TYPE', 'ERROR')
+            obter_ts(p).error(f"ERRO SEMÂNTICO: Operação aritmética '{op}' requer INTEGERS. Encontrado {tipo1} e {tipo2} na linha {p.lineno(2)}")
+            tipo_resultado = ERROR
             
     # relações e boleanos
-    elif op in ['<', '>', '<=', '>=', '<>', '=', 'AND']:
+    elif op in ['<', '>', '<=', '>=', '<>', '=', 'AND', 'OR']:
          # Verificação simplificada: tipos devem ser iguais
-         if tipo1 == tipo2:
-             tipo_resultado = ('TYPE', 'BOOLEAN')
+         if tipo1 is tipo2:
+             tipo_resultado = BOOLEAN
          else:
-             print(f"ERRO SEMÂNTICO: Operação '{op}' tipos incompatíveis {tipo1}, {tipo2} na linha {p.lineno(2)}")
-             tipo_resultado = ('TYPE', 'ERROR')
+             obter_ts(p).error(f"ERRO SEMÂNTICO: Operação '{op}' tipos incompatíveis {tipo1}, {tipo2} na linha {p.lineno(2)}")
+             tipo_resultado = ERROR
              
-    p[0] = ('BINOP', op, esq, dir, tipo_resultado)
+    p[0] = BinOp(op, esq, dir, tipo_resultado)
+
+
+def p_expressao_not(p):
+    '''
+    expressao : NOT expressao
+    '''
+    tipo = p[2].type
+    if tipo is not BOOLEAN:
+        obter_ts(p).error(f"ERRO SEMÂNTICO: Operação 'NOT' requer BOOLEAN. Encontrado {tipo} na linha {p.lineno(1)}")
+        tipo = ERROR
+    p[0] = UnOp('NOT', p[2], tipo)
 
 
 def p_expressao_grupo(p):
@@ -315,42 +349,42 @@ def p_expressao_valor(p):
     if len(p) == 2:
         if p.slice[1].type == 'ID':
             # consultar ID
-            sym = ts.lookup(p[1], p.lineno(1))
+            sym = obter_ts(p).lookup(p[1], p.lineno(1))
 
             if sym:
-                p[0] = ('ID', p[1], sym['type'])
+                p[0] = Id(p[1], sym['type'])
             else:
-                p[0] = ('ID', p[1], ('TYPE', 'ERROR'))
+                p[0] = Id(p[1], ERROR)
 
         elif p.slice[1].type == 'INT_LITERAL':
-            p[0] = ('INT', p[1], ('TYPE', 'INTEGER'))
+            p[0] = Int(p[1])
         elif p.slice[1].type == 'STR_LITERAL':
-            p[0] = ('STRING', p[1], ('TYPE', 'STRING'))
+            p[0] = String(p[1])
         elif p.slice[1].type == 'BOOL_LITERAL':
-            p[0] = ('BOOL', p[1], ('TYPE', 'BOOLEAN'))
+            p[0] = Bool(p[1])
     
     elif p[2] == '[':
-        sym = ts.lookup(p[1], p.lineno(1))
-        tipo_elemento = ('TYPE', 'UNKNOWN')
+        sym = obter_ts(p).lookup(p[1], p.lineno(1))
+        tipo_elemento = UNKNOWN
         
         if sym:
             tipo_sym = sym['type']
-            if tipo_sym[0] == 'ARRAY_TYPE':
-                tipo_elemento = tipo_sym[3]
-            elif tipo_sym == ('TYPE', 'STRING'):
-                tipo_elemento = ('TYPE', 'STRING')
+            if isinstance(tipo_sym, ArrayType):
+                tipo_elemento = tipo_sym.elem
+            elif tipo_sym is STRING:
+                tipo_elemento = STRING
 
-        p[0] = ('ARRAY_ACCESS', p[1], p[3], tipo_elemento)
+        p[0] = ArrayAccess(p[1], p[3], tipo_elemento)
     
     else:
 
-        sym = ts.lookup(p[1], p.lineno(1))
-        tipo_ret = ('TYPE', 'ERROR')
+        sym = obter_ts(p).lookup(p[1], p.lineno(1))
+        tipo_ret = ERROR
         
         if sym:
             tipo_ret = sym['type']
         
-        p[0] = ('CALL_EXP', p[1], p[3], tipo_ret)
+        p[0] = CallExp(p[1], p[3], tipo_ret)
 
 def p_lista_expressoes_opt(p):
     '''
@@ -376,14 +410,21 @@ def p_empty(p):
 
 def p_error(p):
     if p:
-        print(f"ERRO SINTÁTICO: Token inesperado '{p.value}' na linha {p.lineno}")
+        obter_ts(p).error(f"ERRO SINTÁTICO: Token inesperado '{p.value}' na linha {p.lineno}")
     else:
         print("ERRO SINTÁTICO: Fim de ficheiro inesperado")
 
 #execução
-parser = yacc.yacc()
+if DEBUG:
+    # desenvolvimento: regenera parsetab.py e escreve parser.out com o autómato
+    parser = yacc.yacc()
+else:
+    # produção: usa parsetab.py se a assinatura da gramática coincidir;
+    # caso contrário constrói as tabelas em memória, sem escrever ficheiros
+    parser = yacc.yacc(debug=False, write_tables=False)
 
 if __name__ == "__main__":
+    import pprint
     input_code = sys.stdin.read()
     if input_code.strip():
         result = parser.parse(input_code, lexer=lexer)
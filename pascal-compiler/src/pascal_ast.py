@@ -0,0 +1,264 @@
+"""
+Nós da AST e tipos.
+- cada classe de nó usa __slots__ (sem __dict__ por nó); kind é o nome usado no despacho
+  dos visitors (visit_ASSIGN, ...)
+- os tipos são internados: todas as expressões INTEGER partilham o mesmo objeto Type,
+  e dois arrays com os mesmos limites e elementos partilham o mesmo ArrayType
+- anotações (sym, syms, frame) são slots fora de fields: ficam a None até o Resolver
+  (pascal_resolve) as preencher, e não entram na comparação nem em as_tuple
+- os comandos têm também a anotação line (linha do programa, preenchida pelo parser),
+  que passa para as instruções geradas (pascal_ir.Instr)
+"""
+
+
+#tipos
+class Type:
+    __slots__ = ('name',)
+    _interned = {}
+
+    def __new__(cls, name):
+        t = cls._interned.get(name)
+        if t is None:
+            t = object.__new__(cls)
+            t.name = name
+            cls._interned[name] = t
+        return t
+
+    def __repr__(self):
+        return self.name
+
+    def __reduce__(self):
+        return (Type, (self.name,))
+
+
+class ArrayType:
+    __slots__ = ('low', 'high', 'elem')
+    _interned = {}
+
+    def __new__(cls, low, high, elem):
+        key = (int(low), int(high), elem)
+        t = cls._interned.get(key)
+        if t is None:
+            t = object.__new__(cls)
+            t.low, t.high, t.elem = key
+            cls._interned[key] = t
+        return t
+
+    def __repr__(self):
+        return f"array[{self.low}..{self.high}] of {self.elem!r}"
+
+    def __reduce__(self):
+        return (ArrayType, (self.low, self.high, self.elem))
+
+
+INTEGER = Type('INTEGER')
+BOOLEAN = Type('BOOLEAN')
+STRING = Type('STRING')
+VOID = Type('VOID')
+UNKNOWN = Type('UNKNOWN')
+ERROR = Type('ERROR')
+
+
+#nós
+class Node:
+    __slots__ = ()
+    kind = None
+    # campos pela ordem dos antigos tuples (kind, campo1, campo2, ...)
+    fields = ()
+    # campos que podem ter nós filhos ou listas de nós (os restantes são nomes, tipos e anotações)
+    links = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+        # anotações ainda não preenchidas
+        for name in self.__slots__[len(values):]:
+            setattr(self, name, None)
+
+    def values(self):
+        return tuple(getattr(self, name) for name in self.fields)
+
+    def children(self):
+        """nós e listas de nós filhos (os tipos e os nomes ficam de fora)"""
+        for name in self.links:
+            value = getattr(self, name)
+            if value is not None:
+                yield value
+
+    def replace(self, **changes):
+        """
+        cópia do nó com alguns campos trocados
+        (as passagens sobre a AST não alteram nós; só o Resolver preenche as anotações)
+        """
+        node = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(node, name, changes[name] if name in changes else getattr(self, name))
+        return node
+
+    def as_tuple(self):
+        """representação antiga em tuples (usada na comparação de memória)"""
+        def convert(value):
+            if isinstance(value, Node):
+                return value.as_tuple()
+            if isinstance(value, list):
+                return [convert(v) for v in value]
+            return value
+        return (self.kind,) + tuple(convert(v) for v in self.values())
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.values() == other.values()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(repr(v) for v in self.values())})"
+
+
+# frame: disposição do frame do corpo (pascal_resolve.Frame)
+class Program(Node):
+    __slots__ = ('name', 'defs', 'body', 'frame')
+    fields = ('name', 'defs', 'body')
+    kind = 'PROGRAM'
+    links = ('defs', 'body')
+
+class Function(Node):
+    __slots__ = ('name', 'params', 'rettype', 'defs', 'body', 'frame')
+    fields = ('name', 'params', 'rettype', 'defs', 'body')
+    kind = 'FUNCTION'
+    links = ('params', 'defs', 'body')
+
+class Procedure(Node):
+    __slots__ = ('name', 'params', 'defs', 'body', 'frame')
+    fields = ('name', 'params', 'defs', 'body')
+    kind = 'PROCEDURE'
+    links = ('params', 'defs', 'body')
+
+class VarBlock(Node):
+    __slots__ = fields = ('decls',)
+    kind = 'VAR_BLOCK'
+    links = ('decls',)
+
+# syms: símbolos dos nomes declarados (pela mesma ordem)
+class Decl(Node):
+    __slots__ = ('names', 'type', 'syms')
+    fields = ('names', 'type')
+    kind = 'DECL'
+    links = ()
+
+# variáveis escondidas criadas pelas passagens sobre a AST (não aparecem no programa Pascal)
+class TempBlock(Node):
+    __slots__ = fields = ('decls',)
+    kind = 'TEMP_BLOCK'
+    links = ('decls',)
+
+class Block(Node):
+    __slots__ = fields = ('cmds',)
+    kind = 'BLOCK'
+    links = ('cmds',)
+
+# sym: símbolo resolvido do identificador (pascal_resolve.Symbol); line: linha do comando
+class Assign(Node):
+    __slots__ = ('name', 'expr', 'sym', 'line')
+    fields = ('name', 'expr')
+    kind = 'ASSIGN'
+    links = ('expr',)
+
+class ArrayAssign(Node):
+    __slots__ = ('name', 'index', 'value', 'sym', 'line')
+    fields = ('name', 'index', 'value')
+    kind = 'ARRAY_ASSIGN'
+    links = ('index', 'value')
+
+class Readln(Node):
+    __slots__ = ('args', 'line')
+    fields = ('args',)
+    kind = 'READLN'
+    links = ('args',)
+
+class Writeln(Node):
+    __slots__ = ('args', 'line')
+    fields = ('args',)
+    kind = 'WRITELN'
+    links = ('args',)
+
+class If(Node):
+    __slots__ = ('cond', 'then', 'other', 'line')
+    fields = ('cond', 'then', 'other')
+    kind = 'IF'
+    links = ('cond', 'then', 'other')
+
+class While(Node):
+    __slots__ = ('cond', 'body', 'line')
+    fields = ('cond', 'body')
+    kind = 'WHILE'
+    links = ('cond', 'body')
+
+class For(Node):
+    __slots__ = ('var', 'start', 'end', 'body', 'direction', 'sym', 'line')
+    fields = ('var', 'start', 'end', 'body', 'direction')
+    kind = 'FOR'
+    links = ('start', 'end', 'body')
+
+class CallStmt(Node):
+    __slots__ = ('name', 'args', 'sym', 'line')
+    fields = ('name', 'args')
+    kind = 'CALL_STMT'
+    links = ('args',)
+
+
+# expressões: todas têm o atributo type
+class CallExp(Node):
+    __slots__ = ('name', 'args', 'type', 'sym')
+    fields = ('name', 'args', 'type')
+    kind = 'CALL_EXP'
+    links = ('args',)
+
+# função expandida no local da chamada (pascal_inline): executa cmds e vale result
+class InlineExp(Node):
+    __slots__ = fields = ('name', 'cmds', 'result', 'type')
+    kind = 'INLINE_EXP'
+    links = ('cmds', 'result')
+
+class BinOp(Node):
+    __slots__ = fields = ('op', 'left', 'right', 'type')
+    kind = 'BINOP'
+    links = ('left', 'right')
+
+class UnOp(Node):
+    __slots__ = fields = ('op', 'expr', 'type')
+    kind = 'UNOP'
+    links = ('expr',)
+
+class Id(Node):
+    __slots__ = ('name', 'type', 'sym')
+    fields = ('name', 'type')
+    kind = 'ID'
+    links = ()
+
+class ArrayAccess(Node):
+    __slots__ = ('name', 'index', 'type', 'sym')
+    fields = ('name', 'index', 'type')
+    kind = 'ARRAY_ACCESS'
+    links = ('index',)
+
+# nos literais o tipo é fixo: fica na classe e não ocupa espaço em cada nó
+class Int(Node):
+    __slots__ = ('value',)
+    fields = ('value', 'type')
+    kind = 'INT'
+    links = ()
+    type = INTEGER
+
+class String(Node):
+    __slots__ = ('value',)
+    fields = ('value', 'type')
+    kind = 'STRING'
+    links = ()
+    type = STRING
+
+class Bool(Node):
+    __slots__ = ('value',)
+    fields = ('value', 'type')
+    kind = 'BOOL'
+    links = ()
+    type = BOOLEAN
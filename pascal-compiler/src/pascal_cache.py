@@ -0,0 +1,97 @@
+import os
+import hashlib
+import tempfile
+
+
+class CompileCache:
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024):
+        """
+        Cache em disco do código EWVM gerado, endereçada pelo conteúdo.
+        - cada entrada é um ficheiro <hash>.vm dentro de directory
+        - a data de modificação do ficheiro marca o último uso (para o LRU)
+        - max_bytes limita o tamanho total; as entradas menos usadas são removidas primeiro
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(source, version, options=None):
+        """
+        hash do código fonte + versão do compilador + opções de compilação.
+        source pode ser o texto ou um iterável de blocos de texto (mesma chave que o texto inteiro).
+        """
+        h = hashlib.sha256()
+        h.update(version.encode())
+        h.update(b'\0')
+        h.update(repr(sorted((options or {}).items())).encode())
+        h.update(b'\0')
+        if isinstance(source, str):
+            source = (source,)
+        for block in source:
+            h.update(block.encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.vm')
+
+    def get(self, key):
+        """devolve a lista de instruções guardada, ou None se não existir"""
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                text = f.read()
+            os.utime(path) # marca como usada recentemente
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return text.splitlines()
+
+    def put(self, key, code):
+        """guarda uma lista de instruções (escrita atómica, segura entre processos)"""
+        text = "\n".join(code) + "\n" if code else ""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self.evict()
+
+    def evict(self):
+        """remove as entradas menos usadas até o tamanho total caber em max_bytes"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.vm'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue # removida por outro processo
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """apaga todas as entradas"""
+        for name in os.listdir(self.directory):
+            if name.endswith('.vm'):
+                os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,86 @@
+"""
+Grafo de chamadas do programa inteiro (a partir dos nós CALL_EXP/CALL_STMT)
+e eliminação dos subprogramas que nunca são chamados a partir do bloco principal.
+"""
+from pascal_ast import Node
+
+
+def subprogram_parts(node):
+    """(nome, definições, corpo) de um nó FUNCTION/PROCEDURE"""
+    return node.name, node.defs, node.body
+
+def calls_in(node, found=None):
+    """nomes (minúsculas) de todos os subprogramas chamados dentro de um nó"""
+    if found is None:
+        found = set()
+    if isinstance(node, Node):
+        if node.kind in ('CALL_EXP', 'CALL_STMT'):
+            found.add(node.name.lower())
+        for child in node.children():
+            calls_in(child, found)
+    elif isinstance(node, list):
+        for child in node:
+            calls_in(child, found)
+    return found
+
+
+class CallGraph:
+    def __init__(self, ast):
+        """
+        Constrói o grafo: nome do subprograma -> nomes que ele chama.
+        Os subprogramas aninhados também entram (pelo nome).
+        """
+        self.ast = ast
+        self.edges = {}
+        self.order = [] # nomes (como declarados) pela ordem de declaração
+        self.main_calls = set()
+        self.dropped = []
+
+        if ast and ast.kind == 'PROGRAM':
+            self._collect(ast.defs)
+            self.main_calls = calls_in(ast.body)
+
+    def _collect(self, definitions):
+        for d in definitions:
+            if isinstance(d, Node) and d.kind in ('FUNCTION', 'PROCEDURE'):
+                name, defs, body = subprogram_parts(d)
+                key = name.lower()
+                self.order.append(name)
+                self.edges.setdefault(key, set()).update(calls_in(body))
+                self._collect(defs)
+
+    def reachable(self):
+        """conjunto dos subprogramas alcançáveis a partir do bloco principal"""
+        seen = set()
+        pending = [n for n in self.main_calls if n in self.edges]
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            pending.extend(n for n in self.edges[name] if n in self.edges and n not in seen)
+        return seen
+
+    def prune(self):
+        """devolve a AST sem os subprogramas inalcançáveis (e regista-os em self.dropped)"""
+        if not self.ast or self.ast.kind != 'PROGRAM':
+            return self.ast
+        live = self.reachable()
+        self.dropped = [n for n in self.order if n.lower() not in live]
+        return self.ast.replace(defs=self._prune_defs(self.ast.defs, live))
+
+    def _prune_defs(self, definitions, live):
+        kept = []
+        for d in definitions:
+            if isinstance(d, Node) and d.kind in ('FUNCTION', 'PROCEDURE'):
+                if d.name.lower() not in live:
+                    continue
+                d = d.replace(defs=self._prune_defs(d.defs, live))
+            kept.append(d)
+        return kept
+
+    def report(self):
+        if not self.dropped:
+            return f"callgraph: {len(self.order)} subprogramas, nenhum removido"
+        return (f"callgraph: {len(self.order)} subprogramas, {len(self.dropped)} removidos "
+                f"(nunca chamados): {', '.join(self.dropped)}")
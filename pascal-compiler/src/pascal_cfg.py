@@ -0,0 +1,240 @@
+"""
+Grafo de fluxo de controlo (CFG) do código EWVM, um por unidade (corpo principal e cada subprograma),
+aplicado antes do peephole.
+- blocos básicos: começam numa etiqueta ou depois de um salto e acabam num JUMP/JZ, num
+  RETURN/STOP ou antes da etiqueta seguinte
+- encadeamento de saltos: um salto para um bloco vazio segue logo para o destino final;
+  um JUMP para um bloco só com RETURN/STOP passa a esse RETURN/STOP
+- os blocos inalcançáveis a partir da entrada da unidade são removidos
+- disposição: um bloco que acaba num JUMP é seguido pelo seu destino sempre que nenhum outro
+  bloco passe diretamente para ele (o JUMP desaparece); as passagens diretas mantêm-se,
+  por isso a nova ordem nunca acrescenta saltos
+Os ciclos já vêm rodados do gerador (teste no fim do corpo, um só salto por iteração): sem um
+salto condicional "se verdadeiro" na EWVM, a condição só pode ser invertida na AST.
+"""
+from pascal_ir import Op, Label, Instr, JUMPS, ENDS
+
+
+class Block:
+    __slots__ = ('labels', 'code', 'jump', 'target', 'fall')
+
+    def __init__(self, labels):
+        self.labels = labels # etiquetas (Label) do início do bloco
+        self.code = []       # instruções (Instr), sem o salto final
+        self.jump = None     # instrução final: JUMP, JZ, RETURN, STOP ou None (passa ao bloco seguinte)
+        self.target = None   # bloco destino do JUMP/JZ
+        self.fall = None     # bloco seguinte, quando a execução passa diretamente (None/JZ)
+
+
+class ControlFlowGraph:
+    def __init__(self, instrs):
+        """
+        blocos básicos de uma unidade (lista de Instr).
+        Se algum salto sair da unidade, self.blocks fica None e a unidade não é alterada.
+        """
+        self.instrs = instrs
+        self.blocks = []
+        self.threaded = 0    # saltos redirecionados para o destino final
+        self.unreachable = 0 # instruções em blocos inalcançáveis
+        self.removed = 0     # JUMPs eliminados pela disposição
+        self.fresh = 0
+
+        labels = {}
+        current = None
+        for ins in instrs:
+            if ins.op is Op.LABEL:
+                if current is None or current.code or current.jump:
+                    current = self.new_block(current)
+                current.labels.append(ins.arg)
+                labels[ins.arg] = current
+                continue
+            if current is None or current.jump:
+                current = self.new_block(current)
+            if ins.op in JUMPS or ins.op in ENDS:
+                current.jump = ins
+            else:
+                current.code.append(ins)
+
+        for block in self.blocks:
+            if block.jump is not None and block.jump.op in JUMPS:
+                block.target = labels.get(block.jump.arg)
+                if block.target is None:
+                    self.blocks = None
+                    return
+
+    def new_block(self, previous):
+        block = Block([])
+        if previous is not None and kind(previous) in (None, Op.JZ):
+            previous.fall = block
+        self.blocks.append(block)
+        return block
+
+    def final(self, block):
+        """destino real de um salto: passa pelos blocos vazios (sem instruções)"""
+        seen = set()
+        while not block.code and id(block) not in seen:
+            seen.add(id(block))
+            if block.jump is None and block.fall is not None:
+                block = block.fall
+            elif kind(block) is Op.JUMP:
+                block = block.target
+            else:
+                break
+        return block
+
+    def thread(self):
+        for block in self.blocks:
+            if kind(block) not in JUMPS:
+                continue
+            target = self.final(block.target)
+            if target is not block.target:
+                block.target = target
+                self.threaded += 1
+            # JUMP para um RETURN/STOP: sai já daqui
+            if kind(block) is Op.JUMP and not target.code and kind(target) in ENDS:
+                block.jump = Instr(target.jump.op, None, block.jump.line)
+                block.target = None
+                self.threaded += 1
+
+    def remove_unreachable(self):
+        reached = {id(self.blocks[0])}
+        pending = [self.blocks[0]]
+        while pending:
+            block = pending.pop()
+            for succ in (block.target, block.fall):
+                if succ is not None and id(succ) not in reached:
+                    reached.add(id(succ))
+                    pending.append(succ)
+        for block in self.blocks:
+            if id(block) not in reached:
+                self.unreachable += len(block.code) + (block.jump is not None)
+        self.blocks = [b for b in self.blocks if id(b) in reached]
+
+    def layout(self):
+        """ordem dos blocos: cadeias de passagens diretas, com o destino de cada JUMP a seguir quando possível"""
+        entry = self.blocks[0]
+        # blocos para onde outro bloco passa diretamente (têm de ficar logo a seguir a ele)
+        pinned = {id(b.fall) for b in self.blocks if b.fall is not None}
+        placed = set()
+        order = []
+        for head in self.blocks:
+            if id(head) in placed or (id(head) in pinned and head is not entry):
+                continue
+            block = head
+            while block is not None and id(block) not in placed:
+                order.append(block)
+                placed.add(id(block))
+                target = block.target
+                if kind(block) in (None, Op.JZ):
+                    block = block.fall
+                elif (kind(block) is Op.JUMP and id(target) not in placed and id(target) not in pinned
+                        and target is not entry):
+                    # o destino passa para aqui: o JUMP deixa de ser preciso
+                    block.jump = None
+                    block.target = None
+                    block.fall = target
+                    pinned.add(id(target))
+                    self.removed += 1
+                    block = target
+                else:
+                    block = None
+        self.blocks = order
+
+    def label(self, block):
+        if not block.labels:
+            self.fresh += 1
+            block.labels.append(Label(f"LB{self.fresh}"))
+        return block.labels[0]
+
+    def serialize(self, called):
+        """instruções pela ordem dos blocos; só ficam as etiquetas usadas (saltos ou PUSHA em called)"""
+        # todos os destinos com etiqueta antes de escrever (a passagem direta pode precisar de uma nova)
+        for block in self.blocks:
+            for succ in (block.target, block.fall):
+                if succ is not None:
+                    self.label(succ)
+        out = []
+        for i, block in enumerate(self.blocks):
+            following = self.blocks[i + 1] if i + 1 < len(self.blocks) else None
+            out.extend(Instr(Op.LABEL, label) for label in block.labels)
+            out.extend(block.code)
+            jump = block.jump
+            op = kind(block)
+            if op is Op.JZ:
+                # os dois caminhos vão dar ao mesmo sítio: só falta tirar a condição da pilha
+                if block.target is following:
+                    out.append(Instr(Op.POP, 1, jump.line))
+                else:
+                    out.append(Instr(Op.JZ, block.target.labels[0], jump.line))
+            elif op is Op.JUMP:
+                if block.target is not following:
+                    out.append(Instr(Op.JUMP, block.target.labels[0], jump.line))
+            elif op in ENDS:
+                out.append(jump)
+            # a passagem direta tem de continuar a chegar ao bloco certo
+            if op in (None, Op.JZ) and block.fall is not None and block.fall is not following:
+                out.append(Instr(Op.JUMP, block.fall.labels[0], jump.line if jump else None))
+        used = set(called)
+        used.update(ins.arg for ins in out if ins.op in JUMPS)
+        return [ins for ins in out if ins.op is not Op.LABEL or ins.arg in used]
+
+    def optimize(self, called):
+        if self.blocks is None or not self.blocks:
+            return self.instrs
+        self.thread()
+        self.remove_unreachable()
+        self.layout()
+        return self.serialize(called)
+
+
+def kind(block):
+    """opcode da instrução final do bloco (None se passa diretamente ao seguinte)"""
+    return block.jump.op if block.jump is not None else None
+
+def split_units(instrs, entries):
+    """
+    do START ao STOP e de cada subprograma ao seu RETURN
+    :param entries: etiquetas de início dos subprogramas (mesmo os que nunca são chamados)
+    """
+    units = []
+    current = []
+    for ins in instrs:
+        if ins.op is Op.LABEL and ins.arg in entries and current and current[-1].op in ENDS:
+            units.append(current)
+            current = []
+        current.append(ins)
+    if current:
+        units.append(current)
+    return units
+
+
+class FlowOptimizer:
+    def __init__(self):
+        self.units = 0
+        self.blocks = 0
+        self.threaded = 0
+        self.unreachable = 0
+        self.removed = 0
+
+    def optimize(self, code, entries=()):
+        """
+        devolve uma nova lista de instruções (um CFG por unidade)
+        :param entries: etiquetas de início dos subprogramas (CodeGenerator.entries);
+            as que são chamadas com PUSHA contam sempre
+        """
+        called = {ins.arg for ins in code if ins.op is Op.PUSHA}
+        called.update(entries)
+        out = []
+        for unit in split_units(code, called):
+            cfg = ControlFlowGraph(unit)
+            self.units += 1
+            self.blocks += len(cfg.blocks or ())
+            out.extend(cfg.optimize(called))
+            self.threaded += cfg.threaded
+            self.unreachable += cfg.unreachable
+            self.removed += cfg.removed
+        return out
+
+    def report(self):
+        return (f"cfg: {self.blocks} blocos em {self.units} unidades, {self.threaded} saltos encadeados, "
+                f"{self.unreachable} instruções inalcançáveis removidas, {self.removed} saltos eliminados pela ordem dos blocos")
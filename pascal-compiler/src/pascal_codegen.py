@@ -1,378 +1,692 @@
 import sys
+from pascal_constfold import assigned_vars, contains_call
+from pascal_liveness import INFINITO, inline_exps
+from pascal_ast import Node, ArrayType, INTEGER, STRING
+from pascal_ir import Op, Label, Instr, serialize
+
+# comparação inversa: saltar se a comparação for verdadeira = JZ depois da inversa
+_INVERSE = {'<': '>=', '>': '<=', '<=': '>', '>=': '<', '=': '<>', '<>': '='}
+
+
+def string_value(node):
+    """texto de um literal STRING: sem as aspas e com '' (aspa dentro da string) trocado por '"""
+    return node.value[1:-1].replace("''", "'")
+
+def constant_text(node):
+    """o que o writeln escreve para um literal (None se não for literal)"""
+    kind = node.kind
+    if kind == 'STRING':
+        return string_value(node)
+    if kind == 'INT':
+        return str(int(node.value))
+    if kind == 'BOOL':
+        return '1' if node.value.lower() == 'true' else '0' # como o WRITEI de um booleano
+    return None
+
+
+def code_to_text(code):
+    """Junta uma lista de instruções num único texto."""
+    return "\n".join(code) + "\n" if code else ""
+
+def write_code(code, out=None):
+    """
+    Escreve uma lista de instruções de uma só vez.
+    :param out: caminho do ficheiro de saída (None escreve para o stdout).
+    """
+    text = code_to_text(code)
+    if out is None:
+        sys.stdout.write(text)
+    else:
+        with open(out, 'w') as f:
+            f.write(text)
+
 
 class CodeGenerator:
-    def __init__(self, parser_result, symbol_table):
+    def __init__(self, parser_result, tail_calls=True):
         """
         Inicializa o Gerador de Código.
-        :param parser_result: A Árvore Sintática (AST).
-        :param symbol_table: A Tabela de Símbolos (TS).
+        :param parser_result: A Árvore Sintática (AST), já resolvida (ver pascal_resolve):
+            cada identificador traz o seu símbolo e cada corpo a disposição do seu frame.
+        :param tail_calls: uma chamada recursiva em posição final passa a um salto para o início do corpo.
         """
         self.ast = parser_result
-        self.ts = symbol_table
         self.label_count = 0
+        self.code = [] # lista de instruções geradas (Instr, ver pascal_ir)
+        self.line = None # linha do comando a ser gerado (fica em cada instrução)
+        self.entries = {} # nome do subprograma (minúsculas) -> etiqueta do seu início
+        self.frame = None # frame atual (posição do PUSHN, slots ocupados, global?, intervalos dos ciclos)
+        self.hoisted = {} # id do nó da expressão -> (op, arg) que carrega o valor já calculado
+        self.slots_requested = 0 # slots que os frames precisariam sem partilha
+        self.slots_used = 0
+        self.tail_calls = tail_calls
+        self.subprogram = None # subprograma a ser gerado
+        self.tail_nodes = set() # ids dos comandos com chamadas recursivas finais do subprograma atual
+        self.entry = None # etiqueta do início do corpo (destino das chamadas finais)
+        self.tail_count = 0
 
 
     #funções auxiliares
     def get_new_label(self):
         """Gera etiquetas únicas (L1, L2...) para saltos."""
         self.label_count += 1
-        return f"L{self.label_count}"
+        return Label(f"L{self.label_count}")
+
+    def entry_label(self, name):
+        """etiqueta do início de um subprograma (a mesma para todas as chamadas, seja qual for a grafia)"""
+        label = self.entries.get(name.lower())
+        if label is None:
+            label = self.entries[name.lower()] = Label(name)
+        return label
 
-    def emit(self, instruction):
-        """Imprime uma instrução com indentação."""
-        print(f"\t{instruction}")
+    def emit(self, op, arg=None):
+        """Acrescenta uma instrução à lista de código."""
+        self.code.append(Instr(op, arg, self.line))
 
     def emit_label(self, label):
-        """Imprime uma etiqueta (Label)."""
-        print(f"{label}:")
+        """Acrescenta uma etiqueta (Label) à lista de código."""
+        self.code.append(Instr(Op.LABEL, label, self.line))
+
+    #slots do frame: variáveis locais e temporários escondidos (não aparecem no programa Pascal)
+    def begin_frame(self, frame):
+        """
+        Abre o frame de um corpo: marca onde fica o único PUSHN do frame (corrigido em end_frame).
+        As variáveis já têm offset (Resolver); os temporários ocupam os slots que sobram.
+        """
+        self.code.append(None)
+        self.frame = {'pos': len(self.code) - 1, 'slots': frame.slots.copy(), 'global': frame.is_global,
+                      'loops': frame.loops}
+
+    def end_frame(self):
+        slots = self.frame['slots']
+        if slots.size:
+            self.code[self.frame['pos']] = Instr(Op.PUSHN, slots.size)
+        self.slots_requested += slots.requested
+        self.slots_used += slots.size
+        self.frame = None
+
+    def loop_span(self, node):
+        """intervalo de um ciclo (onde vivem os seus temporários; sem partilha, o frame inteiro)"""
+        return self.frame['loops'].get(id(node), (0, INFINITO))
+
+    def new_temp(self, span):
+        """
+        reserva um slot no frame atual, livre durante span (intervalo do ciclo que o usa).
+        Devolve as instruções (push, store) desse slot, como pares (op, arg).
+        """
+        offset = self.frame['slots'].allocate(span)
+        if self.frame['global']:
+            return (Op.PUSHG, offset), (Op.STOREG, offset)
+        return (Op.PUSHL, offset), (Op.STOREL, offset)
+
+    def report(self):
+        return (f"slots: {self.slots_used} slots nos frames "
+                f"({self.slots_requested - self.slots_used} poupados com a partilha)")
+
+    def tail_report(self):
+        return f"tailcalls: {self.tail_count} chamadas recursivas finais substituídas por saltos"
+
+    #chamadas recursivas finais
+    def find_tail_calls(self, stmt, sub, found):
+        """
+        comandos em posição final do corpo (último comando, ramos de um if final) que chamam
+        o próprio subprograma: num procedimento Sub(...); numa função Sub := Sub(...)
+        """
+        if stmt is None:
+            return
+        kind = stmt.kind
+        call = None
+        if kind == 'BLOCK':
+            if stmt.cmds:
+                self.find_tail_calls(stmt.cmds[-1], sub, found)
+        elif kind == 'IF':
+            self.find_tail_calls(stmt.then, sub, found)
+            self.find_tail_calls(stmt.other, sub, found)
+        elif kind == 'CALL_STMT' and sub.kind == 'PROCEDURE':
+            call = stmt
+        elif (kind == 'ASSIGN' and sub.kind == 'FUNCTION' and stmt.expr.kind == 'CALL_EXP'
+              and stmt.name.lower() == sub.name.lower()):
+            call = stmt.expr
+        if (call is not None and call.name.lower() == sub.name.lower()
+                and len(call.args) == len(sub.frame.params)):
+            found.add(id(stmt))
+
+    def emit_tail_call(self, call):
+        """
+        chamada recursiva final: os argumentos são todos calculados antes de substituírem os parâmetros,
+        as variáveis locais que podem ser lidas antes de atribuídas e o resultado que nem todos os caminhos
+        atribuem voltam a 0 (como no PUSHN e no PUSHI 0 de uma chamada nova) e salta-se para o início do corpo.
+        A pilha não cresce com a recursão.
+        """
+        frame = self.subprogram.frame
+        for arg in call.args:
+            self.visit(arg)
+        for sym in reversed(frame.params):
+            self.emit(*sym.store)
+        for sym in frame.uninit:
+            self.emit(Op.PUSHI, 0)
+            self.emit(*sym.store)
+        self.emit(Op.JUMP, self.entry)
+        self.tail_count += 1
+
+    #acesso a variáveis e elementos de arrays
+    def emit_load(self, sym):
+        """empilha o valor de uma variável (num array, o pointer para o bloco na heap)"""
+        self.emit(*sym.push)
+
+    def emit_element_index(self, sym, idx_expr):
+        """
+        deslocamento de um elemento dentro do bloco: (indice - low) * elem_size.
+        Com índice constante não emite nada e devolve o deslocamento fixo;
+        caso contrário emite o cálculo (o ajuste só se low != 0) e devolve None.
+        """
+        layout = sym.layout
+        # strings do Pascal começam em 1, CHARAT começa em 0
+        low = layout['low'] if layout else 1
+        elem_size = layout['elem_size'] if layout else 1
+
+        if idx_expr.kind == 'INT':
+            return (int(idx_expr.value) - low) * elem_size
+
+        self.visit(idx_expr)
+        if low != 0:
+            self.emit(Op.PUSHI, low)
+            self.emit(Op.SUB)
+        if elem_size != 1:
+            self.emit(Op.PUSHI, elem_size)
+            self.emit(Op.MUL)
+        return None
+
+    #invariantes de ciclos
+    def is_invariant(self, expr, changed):
+        """só literais e variáveis escalares que o ciclo não altera"""
+        kind = expr.kind
+        if kind == 'INT':
+            return True
+        if kind == 'ID':
+            sym = expr.sym
+            return sym is not None and sym.category == 'VAR' and expr.name.lower() not in changed
+        if kind == 'BINOP':
+            return self.is_invariant(expr.left, changed) and self.is_invariant(expr.right, changed)
+        return False
+
+    def find_invariants(self, node, changed, always, found):
+        """
+        procura operações div/mod invariantes.
+        always indica que a expressão é avaliada sempre que o ciclo começa (condição do while);
+        no corpo só se movem divisões por uma constante diferente de zero.
+        """
+        if isinstance(node, list):
+            for child in node:
+                self.find_invariants(child, changed, always, found)
+            return
+        if not isinstance(node, Node) or id(node) in self.hoisted:
+            return
+        # curto-circuito: o segundo operando de um and/or pode não ser avaliado
+        if node.kind == 'BINOP' and node.op in ('AND', 'OR'):
+            self.find_invariants(node.left, changed, always, found)
+            self.find_invariants(node.right, changed, False, found)
+            return
+        if node.kind == 'BINOP' and node.op in ('DIV', 'MOD') and self.is_invariant(node, changed):
+            divisor = node.right
+            if always or (divisor.kind == 'INT' and int(divisor.value) != 0):
+                found.append(node)
+                return
+        for child in node.children():
+            self.find_invariants(child, changed, always, found)
+
+    def hoist_invariants(self, cond, body, changed, span):
+        """
+        calcula uma só vez, antes do ciclo, as expressões invariantes (guardadas em temporários).
+        Devolve os nós movidos, para libertar com release_hoisted no fim do ciclo.
+        """
+        if self.frame is None or contains_call([cond, body]):
+            return []
+        found = []
+        if cond is not None:
+            self.find_invariants(cond, changed, True, found)
+        self.find_invariants(body, changed, False, found)
+
+        loads = [] # (expressão, push) já calculadas neste ciclo
+        for expr in found:
+            for other, push in loads:
+                if other == expr:
+                    break
+            else:
+                push, store = self.new_temp(span)
+                self.visit(expr)
+                self.emit(*store)
+                loads.append((expr, push))
+            self.hoisted[id(expr)] = push
+        return found
+
+    def release_hoisted(self, nodes):
+        for expr in nodes:
+            del self.hoisted[id(expr)]
+
+    def get_code(self):
+        """Devolve o código gerado como um único texto."""
+        return code_to_text(serialize(self.code))
+
+    def write(self, out=None):
+        """Escreve todo o código de uma só vez (ficheiro ou stdout)."""
+        write_code(serialize(self.code), out)
 
 
     #visitor / o que vai percorrer a AST
     def generate(self):
-        """Ponto de entrada da geração."""
+        """Ponto de entrada da geração. Devolve a lista de instruções (Instr; texto com pascal_ir.serialize)."""
+        self.code = []
         if self.ast:
             self.visit(self.ast)
+        # remove os marcadores de frames sem temporários
+        self.code = [c for c in self.code if c is not None]
+        return self.code
 
     def visit(self, node):
         """Despacho dinâmico: procura o método visit_TIPO para cada nó."""
-        if not isinstance(node, tuple):
+        if not isinstance(node, Node):
             return
 
-        node_type = node[0]
+        node_type = node.kind
         method_name = f'visit_{node_type}'
         
         # Tenta encontrar o método específico, senão usa o genérico
         visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+
+        # os comandos trazem a sua linha do programa (ver pascal_anasin)
+        line = getattr(node, 'line', None)
+        if line is None:
+            return visitor(node)
+        outer = self.line
+        self.line = line
+        result = visitor(node)
+        self.line = outer
+        return result
 
     def generic_visit(self, node):
         """Debug: avisa se encontrarmos um nó desconhecido."""
-        #print(f"; AVISO: Nó ignorado {node[0]}") #debug
+        #print(f"; AVISO: Nó ignorado {node.kind}") #debug
         pass
 
 
     #estrutura do programa
     def visit_PROGRAM(self, node):
-        print("START")
+        self.emit(Op.START)
+
+        # etiquetas dos subprogramas com a grafia da declaração (o corpo principal é gerado primeiro)
+        for idef in node.defs:
+            if idef.kind in ('FUNCTION', 'PROCEDURE'):
+                self.entry_label(idef.name)
         
-        definitions = node[2] # lista de variáveis e funções
+        definitions = node.defs # lista de variáveis e funções
         
+        # um único PUSHN para as variáveis globais e os temporários do corpo principal
+        self.begin_frame(node.frame)
+
         # percorre uma vez para declarar variáveis globais
         for idef in definitions:
-            if idef[0] == 'VAR_BLOCK':
+            if idef.kind == 'VAR_BLOCK':
                 self.visit(idef)
         
         # percorre uma segunda vez para o corpo principal do prorgama ("main")
-        self.visit(node[3]) 
+        self.visit(node.body) 
+        self.end_frame()
         
-        print("STOP") # o programa acaba aqui para a VM
+        self.emit(Op.STOP) # o programa acaba aqui para a VM
 
         # percorre uma terceira vez para funções e procedimentos isolados
         for idef in definitions:
-            if idef[0] in ['FUNCTION', 'PROCEDURE']:
+            if idef.kind in ['FUNCTION', 'PROCEDURE']:
                 self.visit(idef)
 
     def visit_VAR_BLOCK(self, node):
-        for decl in node[1]:
+        for decl in node.decls:
             self.visit(decl)
 
     def visit_DECL(self, node):
         """
         Declara variáveis. 
         Se for ARRAY, aloca memória na Heap (ALLOCN).
-        Se for simples, apenas reserva espaço na Stack (PUSHN).
+        O espaço na Stack (1 slot por variável ou pointer) já foi reservado pelo PUSHN do frame.
         """
-        var_names = node[1]
-        var_type = node[2]
-        
-        # reservar espaço na stack (1 slot por variável ou pointer)
-        self.emit(f"PUSHN {len(var_names)}")
+        var_names = node.names
+        var_type = node.type
 
         # se for array, alocar memória na heap
-        if var_type[0] == 'ARRAY_TYPE':
-            # var_type = ('ARRAY_TYPE', inicio, fim, tipo_elemento)
-            start = int(var_type[1])
-            end = int(var_type[2])
-            size = end - start + 1
-            
-            for name in var_names:
-                sym = self.ts.lookup(name)
-                if not sym: continue
+        if isinstance(var_type, ArrayType):
+            for sym in node.syms:
+                if sym is None: continue
 
                 # alocar n espaços na heap
-                self.emit(f"PUSHI {size}")
-                self.emit("ALLOCN") # coloca o endereço na stack
+                layout = sym.layout
+                self.emit(Op.PUSHI, layout['length'] * layout['elem_size'])
+                self.emit(Op.ALLOCN) # coloca o endereço na stack
                 
                 # guardar o pointer
-                if sym['scope'] == 'GLOBAL':
-                    self.emit(f"STOREG {sym['offset']}")
-                else:
-                    self.emit(f"STOREL {sym['offset']}")
+                self.emit(*sym.store)
 
     def visit_BLOCK(self, node):
-        for cmd in node[1]:
+        for cmd in node.cmds:
             self.visit(cmd)
 
 
     #visitar funções e procedimentos
     def visit_FUNCTION(self, node):
-        func_name = node[1]
-        params = node[2]
-        defs = node[4]
-        body = node[5]
+        self.visit_subprogram(node)
 
-        self.emit_label(func_name)
-        
-        # reconstruir o scope é necessário porque o parser apagou as variáveis locais
-        self.ts.enter_scope()
-
-        # parâmetros (offsets negativos, até -1)
-        total_params = sum(len(p[1]) for p in params)
-        current_idx = 0
-        for decl in params:
-            for name in decl[1]:
-                # offset relativo ao frame pointer (FP)
-                offset = -(total_params - current_idx)
-                # adicionar manualmente à TS e forçar offset
-                self.ts.add(name, decl[2], 'VAR')
-                self.ts.scope_stack[-1][name.lower()]['offset'] = offset
-                current_idx += 1
-
-        # variáveis Locais (offsets positivos)
-        for definition in defs:
-            if definition[0] == 'VAR_BLOCK':
-                for decl in definition[1]:
-                    for name in decl[1]:
-                        self.ts.add(name, decl[2], 'VAR')
-                # gerar código de alocação (PUSHN/ALLOCN)
-                self.visit(definition) 
-
-        # corpo da função
-        self.visit(body)
+    def visit_PROCEDURE(self, node):
+        self.visit_subprogram(node)
 
-        self.ts.exit_scope()
-        self.emit("RETURN")
+    def visit_subprogram(self, node):
+        """
+        funções e procedimentos (Function/Procedure têm os mesmos campos params, defs e body).
+        Parâmetros (offsets negativos, até -1) e variáveis locais já foram resolvidos.
+        """
+        defs = node.defs
+        body = node.body
+
+        self.emit_label(self.entry_label(node.name))
+        self.begin_frame(node.frame)
+
+        # chamadas recursivas finais saltam para aqui (depois do PUSHN: o frame é reaproveitado)
+        self.subprogram = node
+        self.tail_nodes = set()
+        if self.tail_calls:
+            self.find_tail_calls(body, node, self.tail_nodes)
+        self.entry = None
+        if self.tail_nodes:
+            self.entry = self.get_new_label()
+            self.emit_label(self.entry)
+
+        # gerar código de alocação dos arrays (ALLOCN)
+        for definition in defs:
+            if definition.kind == 'VAR_BLOCK':
+                self.visit(definition)
 
-    def visit_PROCEDURE(self, node):
-        proc_name = node[1]
-        params = node[2]
-        # dependendo da gramática, defs pode estar em índice 3 ou 2, daí a necessidade de ajustar às vezs
-        defs = node[3] if len(node) > 4 else []
-        body = node[4] if len(node) > 4 else node[3]
-
-        self.emit_label(proc_name)
-        self.ts.enter_scope()
-
-        # parametros
-        total_params = sum(len(p[1]) for p in params)
-        current_idx = 0
-        for decl in params:
-            for name in decl[1]:
-                offset = -(total_params - current_idx)
-                self.ts.add(name, decl[2], 'VAR')
-                self.ts.scope_stack[-1][name.lower()]['offset'] = offset
-                current_idx += 1
-
-        # instancias locais
-        if isinstance(defs, list):
-            for definition in defs:
-                if definition[0] == 'VAR_BLOCK':
-                    for decl in definition[1]:
-                        for name in decl[1]:
-                            self.ts.add(name, decl[2], 'VAR')
-                    self.visit(definition)
-        
+        # corpo do subprograma
         self.visit(body)
-        self.ts.exit_scope()
-        self.emit("RETURN")
+        self.end_frame()
+        self.emit(Op.RETURN)
+        self.subprogram = None
+        self.tail_nodes = set()
 
 
     #comandos / statements
     def visit_ASSIGN(self, node):
-        # node = ('ASSIGN', nome, expr)
-        self.visit(node[2]) #ver tipo da expressão
-        
-        var_name = node[1]
-        sym = self.ts.lookup(var_name)
+        # F := F(...) no fim da função F
+        if id(node) in self.tail_nodes:
+            self.emit_tail_call(node.expr)
+            return
+
+        self.visit(node.expr) #ver tipo da expressão
         
-        if not sym:
+        sym = node.sym
+        if sym is None:
             return #erro
 
-        # verificar se é retorno de função
-        if sym['category'] == 'FUNCTION' and sym['scope'] == 'GLOBAL':
-            self.emit("STOREL -2") # slot de return padrão (ajustar se >1 param)
-        elif sym['scope'] == 'GLOBAL':
-            self.emit(f"STOREG {sym['offset']}")
+        # retorno de função fora do próprio corpo (dentro dele, sym é o slot de retorno)
+        if sym.category == 'FUNCTION' and sym.scope == 'GLOBAL':
+            self.emit(Op.STOREL, -2)
         else:
-            self.emit(f"STOREL {sym['offset']}")
+            self.emit(*sym.store)
 
     def visit_ARRAY_ASSIGN(self, node):
-        # node = ('ARRAY_ASSIGN', nome, indice, valor)
-        var_name = node[1]
-        idx_expr = node[2]
-        val_expr = node[3]
+        idx_expr = node.index
+        val_expr = node.value
         
-        sym = self.ts.lookup(var_name)
+        sym = node.sym
+        if sym is None: return
         
         # a instrução STOREN precisa que na stack haja: [endereço, indice, valor]
+        # (com índice constante: [endereço, valor] e STORE deslocamento)
         
         # endereço (pointer do array)
-        if sym['scope'] == 'GLOBAL':
-            self.emit("PUSHGP")
-            self.emit(f"PUSHI {sym['offset']}")
-            self.emit("PADD")
-        else:
-            self.emit("PUSHFP")
-            self.emit(f"PUSHI {sym['offset']}")
-            self.emit("PADD")
+        self.emit_load(sym)
 
         # indice
-        self.visit(idx_expr)
-        self.emit("PUSHI 1")
-        self.emit("SUB")
+        offset = self.emit_element_index(sym, idx_expr)
 
         # valor
         self.visit(val_expr)
         
-        self.emit("STOREN")
+        self.emit(Op.STOREN) if offset is None else self.emit(Op.STORE, offset)
 
     def visit_READLN(self, node):
-        for var_node in node[1]:
+        for var_node in node.args:
             # caso especial: ler para um array
-            if isinstance(var_node, tuple) and var_node[0] == 'ARRAY_ACCESS':
-                var_name = var_node[1]
-                idx_expr = var_node[2]
-                sym = self.ts.lookup(var_name)
+            if isinstance(var_node, Node) and var_node.kind == 'ARRAY_ACCESS':
+                idx_expr = var_node.index
+                sym = var_node.sym
+                if sym is None: continue
                 
                 # endereço
-                if sym['scope'] == 'GLOBAL':
-                    self.emit(f"PUSHG {sym['offset']}")
-                else:
-                    self.emit(f"PUSHL {sym['offset']}")
+                self.emit_load(sym)
                 
                 # idice
-                self.visit(idx_expr)
-                self.emit("PUSHI 1")
-                self.emit("SUB")
+                offset = self.emit_element_index(sym, idx_expr)
 
                 # leitura e conversão
-                self.emit("READ")
-                self.emit("ATOI") # assumimos que é array de inteiros
+                self.emit(Op.READ)
+                self.emit(Op.ATOI) # assumimos que é array de inteiros
                 
                 # guardar
-                self.emit("STOREN")
+                self.emit(Op.STOREN) if offset is None else self.emit(Op.STORE, offset)
 
             # caso normal: ler uma variável
             else:
-                var_name = var_node[1] if isinstance(var_node, tuple) else var_node
-                sym = self.ts.lookup(var_name)
+                sym = getattr(var_node, 'sym', None)
                 
-                self.emit("READ")
-                if sym and sym['type'] == ('TYPE', 'INTEGER'):
-                    self.emit("ATOI") # converter para inteiro
+                self.emit(Op.READ)
+                if sym is not None and sym.type is INTEGER:
+                    self.emit(Op.ATOI) # converter para inteiro
                 
-                if sym:
-                    if sym['scope'] == 'GLOBAL':
-                        self.emit(f"STOREG {sym['offset']}")
-                    else:
-                        self.emit(f"STOREL {sym['offset']}")
+                if sym is not None:
+                    self.emit(*sym.store)
 
     def visit_WRITELN(self, node):
-        for expr in node[1]:
-            self.visit(expr)
-            if expr[-1] == ('TYPE', 'STRING'):
-                self.emit("WRITES")
-            else:
-                self.emit("WRITEI")
-        self.emit("WRITELN")
+        # literais seguidos (strings e constantes já dobradas) saem num só PUSHS / WRITES
+        run = []
+        for expr in node.args:
+            if constant_text(expr) is not None:
+                run.append(expr)
+                continue
+            self.write_constants(run)
+            run = []
+            self.write_value(expr)
+        self.write_constants(run)
+        self.emit(Op.WRITELN)
+
+    def write_value(self, expr):
+        self.visit(expr)
+        if expr.type is STRING:
+            self.emit(Op.WRITES)
+        else:
+            self.emit(Op.WRITEI)
+
+    def write_constants(self, run):
+        # um inteiro ou booleano sozinho fica PUSHI / WRITEI (o mesmo nº de instruções)
+        if len(run) == 1 and run[0].kind != 'STRING':
+            self.write_value(run[0])
+            return
+        text = "".join(constant_text(expr) for expr in run)
+        if text:
+            self.emit(Op.PUSHS, text)
+            self.emit(Op.WRITES)
 
 
     #controlo de fluxo
+    def cond_jump(self, expr, label, jump_if):
+        """
+        Condição de um if/while como cadeia de saltos: salta para label quando a condição
+        vale jump_if, senão continua na instrução seguinte.
+        and/or em curto-circuito: o segundo operando só é avaliado se o primeiro não decidir.
+        """
+        kind = expr.kind
+        if kind == 'UNOP' and expr.op == 'NOT':
+            self.cond_jump(expr.expr, label, not jump_if)
+            return
+        if kind == 'BOOL':
+            if (expr.value.lower() == 'true') == jump_if:
+                self.emit(Op.JUMP, label)
+            return
+        if kind == 'BINOP' and id(expr) not in self.hoisted:
+            op = expr.op.upper()
+            if op in ('AND', 'OR'):
+                # valor do primeiro operando que decide sozinho (falso num and, verdadeiro num or)
+                decides = op == 'OR'
+                if jump_if == decides:
+                    self.cond_jump(expr.left, label, jump_if)
+                    self.cond_jump(expr.right, label, jump_if)
+                else:
+                    l_skip = self.get_new_label()
+                    self.cond_jump(expr.left, l_skip, decides)
+                    self.cond_jump(expr.right, label, jump_if)
+                    self.emit_label(l_skip)
+                return
+            if jump_if and op in _INVERSE:
+                self.emit_binop(expr, _INVERSE[op])
+                self.emit(Op.JZ, label)
+                return
+        self.visit(expr)
+        if jump_if:
+            self.emit(Op.NOT)
+        self.emit(Op.JZ, label)
+
     def visit_IF(self, node):
+        # sem else: basta saltar para o fim (sem JUMP nem etiqueta extra)
+        if not node.other:
+            l_end = self.get_new_label()
+            self.cond_jump(node.cond, l_end, False) # if: salta se falso
+            self.visit(node.then)     # then
+            self.emit_label(l_end)
+            return
+
         l_else = self.get_new_label()
         l_end = self.get_new_label()
 
-        self.visit(node[1])       # if
-        self.emit(f"JZ {l_else}") # jump se falso (zero)
+        self.cond_jump(node.cond, l_else, False) # if: salta se falso
         
-        self.visit(node[2])       # then
-        self.emit(f"JUMP {l_end}")
+        self.visit(node.then)     # then
+        self.emit(Op.JUMP, l_end)
         
         self.emit_label(l_else)
-        if node[3]: self.visit(node[3]) # else
+        self.visit(node.other)    # else
         
         self.emit_label(l_end)
 
     def visit_WHILE(self, node):
+        # div/mod invariantes são calculados uma vez antes do ciclo
+        changed = assigned_vars([node.cond, node.body])
+        hoisted = self.hoist_invariants(node.cond, node.body, changed, self.loop_span(node))
+
         l_start = self.get_new_label()
         l_end = self.get_new_label()
 
-        self.emit_label(l_start)
-        self.visit(node[1])       #condição do while
-        self.emit(f"JZ {l_end}")
-        
-        self.visit(node[2])       # corpo
-        self.emit(f"JUMP {l_start}")
+        if inline_exps(node.cond):
+            # a condição tem corpos expandidos: não se duplica
+            self.emit_label(l_start)
+            self.cond_jump(node.cond, l_end, False) # condição do while
+            self.visit(node.body)     # corpo
+            self.emit(Op.JUMP, l_start)
+        else:
+            # ciclo rodado: teste à entrada e no fim do corpo, que volta ao início se a
+            # condição for verdadeira (um salto por iteração em vez de JZ + JUMP)
+            self.cond_jump(node.cond, l_end, False)
+            self.emit_label(l_start)
+            self.visit(node.body)     # corpo
+            self.cond_jump(node.cond, l_start, True)
         self.emit_label(l_end)
+        self.release_hoisted(hoisted)
 
     def visit_FOR(self, node):
-        # ('FOR', var, start, end, body, direction)
-        var_name = node[1]
-        start_expr = node[2]
-        end_expr = node[3]
-        body = node[4] 
-        direction = node[5].lower()
+        var_name = node.var
+        start_expr = node.start
+        end_expr = node.end
+        body = node.body
+        direction = node.direction.lower()
 
-        sym = self.ts.lookup(var_name)
-        if not sym: return
+        sym = node.sym
+        if sym is None: return
 
-        store = f"STOREG {sym['offset']}" if sym['scope'] == 'GLOBAL' else f"STOREL {sym['offset']}"
-        push = f"PUSHG {sym['offset']}" if sym['scope'] == 'GLOBAL' else f"PUSHL {sym['offset']}"
+        store = sym.store
+        push = sym.push
 
-        # inicializar
+        # o valor inicial fica na pilha até o limite estar calculado:
+        # as duas expressões veem o valor da variável de controlo antes do ciclo
         self.visit(start_expr)
-        self.emit(store)
+
+        # o limite é avaliado uma única vez (semântica do Pascal):
+        # um literal ou uma variável que o ciclo não altera lê-se diretamente,
+        # qualquer outra expressão vai para um slot escondido
+        changed = assigned_vars(body) | {var_name.lower()}
+        if end_expr.kind == 'INT' or (end_expr.kind == 'ID' and not contains_call(body)
+                                    and self.is_invariant(end_expr, changed)):
+            load_end = lambda: self.visit(end_expr)
+        else:
+            end_push, end_store = self.new_temp(self.loop_span(node))
+            self.visit(end_expr)
+            self.emit(*end_store)
+            load_end = lambda: self.emit(*end_push)
+
+        # inicializar
+        self.emit(*store)
+
+        # div/mod invariantes são calculados uma vez antes do ciclo
+        hoisted = self.hoist_invariants(None, body, changed, self.loop_span(node))
 
         l_loop = self.get_new_label()
         l_end = self.get_new_label()
-        self.emit_label(l_loop)
 
-        # condição de paragem
-        self.emit(push)
-        self.visit(end_expr)
-        self.emit("INFEQ" if direction == 'to' else "SUPEQ")
-        self.emit(f"JZ {l_end}")
+        # condição de paragem, à entrada
+        self.emit(*push)
+        load_end()
+        self.emit(Op.INFEQ if direction == 'to' else Op.SUPEQ)
+        self.emit(Op.JZ, l_end)
 
         # corpo do for
+        self.emit_label(l_loop)
         self.visit(body)
 
         # incrementar / decrementar contador
-        self.emit(push)
-        self.emit("PUSHI 1")
-        self.emit("ADD" if direction == 'to' else "SUB")
-        self.emit(store)
-        self.emit(f"JUMP {l_loop}")
+        self.emit(*push)
+        self.emit(Op.PUSHI, 1)
+        self.emit(Op.ADD if direction == 'to' else Op.SUB)
+        self.emit(*store)
+
+        # ciclo rodado: volta ao corpo enquanto o contador não passar o limite (JZ da condição inversa)
+        self.emit(*push)
+        load_end()
+        self.emit(Op.SUP if direction == 'to' else Op.INF)
+        self.emit(Op.JZ, l_loop)
         self.emit_label(l_end)
+        self.release_hoisted(hoisted)
 
 
     #expressões
     def visit_BINOP(self, node):
-        left = node[2]
-        right = node[3]
-        op = node[1].upper()
+        # valor invariante já calculado antes do ciclo
+        if id(node) in self.hoisted:
+            self.emit(*self.hoisted[id(node)])
+            return
+        self.emit_binop(node, node.op.upper())
+
+    def emit_binop(self, node, op):
+        """operandos e operação (op pode não ser o do nó: comparação invertida num salto)"""
+        left = node.left
+        right = node.right
         
         # se compararmos bin[i] (CHARAT devolve int) com '1' (string), convertemos o '1' para o seu valor ASCII
         
         # se bin[i] = '1'
-        if left[0] == 'ARRAY_ACCESS' and right[0] == 'STRING' and len(right[1]) == 3:
+        if left.kind == 'ARRAY_ACCESS' and right.kind == 'STRING' and len(string_value(right)) == 1:
             self.visit(left)
-            char_val = right[1].replace("'", "")
-            self.emit(f"PUSHI {ord(char_val)}") # ASCII do char
+            char_val = string_value(right)
+            self.emit(Op.PUSHI, ord(char_val)) # ASCII do char
             
         # se '1' = bin[i]
-        elif right[0] == 'ARRAY_ACCESS' and left[0] == 'STRING' and len(left[1]) == 3:
-            char_val = left[1].replace("'", "")
-            self.emit(f"PUSHI {ord(char_val)}")
+        elif right.kind == 'ARRAY_ACCESS' and left.kind == 'STRING' and len(string_value(left)) == 1:
+            char_val = string_value(left)
+            self.emit(Op.PUSHI, ord(char_val))
             self.visit(right)
             
         # caso padrão
@@ -380,71 +694,88 @@ class CodeGenerator:
             self.visit(left)
             self.visit(right)
 
-        ops = {'+':'ADD', '-':'SUB', '*': 'MUL', 'DIV':'DIV', 'MOD':'MOD', 
-               '=':'EQUAL', '<':'INF', '<=': 'INFEQ', '>':'SUP', '>=':'SUPEQ', 
-               'AND':'AND', 'OR':'OR'}
-        self.emit(ops.get(op, 'ADD'))
+        ops = {'+': Op.ADD, '-': Op.SUB, '*': Op.MUL, 'DIV': Op.DIV, 'MOD': Op.MOD,
+               '=': Op.EQUAL, '<': Op.INF, '<=': Op.INFEQ, '>': Op.SUP, '>=': Op.SUPEQ,
+               'AND': Op.AND, 'OR': Op.OR}
+
+        # a VM não tem "diferente": EQUAL seguido de NOT
+        if op == '<>':
+            self.emit(Op.EQUAL)
+            self.emit(Op.NOT)
+            return
+
+        self.emit(ops.get(op, Op.ADD))
+
+    def visit_UNOP(self, node):
+        # not: 0 <-> 1 (fora de condições, onde passa a salto)
+        self.visit(node.expr)
+        self.emit(Op.NOT)
 
     def visit_INT(self, node):
-        self.emit(f"PUSHI {node[1]}")
+        self.emit(Op.PUSHI, int(node.value))
 
     def visit_STRING(self, node):
-        # pascal usa 'aspas simples', VM usa "aspas duplas"
-        self.emit(f"PUSHS {node[1].replace(chr(39), chr(34))}")
+        # pascal usa 'aspas simples' (com '' para uma aspa), VM usa "aspas duplas" (postas pelo serialize)
+        self.emit(Op.PUSHS, string_value(node))
 
     def visit_BOOL(self, node):
-        val = 1 if node[1].lower() == 'true' else 0
-        self.emit(f"PUSHI {val}")
+        val = 1 if node.value.lower() == 'true' else 0
+        self.emit(Op.PUSHI, val)
 
     def visit_ID(self, node):
-        sym = self.ts.lookup(node[1])
-        if not sym: return
+        sym = node.sym
+        if sym is None: return
 
-        if sym['scope'] == 'GLOBAL':
-            self.emit(f"PUSHG {sym['offset']}")
-        else:
-            self.emit(f"PUSHL {sym['offset']}")
+        self.emit(*sym.push)
 
     def visit_ARRAY_ACCESS(self, node):
         # tipo v[i]
-        sym = self.ts.lookup(node[1])
-        if not sym: return
+        sym = node.sym
+        if sym is None: return
 
         # arranjar o pointer do array
-        if sym['scope'] == 'GLOBAL':
-            self.emit(f"PUSHG {sym['offset']}")
-        else:
-            self.emit(f"PUSHL {sym['offset']}")
+        self.emit_load(sym)
             
         # arranjar o indice do array
-        self.visit(node[2])
-        self.emit("PUSHI 1")
-        self.emit("SUB")
+        offset = self.emit_element_index(sym, node.index)
         
         # instrução de acesso
-        # strings usam CHARAT, arrays usam LOADN
-        if sym['type'] == ('TYPE', 'STRING') or sym['type'] == 'STRING':
-            self.emit("CHARAT")
+        # strings usam CHARAT, arrays usam LOADN (ou LOAD com índice constante)
+        if sym.type is STRING:
+            if offset is not None:
+                self.emit(Op.PUSHI, offset)
+            self.emit(Op.CHARAT)
+        elif offset is None:
+            self.emit(Op.LOADN)
         else:
-            self.emit("LOADN")
+            self.emit(Op.LOAD, offset)
 
     def visit_CALL_EXP(self, node):
-        func_name = node[1].lower()
-        args = node[2]
+        func_name = node.name.lower()
+        args = node.args
 
         if func_name == 'length':
             self.visit(args[0])
-            self.emit("STRLEN")
+            self.emit(Op.STRLEN)
             return
 
         # chamar funções
-        self.emit("PUSHI 0") # reservar espaço para return
+        self.emit(Op.PUSHI, 0) # reservar espaço para return
         for arg in args:
             self.visit(arg)
             
-        self.emit(f"PUSHA {node[1]}") # nome original (case sensitive label)
-        self.emit("CALL")
-        self.emit(f"POP {len(args)}") # limpar argumentos
+        self.emit(Op.PUSHA, self.entry_label(node.name))
+        self.emit(Op.CALL)
+        self.emit(Op.POP, len(args)) # limpar argumentos
+
+    def visit_INLINE_EXP(self, node):
+        """função expandida no local da chamada: os comandos do corpo e depois o valor do resultado"""
+        for cmd in node.cmds:
+            self.visit(cmd)
+        self.visit(node.result)
 
     def visit_CALL_STMT(self, node):
+        if id(node) in self.tail_nodes:
+            self.emit_tail_call(node)
+            return
         self.visit_CALL_EXP(node)
\ No newline at end of file
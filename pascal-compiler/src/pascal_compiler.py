@@ -0,0 +1,240 @@
+from contextlib import nullcontext
+from pascal_cache import CompileCache
+
+# o lexer, o parser e o gerador só são importados quando são precisos
+# (um acerto na cache não paga o custo de carregar as tabelas do ply)
+
+# entra na chave da cache: mudar sempre que o código gerado possa mudar
+VERSION = '1.14'
+
+
+class Compiler:
+    def __init__(self, cache=None, options=None, stats=None):
+        """
+        Sessão de compilação reutilizável.
+        - cada sessão tem o seu próprio clone do lexer (com lineno próprio)
+        - cada chamada a compile usa uma tabela de símbolos nova
+        - as tabelas LALR do parser são partilhadas (só de leitura),
+          o estado do parse (stacks) é local a cada chamada a parser.parse
+        - o lexer é clonado apenas na primeira análise
+        :param cache: CompileCache opcional (None desativa a cache)
+        :param options: opções de compilação (também fazem parte da chave da cache)
+            - constfold: dobragem e propagação de constantes na AST (por omissão, True)
+            - inline: expande as chamadas a funções e procedimentos pequenos (por omissão, True)
+            - inline_budget: nº máximo de nós da AST no corpo de um subprograma expandido
+            - no_inline: nomes dos subprogramas que nunca são expandidos
+            - prune: remove subprogramas nunca chamados a partir do bloco principal (por omissão, True)
+            - cfg: grafo de fluxo de controlo de cada unidade: encadeia saltos, remove blocos
+              inalcançáveis e reordena os blocos (por omissão, True)
+            - peephole: aplica o otimizador peephole (por omissão, True)
+            - peephole_rules: lista de regras peephole a usar (por omissão, todas)
+            - reuse_slots: variáveis locais e temporários com tempos de vida disjuntos
+              partilham slots do frame (por omissão, True)
+            - tail_calls: chamadas recursivas em posição final passam a saltos (por omissão, True)
+            - lines: comentários '// linha N' no código gerado, com a linha do programa de cada
+              comando (por omissão, False)
+        :param stats: recolhe estatísticas de cada compilação em self.stats (ver pascal_stats):
+            None desativa, True mede tempos e contadores, 'memory' mede também a memória.
+            As funções em self.stats_hooks recebem o dicionário das estatísticas no fim de cada compilação.
+        """
+        self.lexer = None
+        self.ts = None
+        self.ast = None
+        self.cache = cache
+        self.options = dict(options or {})
+        self.reports = {} # relatórios das otimizações da última compilação
+        self.collect_stats = stats
+        self.stats = None # CompileStats da última compilação
+        self.stats_hooks = []
+
+    def reset(self):
+        """prepara a sessão para um novo programa (tabela de símbolos e linhas do zero)"""
+        from pascal_analex import lexer as lexer_base
+        from pascal_anasem import SymbolTable
+
+        if self.lexer is None:
+            self.lexer = lexer_base.clone()
+        self.ts = SymbolTable()
+        self.lexer.ts = self.ts # o parser vai buscar a tabela ao lexer (ver obter_ts)
+        self.lexer.lineno = 1
+        self.ast = None
+
+    def parse(self, source):
+        """
+        análise léxica, sintática e semântica. Devolve a AST (ou None se falhar).
+        :param source: o texto do programa, ou um iterável de blocos de texto
+            (ver pascal_analex.blocos_ficheiro), analisado por segmentos à medida que o parser avança
+        """
+        from pascal_anasin import parser
+        from pascal_analex import TokenStream
+
+        self.reset()
+        stream = None if isinstance(source, str) else TokenStream(self.lexer, source)
+        if self.stats is None:
+            if stream is None:
+                self.ast = parser.parse(source, lexer=self.lexer)
+            else:
+                self.ast = parser.parse(lexer=self.lexer, tokenfunc=stream.token)
+            return self.ast
+
+        # com estatísticas os tokens são contados à medida que o parser os pede (sem os guardar):
+        # o tempo do lexer aparece à parte na fase 'lex', mas está incluído na fase 'parse'
+        if stream is None:
+            self.lexer.input(source)
+            tokenfunc = self.lexer.token
+        else:
+            tokenfunc = stream.token
+        with self.stats.phase('parse'):
+            self.ast = parser.parse(lexer=self.lexer, tokenfunc=self.stats.count_tokens(tokenfunc))
+        if self.ast:
+            self.stats.count_ast(self.ast)
+        return self.ast
+
+    def phase(self, name):
+        """mede um bloco como fase (só com estatísticas)"""
+        return self.stats.phase(name) if self.stats is not None else nullcontext()
+
+    def compile(self, source):
+        """
+        Compila um programa Pascal completo.
+        Devolve a lista de instruções EWVM, ou None se a AST não foi gerada.
+        Com cache, um programa já compilado não volta a passar pelo parser nem pelo gerador.
+        """
+        return self._run(source)
+
+    def compile_file(self, path):
+        """
+        Compila um ficheiro sem o carregar inteiro: o texto é lido por blocos (mmap)
+        e os tokens são produzidos à medida que o parser os pede.
+        """
+        from pascal_analex import blocos_ficheiro
+        return self._run(lambda: blocos_ficheiro(path))
+
+    def _run(self, source):
+        """compilação com estatísticas. source: texto, ou função que devolve um iterador de blocos"""
+        self.reports = {}
+        self.stats = None
+        if self.collect_stats:
+            from pascal_stats import CompileStats
+            self.stats = CompileStats(memory=self.collect_stats == 'memory')
+        try:
+            code = self._compile(source)
+            if self.stats is not None:
+                if code is not None:
+                    self.stats.count_code(code)
+                if self.ts is not None:
+                    self.stats.counters['lookups'] = self.ts.lookups
+            return code
+        finally:
+            if self.stats is not None:
+                self.stats.finish()
+                for hook in self.stats_hooks:
+                    hook(self.stats.as_dict())
+
+    def _compile(self, source):
+        # um ficheiro é lido duas vezes (chave da cache e parse): source() abre os blocos de novo
+        text = isinstance(source, str)
+        key = None
+        if self.cache is not None:
+            with self.phase('cache'):
+                key = CompileCache.make_key(source if text else source(), VERSION, self.options)
+                code = self.cache.get(key)
+            if code is not None:
+                self.ts = None
+                self.ast = None
+                if self.stats is not None:
+                    self.stats.cache_hit = True
+                return code
+
+        ast = self.parse(source if text else source())
+        if not ast:
+            return None
+
+        from pascal_resolve import Resolver
+        from pascal_codegen import CodeGenerator
+        from pascal_ir import serialize
+
+        ast = self.transform(ast)
+        # cada identificador é resolvido uma vez, depois das passagens que reescrevem a AST
+        resolver = Resolver(self.options.get('reuse_slots', True))
+        with self.phase('resolve'):
+            ast = resolver.resolve(ast)
+        # um nome sem declaração que o parser não reportou vem de uma passagem sobre a AST:
+        # o gerador iria ignorá-lo em silêncio
+        if resolver.missing and self.errors == 0:
+            names = ", ".join(dict.fromkeys(resolver.missing))
+            self.ts.error(f"ERRO INTERNO: identificadores sem declaração depois das otimizações: {names}")
+            return None
+        with self.phase('codegen'):
+            codegen = CodeGenerator(ast, self.options.get('tail_calls', True))
+            code = codegen.generate()
+        self.reports['slots'] = codegen.report()
+        if codegen.tail_calls:
+            self.reports['tailcalls'] = codegen.tail_report()
+        code = self.optimize(code, codegen.entries.values())
+        # as otimizações trabalham sobre as instruções (pascal_ir); o texto EWVM só é escrito aqui
+        with self.phase('serialize'):
+            code = serialize(code, self.options.get('lines', False))
+
+        # só se guardam compilações sem erros
+        if key is not None and self.errors == 0:
+            self.cache.put(key, code)
+        return code
+
+    def transform(self, ast):
+        """otimizações sobre a AST, entre o parser e o gerador"""
+        if self.options.get('constfold', True):
+            from pascal_constfold import ConstantFolder
+
+            folder = ConstantFolder()
+            with self.phase('constfold'):
+                ast = folder.fold(ast)
+            self.reports['constfold'] = folder.report()
+
+        # depois da dobragem (os corpos já vêm simplificados) e antes do callgraph,
+        # que remove os subprogramas com todas as chamadas expandidas
+        if self.options.get('inline', True):
+            from pascal_inline import Inliner, DEFAULT_BUDGET
+
+            inliner = Inliner(self.options.get('inline_budget', DEFAULT_BUDGET),
+                              self.options.get('no_inline', ()))
+            with self.phase('inline'):
+                ast = inliner.inline(ast)
+            self.reports['inline'] = inliner.report()
+
+        # depois da dobragem: chamadas em ramos mortos já desapareceram
+        if self.options.get('prune', True):
+            from pascal_callgraph import CallGraph
+
+            with self.phase('callgraph'):
+                graph = CallGraph(ast)
+                ast = graph.prune()
+            self.reports['callgraph'] = graph.report()
+        return ast
+
+    def optimize(self, code, entries=()):
+        """
+        otimizações sobre a lista de instruções (pascal_ir.Instr), antes da escrita
+        :param entries: etiquetas de início dos subprogramas (as unidades do CFG; ficam mesmo sem chamadas)
+        """
+        if self.options.get('cfg', True):
+            from pascal_cfg import FlowOptimizer
+
+            flow = FlowOptimizer()
+            with self.phase('cfg'):
+                code = flow.optimize(code, entries)
+            self.reports['cfg'] = flow.report()
+
+        if self.options.get('peephole', True):
+            from pascal_peephole import PeepholeOptimizer
+
+            peephole = PeepholeOptimizer(self.options.get('peephole_rules'))
+            with self.phase('peephole'):
+                code = peephole.optimize(code, entries)
+            self.reports['peephole'] = peephole.report()
+        return code
+
+    @property
+    def errors(self):
+        """número de erros reportados na última compilação"""
+        return self.ts.errors if self.ts else 0
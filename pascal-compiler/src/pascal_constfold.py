@@ -0,0 +1,265 @@
+"""
+Dobragem e propagação de constantes sobre a AST (entre o parser e o CodeGenerator).
+- avalia subexpressões com literais INT/BOOL (aritmética, div/mod do Pascal, comparações, and, or, not)
+- propaga valores escalares conhecidos ao longo de código sequencial
+- elimina o ramo morto de um if com condição constante
+"""
+
+from pascal_ast import Node, Int, Bool
+
+
+def pascal_div(a, b):
+    """div do Pascal: trunca em direção a zero"""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+def pascal_mod(a, b):
+    """mod do Pascal: o resto tem o sinal do dividendo"""
+    return a - b * pascal_div(a, b)
+
+_ARITH = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b,
+    'DIV': lambda a, b: pascal_div(a, b) if b else None,
+    'MOD': lambda a, b: pascal_mod(a, b) if b else None,
+}
+
+_COMPARE = {
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+def make_int(value):
+    return Int(value)
+
+def make_bool(value):
+    return Bool('true' if value else 'false')
+
+def literal_value(node):
+    """valor Python de um literal INT/BOOL (ou None se não for literal)"""
+    if isinstance(node, Int):
+        return int(node.value)
+    if isinstance(node, Bool):
+        return str(node.value).lower() == 'true'
+    return None
+
+def is_literal(node):
+    return isinstance(node, (Int, Bool))
+
+
+# funções predefinidas sem efeitos laterais
+PURE_BUILTINS = {'length'}
+
+def contains_call(node):
+    """True se a expressão/comando contém alguma chamada (que pode alterar variáveis)"""
+    if isinstance(node, Node):
+        if node.kind in ('CALL_EXP', 'CALL_STMT') and node.name.lower() not in PURE_BUILTINS:
+            return True
+        return any(contains_call(child) for child in node.children())
+    if isinstance(node, list):
+        return any(contains_call(child) for child in node)
+    return False
+
+def assigned_vars(node, found=None):
+    """
+    nomes (minúsculas) das variáveis escalares alteradas por um comando
+    (também dentro das expressões: os comandos das funções expandidas, INLINE_EXP)
+    """
+    if found is None:
+        found = set()
+    if isinstance(node, list):
+        for child in node:
+            assigned_vars(child, found)
+    elif isinstance(node, Node):
+        kind = node.kind
+        if kind == 'ASSIGN':
+            found.add(node.name.lower())
+        elif kind == 'FOR':
+            found.add(node.var.lower())
+        elif kind == 'READLN':
+            for target in node.args:
+                if isinstance(target, Node) and target.kind == 'ID':
+                    found.add(target.name.lower())
+        for child in node.children():
+            assigned_vars(child, found)
+    return found
+
+
+class ConstantFolder:
+    def __init__(self):
+        self.folded = 0      # subexpressões avaliadas em tempo de compilação
+        self.propagated = 0  # usos de variáveis substituídos pelo valor conhecido
+        self.branches = 0    # ifs com condição constante resolvidos
+        self.current_sub = None
+
+    def fold(self, ast):
+        """devolve uma nova AST com as constantes dobradas e propagadas"""
+        if not ast or ast.kind != 'PROGRAM':
+            return ast
+        defs = [self.fold_definition(d) for d in ast.defs]
+        self.current_sub = None
+        body = self.stmt(ast.body, {})
+        return ast.replace(defs=defs, body=body)
+
+    def fold_definition(self, node):
+        if node.kind in ('FUNCTION', 'PROCEDURE'):
+            defs = [self.fold_definition(d) for d in node.defs]
+            self.current_sub = node.name.lower()
+            body = self.stmt(node.body, {})
+            return node.replace(defs=defs, body=body)
+        return node
+
+    def report(self):
+        return (f"constfold: {self.folded} subexpressões dobradas, {self.propagated} valores propagados, "
+                f"{self.branches} ifs constantes")
+
+    #expressões
+    def expr(self, node, env):
+        if not isinstance(node, Node):
+            return node
+        kind = node.kind
+
+        if kind == 'ID':
+            value = env.get(node.name.lower())
+            if value is not None:
+                self.propagated += 1
+                return value
+            return node
+
+        if kind == 'BINOP':
+            left = self.expr(node.left, env)
+            right = self.expr(node.right, env)
+            folded = self.fold_binop(node.op, left, right)
+            if folded is not None:
+                self.folded += 1
+                return folded
+            return node.replace(left=left, right=right)
+
+        if kind == 'UNOP':
+            operand = self.expr(node.expr, env)
+            if node.op == 'NOT' and operand.kind == 'BOOL':
+                self.folded += 1
+                return make_bool(not literal_value(operand))
+            return node.replace(expr=operand)
+
+        if kind == 'ARRAY_ACCESS':
+            return node.replace(index=self.expr(node.index, env))
+
+        if kind == 'CALL_EXP':
+            return node.replace(args=[self.expr(a, env) for a in node.args])
+
+        return node
+
+    def fold_binop(self, op, left, right):
+        a = literal_value(left)
+        b = literal_value(right)
+        if a is None or b is None:
+            return None
+
+        if op in _ARITH and left.kind == 'INT' and right.kind == 'INT':
+            r = _ARITH[op](a, b)
+            return make_int(r) if r is not None else None
+        if op in _COMPARE and left.kind == right.kind:
+            return make_bool(_COMPARE[op](a, b))
+        if op == 'AND' and left.kind == right.kind == 'BOOL':
+            return make_bool(a and b)
+        if op == 'OR' and left.kind == right.kind == 'BOOL':
+            return make_bool(a or b)
+        return None
+
+    def expr_stmt(self, node, env):
+        """expressão dentro de um comando: se tiver chamadas, esquece tudo o que se sabia"""
+        if contains_call(node):
+            env.clear()
+        return self.expr(node, env)
+
+    #comandos
+    def stmt(self, node, env):
+        if not isinstance(node, Node):
+            return node
+        kind = node.kind
+
+        if kind == 'BLOCK':
+            return node.replace(cmds=[self.stmt(cmd, env) for cmd in node.cmds])
+
+        if kind == 'ASSIGN':
+            value = self.expr_stmt(node.expr, env)
+            name = node.name.lower()
+            # só variáveis escalares (o nome da função é o valor de retorno, não se propaga)
+            if is_literal(value) and name != self.current_sub:
+                env[name] = value
+            else:
+                env.pop(name, None)
+            return node.replace(expr=value)
+
+        if kind == 'ARRAY_ASSIGN':
+            idx = self.expr_stmt(node.index, env)
+            val = self.expr_stmt(node.value, env)
+            return node.replace(index=idx, value=val)
+
+        if kind == 'READLN':
+            args = [self.expr_stmt(a, env) if isinstance(a, Node) and a.kind == 'ARRAY_ACCESS' else a
+                    for a in node.args]
+            for name in assigned_vars(node):
+                env.pop(name, None)
+            return node.replace(args=args)
+
+        if kind == 'WRITELN':
+            return node.replace(args=[self.expr_stmt(a, env) for a in node.args])
+
+        if kind == 'CALL_STMT':
+            # os argumentos são avaliados antes da chamada; depois dela nada se sabe
+            args = [self.expr_stmt(a, env) for a in node.args]
+            env.clear()
+            return node.replace(args=args)
+
+        if kind == 'IF':
+            cond = self.expr_stmt(node.cond, env)
+            if cond.kind == 'BOOL':
+                # ramo morto eliminado
+                self.branches += 1
+                chosen = node.then if literal_value(cond) else node.other
+                return self.stmt(chosen, env) if chosen else None
+
+            env_then = dict(env)
+            env_else = dict(env)
+            then = self.stmt(node.then, env_then)
+            other = self.stmt(node.other, env_else) if node.other else None
+            # depois do if só se mantém o que é igual nos dois caminhos
+            merged = {k: v for k, v in env_then.items() if env_else.get(k) == v}
+            env.clear()
+            env.update(merged)
+            return node.replace(cond=cond, then=then, other=other)
+
+        if kind == 'WHILE':
+            self.kill_loop([node.cond, node.body], env)
+            cond = self.expr(node.cond, env)
+            if cond.kind == 'BOOL' and not literal_value(cond):
+                self.branches += 1
+                return None
+            body = self.stmt(node.body, dict(env))
+            return node.replace(cond=cond, body=body)
+
+        if kind == 'FOR':
+            start = self.expr_stmt(node.start, env)
+            end = self.expr_stmt(node.end, env)
+            self.kill_loop(node.body, env)
+            env.pop(node.var.lower(), None)
+            body = self.stmt(node.body, dict(env))
+            return node.replace(start=start, end=end, body=body)
+
+        return node
+
+    def kill_loop(self, body, env):
+        """antes de um ciclo: esquece as variáveis que o corpo (ou a condição) altera"""
+        if contains_call(body):
+            env.clear()
+            return
+        for name in assigned_vars(body):
+            env.pop(name, None)
@@ -0,0 +1,285 @@
+"""
+Expansão inline de funções e procedimentos pequenos (entre a dobragem de constantes e o callgraph).
+- só se expandem folhas: subprogramas sem chamadas (logo não recursivos), com parâmetros e
+  variáveis locais escalares e cujo corpo não passa do orçamento (nº de nós da AST)
+- os subprogramas são tratados pela ordem de declaração: um subprograma que só chamava folhas
+  passa a folha depois das suas chamadas expandidas, e pode ser expandido nos seguintes
+- cada expansão tem variáveis novas (TEMP_BLOCK do chamador) para os parâmetros, as variáveis
+  locais e o resultado: o Resolver dá-lhes slots, partilhados segundo os tempos de vida
+- um parâmetro que o corpo não altera, passado como variável ou literal, é lido diretamente
+  (durante o corpo ninguém pode alterar essa variável); um parâmetro usado pelo nome
+  (s[i] numa string, por exemplo) só é trocado por uma variável, que fica com o seu nome
+- uma chamada de procedimento passa a um BLOCK; uma chamada de função numa expressão passa a um
+  INLINE_EXP, que executa os comandos no ponto da chamada (a ordem de avaliação não muda)
+Os subprogramas cujas chamadas foram todas expandidas são depois removidos pelo callgraph.
+"""
+from pascal_ast import Node, ArrayType, Assign, Block, Decl, Id, Int, InlineExp, TempBlock
+from pascal_constfold import contains_call, assigned_vars
+from pascal_liveness import LiveRanges
+
+# orçamento por omissão: nº máximo de nós da AST no corpo de um subprograma expandido
+DEFAULT_BUDGET = 40
+
+# campo com o nome da variável em cada tipo de nó (renomeado nas cópias do corpo)
+_VARIABLE = {
+    'ID': 'name',
+    'ARRAY_ACCESS': 'name',
+    'ASSIGN': 'name',
+    'ARRAY_ASSIGN': 'name',
+    'FOR': 'var',
+}
+
+
+def size(node):
+    """nº de nós da AST"""
+    if isinstance(node, Node):
+        return 1 + sum(size(child) for child in node.children())
+    if isinstance(node, list):
+        return sum(size(child) for child in node)
+    return 0
+
+def variables(node, found=None):
+    """nomes (minúsculas) de todas as variáveis lidas ou escritas num comando"""
+    if found is None:
+        found = set()
+    if isinstance(node, Node):
+        field = _VARIABLE.get(node.kind)
+        if field is not None:
+            found.add(getattr(node, field).lower())
+        for child in node.children():
+            variables(child, found)
+    elif isinstance(node, list):
+        for child in node:
+            variables(child, found)
+    elif isinstance(node, str):
+        found.add(node.lower()) # readln de uma variável guardada só pelo nome
+    return found
+
+def named(node, found=None):
+    """nomes (minúsculas) das variáveis usadas pelo nome e não como valor (v[i], for, readln)"""
+    if found is None:
+        found = set()
+    if isinstance(node, Node):
+        field = _VARIABLE.get(node.kind)
+        if field is not None and node.kind != 'ID':
+            found.add(getattr(node, field).lower())
+        for child in node.children():
+            named(child, found)
+    elif isinstance(node, list):
+        for child in node:
+            named(child, found)
+    elif isinstance(node, str):
+        found.add(node.lower())
+    return found
+
+def renamed(node, names, values):
+    """
+    cópia de um comando com as variáveis de names (minúsculas -> nome novo) trocadas
+    e as leituras das de values (minúsculas -> expressão) substituídas pela expressão
+    (onde a variável é usada pelo nome, a expressão de values tem de ser um ID: fica o nome dele)
+    """
+    if isinstance(node, list):
+        return [renamed(child, names, values) for child in node]
+    if isinstance(node, str):
+        return rename(node, names, values)
+    if not isinstance(node, Node):
+        return node
+    if node.kind == 'ID' and node.name.lower() in values:
+        return values[node.name.lower()].replace()
+    changes = {link: renamed(getattr(node, link), names, values) for link in node.links}
+    field = _VARIABLE.get(node.kind)
+    if field is not None:
+        changes[field] = rename(getattr(node, field), names, values)
+    return node.replace(**changes)
+
+def rename(name, names, values):
+    value = values.get(name.lower())
+    if value is not None:
+        return value.name
+    return names.get(name.lower(), name)
+
+def declared(decls):
+    """(nome, tipo) de cada nome de uma lista de DECL"""
+    return [(name, decl.type) for decl in decls for name in decl.names]
+
+
+class Inliner:
+    def __init__(self, budget=DEFAULT_BUDGET, exclude=()):
+        """
+        :param budget: nº máximo de nós no corpo de um subprograma para ser expandido
+        :param exclude: nomes dos subprogramas que nunca são expandidos (--no-inline)
+        """
+        self.budget = budget
+        self.exclude = {name.lower() for name in exclude}
+        self.candidates = {} # nome (minúsculas) -> dados do subprograma expansível
+        self.expanded = {}   # nome (como declarado) -> nº de chamadas expandidas
+        self.counter = 0     # sufixo das variáveis de cada expansão
+        self.local = set()   # nomes locais do chamador atual (não podem esconder globais do corpo)
+        self.temps = []      # DECL das variáveis novas do chamador atual
+
+    def inline(self, ast):
+        """devolve uma nova AST com as chamadas aos subprogramas pequenos expandidas"""
+        if not ast or ast.kind != 'PROGRAM':
+            return ast
+        defs = []
+        for definition in ast.defs:
+            definition = self.inline_definition(definition)
+            defs.append(definition)
+            if definition.kind in ('FUNCTION', 'PROCEDURE'):
+                candidate = self.candidate(definition)
+                if candidate is not None:
+                    self.candidates[definition.name.lower()] = candidate
+
+        self.local = set()
+        body = self.caller_body(ast.body)
+        return ast.replace(defs=self.with_temps(defs), body=body)
+
+    def inline_definition(self, node):
+        # os subprogramas aninhados não são gerados: ficam como estão
+        if node.kind not in ('FUNCTION', 'PROCEDURE'):
+            return node
+        self.local = {name.lower() for name, _ in declared(node.params)}
+        self.local.add(node.name.lower())
+        for definition in node.defs:
+            if definition.kind == 'VAR_BLOCK':
+                self.local.update(name.lower() for name, _ in declared(definition.decls))
+            elif definition.kind in ('FUNCTION', 'PROCEDURE'):
+                self.local.add(definition.name.lower())
+        body = self.caller_body(node.body)
+        if body is node.body:
+            return node
+        return node.replace(defs=self.with_temps(node.defs), body=body)
+
+    def caller_body(self, body):
+        self.temps = []
+        if not self.candidates:
+            return body
+        return self.rewrite(body)
+
+    def with_temps(self, defs):
+        """declarações do chamador com as variáveis novas das expansões (se houve alguma)"""
+        if not self.temps:
+            return defs
+        return list(defs) + [TempBlock(self.temps)]
+
+    def report(self):
+        if not self.expanded:
+            return f"inline: nenhuma chamada expandida ({len(self.candidates)} subprogramas expansíveis)"
+        total = sum(self.expanded.values())
+        detail = ", ".join(f"{name} {n}" for name, n in self.expanded.items())
+        return f"inline: {total} chamadas expandidas ({detail})"
+
+    def candidate(self, node):
+        """dados de um subprograma que pode ser expandido (ou None)"""
+        name = node.name.lower()
+        if name in self.exclude:
+            return None
+        params = declared(node.params)
+        local_vars = []
+        for definition in node.defs:
+            if definition.kind not in ('VAR_BLOCK', 'TEMP_BLOCK'):
+                return None # subprogramas aninhados
+            local_vars += declared(definition.decls)
+        own = [n.lower() for n, _ in params + local_vars]
+        if node.kind == 'FUNCTION':
+            own.append(name)
+        # um nome repetido (parâmetro e variável local) mudaria de significado
+        if len(set(own)) != len(own):
+            return None
+        if any(isinstance(t, ArrayType) for _, t in params + local_vars):
+            return None
+        if contains_call(node.body) or size(node.body) > self.budget:
+            return None
+        # só altera as suas próprias variáveis (as globais ficam como estão à volta da chamada)
+        assigned = assigned_vars(node.body)
+        if not assigned <= set(own):
+            return None
+
+        # variáveis que uma chamada nova encontraria a 0 (PUSHN / PUSHI 0 do chamador)
+        zero = [n.lower() for n, _ in local_vars]
+        if node.kind == 'FUNCTION':
+            zero.append(name)
+        live = LiveRanges(node.body, set(zero))
+        zero = [n for n in zero if n in live.uninit or (n == name and n not in live.exit)]
+        # função cujo corpo é só a atribuição do resultado: a expansão vale a própria expressão
+        result = None
+        cmds = node.body.cmds if node.body.kind == 'BLOCK' else [node.body]
+        if (node.kind == 'FUNCTION' and len(cmds) == 1 and cmds[0].kind == 'ASSIGN'
+                and cmds[0].name.lower() == name and name not in variables(cmds[0].expr)):
+            result = cmds[0].expr
+        return {
+            'node': node,
+            'params': params,
+            'locals': local_vars,
+            'free': variables(node.body) - set(own),
+            'assigned': assigned,
+            'named': named(node.body),
+            'zero': zero,
+            'result': result,
+        }
+
+    def rewrite(self, node):
+        """reescreve um comando ou expressão do chamador (os argumentos são expandidos primeiro)"""
+        if isinstance(node, list):
+            new = [self.rewrite(child) for child in node]
+            return node if all(a is b for a, b in zip(new, node)) else new
+        if not isinstance(node, Node):
+            return node
+        changes = {}
+        for link in node.links:
+            value = getattr(node, link)
+            if value is not None:
+                new = self.rewrite(value)
+                if new is not value:
+                    changes[link] = new
+        if changes:
+            node = node.replace(**changes)
+        if node.kind in ('CALL_EXP', 'CALL_STMT'):
+            return self.expand(node)
+        return node
+
+    def expand(self, call):
+        """corpo do subprograma no lugar da chamada (ou a própria chamada, se não puder ser)"""
+        candidate = self.candidates.get(call.name.lower())
+        if candidate is None:
+            return call
+        sub = candidate['node']
+        is_function = sub.kind == 'FUNCTION'
+        if (is_function != (call.kind == 'CALL_EXP') or len(call.args) != len(candidate['params'])
+                or call.name.lower() in self.local or candidate['free'] & self.local):
+            return call
+
+        # parâmetros lidos diretamente do argumento (um literal não pode ser usado pelo nome)
+        values = {}
+        for (name, _), arg in zip(candidate['params'], call.args):
+            key = name.lower()
+            if key in candidate['assigned']:
+                continue
+            if arg.kind == 'ID' or (arg.kind in ('INT', 'BOOL') and key not in candidate['named']):
+                values[key] = arg
+
+        # variáveis novas desta expansão ('$' não pode aparecer num identificador Pascal)
+        self.counter += 1
+        names = {}
+        own = [(name, t) for name, t in candidate['params'] if name.lower() not in values]
+        if is_function and candidate['result'] is None:
+            own.append((sub.name, sub.rettype))
+        for name, type_info in own + candidate['locals']:
+            names[name.lower()] = f"{name.lower()}${self.counter}"
+            self.temps.append(Decl([names[name.lower()]], type_info))
+
+        # argumentos pela ordem da chamada, depois as variáveis que a chamada encontraria a 0
+        cmds = [Assign(names[name.lower()], arg) for (name, _), arg in zip(candidate['params'], call.args)
+                if name.lower() not in values]
+        cmds += [Assign(names[name], Int(0)) for name in candidate['zero']]
+        self.expanded[sub.name] = self.expanded.get(sub.name, 0) + 1
+
+        if candidate['result'] is not None:
+            # sem variável para o resultado (seria escrita e lida logo a seguir)
+            expr = renamed(candidate['result'], names, values)
+            return InlineExp(sub.name, cmds, expr, sub.rettype) if cmds else expr
+        cmds.append(renamed(sub.body, names, values))
+        if is_function:
+            result = names[sub.name.lower()]
+            return InlineExp(sub.name, cmds, Id(result, sub.rettype), sub.rettype)
+        return Block(cmds)
@@ -0,0 +1,137 @@
+"""
+Representação intermédia do código gerado, entre o CodeGenerator e o texto EWVM.
+- Op: opcodes da máquina de pilha usados pelo gerador (o valor é a mnemónica EWVM);
+  Op.LABEL é a pseudo-instrução que marca a posição de uma etiqueta
+- Label: etiqueta (destino de JUMP/JZ ou subprograma chamado com PUSHA), comparada por identidade
+- Instr: uma instrução com o operando já no seu tipo (int, str do PUSHS ou Label)
+  e a linha do comando Pascal que a gerou
+As otimizações sobre o código (pascal_cfg, pascal_peephole) trabalham sobre listas de Instr;
+só serialize escreve o texto.
+"""
+from enum import Enum
+
+
+class Op(Enum):
+    LABEL = ':'
+    START = 'START'
+    STOP = 'STOP'
+    # pilha e variáveis
+    PUSHI = 'PUSHI'
+    PUSHS = 'PUSHS'
+    PUSHG = 'PUSHG'
+    PUSHL = 'PUSHL'
+    STOREG = 'STOREG'
+    STOREL = 'STOREL'
+    PUSHN = 'PUSHN'
+    POP = 'POP'
+    DUP = 'DUP'
+    # aritmética, comparações e lógica
+    ADD = 'ADD'
+    SUB = 'SUB'
+    MUL = 'MUL'
+    DIV = 'DIV'
+    MOD = 'MOD'
+    EQUAL = 'EQUAL'
+    INF = 'INF'
+    INFEQ = 'INFEQ'
+    SUP = 'SUP'
+    SUPEQ = 'SUPEQ'
+    AND = 'AND'
+    OR = 'OR'
+    NOT = 'NOT'
+    # controlo
+    JUMP = 'JUMP'
+    JZ = 'JZ'
+    PUSHA = 'PUSHA'
+    CALL = 'CALL'
+    RETURN = 'RETURN'
+    # entrada e saída
+    READ = 'READ'
+    ATOI = 'ATOI'
+    WRITES = 'WRITES'
+    WRITEI = 'WRITEI'
+    WRITELN = 'WRITELN'
+    # heap e strings
+    ALLOCN = 'ALLOCN'
+    STOREN = 'STOREN'
+    STORE = 'STORE'
+    LOADN = 'LOADN'
+    LOAD = 'LOAD'
+    CHARAT = 'CHARAT'
+    STRLEN = 'STRLEN'
+
+    def __init__(self, mnemonic):
+        # texto já formatado de cada opcode (sem operando / antes do operando), para o serialize
+        self.text = mnemonic if mnemonic in ('START', 'STOP') else f"\t{mnemonic}"
+        self.prefix = f"\t{mnemonic} "
+
+    def __repr__(self):
+        return self.value
+
+
+# saltos (o operando é uma Label) e instruções que terminam uma unidade
+JUMPS = (Op.JUMP, Op.JZ)
+ENDS = (Op.RETURN, Op.STOP)
+
+
+class Label:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+class Instr:
+    __slots__ = ('op', 'arg', 'line')
+
+    def __init__(self, op, arg=None, line=None):
+        """
+        :param op: Op
+        :param arg: operando (None nas instruções sem operando)
+        :param line: linha do programa Pascal (None nas instruções sem comando de origem)
+        """
+        self.op = op
+        self.arg = arg
+        self.line = line
+
+    def __repr__(self):
+        return format_instr(self).strip()
+
+
+def escape(text):
+    """texto de um PUSHS entre aspas: \\ e " são escritos com uma barra antes (\\\\ e \\")"""
+    return text.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def format_instr(ins):
+    """uma linha de texto EWVM: 'L1:', 'START', '\\tPUSHI 1', '\\tPUSHS "texto"'"""
+    op, arg = ins.op, ins.arg
+    if arg is None:
+        return op.text
+    if op is Op.LABEL:
+        return f"{arg.name}:"
+    if type(arg) is int:
+        return f"{op.prefix}{arg}"
+    if op is Op.PUSHS:
+        return f'{op.prefix}"{escape(arg)}"'
+    return op.prefix + arg.name
+
+def serialize(instrs, lines=False):
+    """
+    lista de linhas de texto EWVM (ver pascal_codegen.code_to_text).
+    :param lines: antes de cada instrução de um comando noutra linha do programa,
+        um comentário '// linha N'
+    """
+    if not lines:
+        return [format_instr(ins) for ins in instrs]
+    out = []
+    current = None
+    for ins in instrs:
+        if ins.line is not None and ins.line != current and ins.op is not Op.LABEL:
+            current = ins.line
+            out.append(f"// linha {current}")
+        out.append(format_instr(ins))
+    return out
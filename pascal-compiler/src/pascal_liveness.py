@@ -0,0 +1,268 @@
+"""
+Tempo de vida (liveness) das variáveis locais de um subprograma e atribuição de slots do frame.
+Variáveis (e temporários do gerador) com tempos de vida disjuntos partilham o mesmo offset.
+"""
+from bisect import bisect_right
+from heapq import heappush, heappop
+from pascal_ast import Node
+
+# fim de um intervalo que dura o frame inteiro
+INFINITO = float('inf')
+
+
+def names_in(node, found=None):
+    """nomes (minúsculas) de todas as variáveis lidas numa expressão (ou lista de expressões)"""
+    if found is None:
+        found = []
+    if isinstance(node, Node):
+        if node.kind in ('ID', 'ARRAY_ACCESS'):
+            found.append(node.name.lower())
+        for child in node.children():
+            names_in(child, found)
+    elif isinstance(node, list):
+        for child in node:
+            names_in(child, found)
+    return found
+
+
+def inline_exps(node, found=None):
+    """
+    funções expandidas (INLINE_EXP) de uma expressão, pela ordem de avaliação
+    (as que estão dentro dos comandos de outra ficam para quando esses comandos forem percorridos)
+    """
+    if found is None:
+        found = []
+    if isinstance(node, Node):
+        if node.kind == 'INLINE_EXP':
+            found.append(node)
+        else:
+            for child in node.children():
+                inline_exps(child, found)
+    elif isinstance(node, list):
+        for child in node:
+            inline_exps(child, found)
+    return found
+
+
+class LiveRanges:
+    def __init__(self, body, names):
+        """
+        Numera os comandos do corpo por ordem (o ponto 0 é a entrada no frame)
+        e calcula o intervalo [inicio, fim] de cada variável de names.
+        - uma variável usada dentro de um ciclo fica viva durante o ciclo inteiro
+        - uma variável que pode ser lida antes de ser atribuída fica viva desde o ponto 0
+          (ninguém pode ter deixado lá um valor antigo)
+        :param names: nomes (minúsculas) das variáveis escalares locais
+        """
+        self.names = names
+        self.ranges = {} # nome -> [inicio, fim]
+        self.loops = {}  # id do nó WHILE/FOR -> (inicio, fim)
+        self.uninit = set() # lidas (talvez) antes da primeira atribuição
+        self.point = 0
+        self.exit = self.stmt(body, frozenset()) # de certeza atribuídas no fim do corpo
+
+        self.extend_loops()
+        for name in self.uninit:
+            self.ranges[name][0] = 0
+
+    def next_point(self):
+        self.point += 1
+        return self.point
+
+    def touch(self, name, point):
+        interval = self.ranges.get(name)
+        if interval is None:
+            self.ranges[name] = [point, point]
+        else:
+            interval[1] = max(interval[1], point)
+
+    def use(self, expr, defined, point):
+        for name in names_in(expr):
+            if name in self.names:
+                self.touch(name, point)
+                if name not in defined:
+                    self.uninit.add(name)
+
+    def define(self, name, defined, point):
+        name = name.lower()
+        if name not in self.names:
+            return defined
+        self.touch(name, point)
+        return defined | {name}
+
+    def inlined(self, expr, defined):
+        """os comandos das funções expandidas numa expressão executam antes do comando que a usa"""
+        for node in inline_exps(expr):
+            defined = self.stmt(node.cmds, defined)
+        return defined
+
+    def loop(self, node, start):
+        """regista o intervalo de um ciclo (de start até ao ponto atual)"""
+        self.loops[id(node)] = (start, self.point)
+
+    def extend_loops(self):
+        """
+        o ciclo volta ao início: tudo o que é usado lá dentro vive até ao fim do ciclo.
+        Os ciclos são encaixados ou disjuntos, por isso basta o ciclo mais exterior
+        que contém o primeiro uso e o que contém o último (uma só passagem pelas variáveis).
+        """
+        outer = [] # ciclos que não estão dentro de outro, por ordem
+        for start, end in sorted(self.loops.values(), key=lambda loop: (loop[0], -loop[1])):
+            if not outer or start > outer[-1][1]:
+                outer.append((start, end))
+        starts = [start for start, _ in outer]
+
+        for interval in self.ranges.values():
+            i = bisect_right(starts, interval[0]) - 1
+            if i >= 0 and interval[0] <= outer[i][1]:
+                interval[0] = outer[i][0]
+            i = bisect_right(starts, interval[1]) - 1
+            if i >= 0 and interval[1] <= outer[i][1]:
+                interval[1] = outer[i][1]
+
+    def stmt(self, node, defined):
+        """
+        percorre um comando; defined são as variáveis de certeza já atribuídas.
+        Devolve as variáveis de certeza atribuídas depois do comando.
+        """
+        if isinstance(node, list):
+            for child in node:
+                defined = self.stmt(child, defined)
+            return defined
+        if not isinstance(node, Node):
+            return defined
+        kind = node.kind
+
+        if kind == 'BLOCK':
+            return self.stmt(node.cmds, defined)
+
+        if kind == 'IF':
+            defined = self.inlined(node.cond, defined)
+            self.use(node.cond, defined, self.next_point())
+            after_then = self.stmt(node.then, defined)
+            after_else = self.stmt(node.other, defined) if node.other else defined
+            return after_then & after_else
+
+        # o corpo de um ciclo pode nunca executar: o que lá é atribuído não conta depois
+        # (a condição do while é avaliada pelo menos uma vez)
+        if kind == 'WHILE':
+            start = self.next_point()
+            defined = self.inlined(node.cond, defined)
+            self.use(node.cond, defined, self.point)
+            self.stmt(node.body, defined)
+            self.loop(node, start)
+            return defined
+
+        if kind == 'FOR':
+            defined = self.inlined([node.start, node.end], defined)
+            start = self.next_point()
+            self.use([node.start, node.end], defined, start)
+            defined = self.define(node.var, defined, start)
+            self.stmt(node.body, defined)
+            self.loop(node, start)
+            return defined
+
+        if kind == 'ASSIGN':
+            defined = self.inlined(node.expr, defined)
+            point = self.next_point()
+            self.use(node.expr, defined, point)
+            return self.define(node.name, defined, point)
+
+        if kind == 'READLN':
+            defined = self.inlined(node.args, defined)
+            point = self.next_point()
+            for var in node.args:
+                if isinstance(var, Node) and var.kind == 'ARRAY_ACCESS':
+                    self.use(var, defined, point)
+                else:
+                    defined = self.define(var.name if isinstance(var, Node) else var, defined, point)
+            return defined
+
+        # restantes comandos (ARRAY_ASSIGN, WRITELN, CALL_STMT) só leem
+        defined = self.inlined(list(node.children()), defined)
+        self.use(list(node.children()), defined, self.next_point())
+        return defined
+
+
+class SlotAllocator:
+    def __init__(self, fixed=0, reuse=True):
+        """
+        slots de um frame, atribuídos por linear scan: os intervalos chegam por ordem de início
+        (variáveis do Resolver) e cada um fica com o slot livre de menor offset.
+        Os temporários do gerador chegam depois, fora de ordem: procuram o primeiro slot
+        livre durante todo o intervalo.
+        :param fixed: nº de slots ocupados durante o frame inteiro (ex.: as variáveis globais)
+        :param reuse: sem partilha cada intervalo fica com um slot novo
+        """
+        self.fixed = fixed
+        self.reuse = reuse
+        self.starts = [] # por slot partilhável (offset fixed + i): inícios dos intervalos, ordenados
+        self.ends = []   # e os fins correspondentes (o último é o fim da ocupação do slot)
+        self.point = 0   # maior início já alocado por ordem
+        self.active = [] # heap (fim, i) dos slots ocupados no ponto atual
+        self.free = []   # heap dos i livres no ponto atual (entradas obsoletas são ignoradas)
+        self.requested = fixed # nº de slots que seriam precisos sem partilha
+
+    def allocate(self, interval):
+        """slot livre durante todo o intervalo (ou um slot novo). Devolve o offset."""
+        start, end = interval
+        self.requested += 1
+        if not self.reuse:
+            return self.new_slot(start, end)
+        if start < self.point:
+            return self.first_fit(start, end)
+
+        self.point = start
+        # os slots cujo último intervalo já acabou ficam livres
+        while self.active and self.active[0][0] < start:
+            last, i = heappop(self.active)
+            if self.ends[i][-1] == last:
+                heappush(self.free, i)
+        while self.free:
+            i = heappop(self.free)
+            if self.ends[i][-1] < start:
+                self.starts[i].append(start)
+                self.ends[i].append(end)
+                heappush(self.active, (end, i))
+                return self.fixed + i
+        return self.new_slot(start, end)
+
+    def first_fit(self, start, end):
+        """primeiro slot sem nenhum intervalo que se sobreponha a [start, end]"""
+        for i, (starts, ends) in enumerate(zip(self.starts, self.ends)):
+            k = bisect_right(starts, end)
+            if k == 0 or ends[k - 1] < start:
+                starts.insert(k, start)
+                ends.insert(k, end)
+                if k == len(ends) - 1:
+                    self.occupy(i, end)
+                return self.fixed + i
+        return self.new_slot(start, end)
+
+    def new_slot(self, start, end):
+        self.starts.append([start])
+        self.ends.append([end])
+        self.occupy(len(self.ends) - 1, end)
+        return self.fixed + len(self.ends) - 1
+
+    def occupy(self, i, end):
+        """o slot i está ocupado até end: livre ou ativo no ponto atual"""
+        if end < self.point:
+            heappush(self.free, i)
+        else:
+            heappush(self.active, (end, i))
+
+    def copy(self):
+        """cópia independente (o gerador continua a alocar temporários sobre a disposição do Resolver)"""
+        other = SlotAllocator(self.fixed, self.reuse)
+        other.starts = [list(starts) for starts in self.starts]
+        other.ends = [list(ends) for ends in self.ends]
+        other.point = self.point
+        other.active = list(self.active)
+        other.free = list(self.free)
+        other.requested = self.requested
+        return other
+
+    @property
+    def size(self):
+        return self.fixed + len(self.ends)
@@ -0,0 +1,231 @@
+"""
+Otimizador peephole sobre a lista de instruções (pascal_ir.Instr).
+Percorre o código uma vez por passagem, aplicando as regras da tabela RULES ao fim
+do código já otimizado, até uma passagem não mudar nada.
+"""
+from pascal_ir import Op, Instr
+
+
+def _int(ins):
+    """valor de um PUSHI (ou None)"""
+    return ins.arg if ins.op is Op.PUSHI else None
+
+def _div(a, b):
+    # divisão inteira truncada (div do Pascal / DIV da VM)
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+_FOLD = {
+    Op.ADD: lambda a, b: a + b,
+    Op.SUB: lambda a, b: a - b,
+    Op.MUL: lambda a, b: a * b,
+    Op.DIV: lambda a, b: _div(a, b) if b else None,
+    Op.MOD: lambda a, b: a - b * _div(a, b) if b else None,
+}
+
+# cada regra olha para o fim do código já otimizado (out) e devolve None ou (n, substituição)
+# para as últimas n instruções; as instruções novas ficam com a linha da primeira substituída
+
+def rule_fold_const(out):
+    """PUSHI a / PUSHI b / op  ->  PUSHI (a op b)   (ex.: índice constante menos 1)"""
+    if len(out) < 3:
+        return None
+    a, b, op = _int(out[-3]), _int(out[-2]), out[-1].op
+    if a is None or b is None or op not in _FOLD:
+        return None
+    r = _FOLD[op](a, b)
+    if r is None:
+        return None
+    return 3, [Instr(Op.PUSHI, r, out[-3].line)]
+
+def rule_add_zero(out):
+    """PUSHI 0 / ADD  e  PUSHI 0 / SUB  ->  (nada)"""
+    if len(out) >= 2 and _int(out[-2]) == 0 and out[-1].op in (Op.ADD, Op.SUB):
+        return 2, []
+    return None
+
+def rule_mul_one(out):
+    """PUSHI 1 / MUL  e  PUSHI 1 / DIV  ->  (nada)"""
+    if len(out) >= 2 and _int(out[-2]) == 1 and out[-1].op in (Op.MUL, Op.DIV):
+        return 2, []
+    return None
+
+def rule_strength(out):
+    """
+    redução de força (a VM não tem shifts, só se troca quando não aumenta o nº de instruções):
+    PUSHI 2 / MUL -> DUP 1 / ADD;  x / PUSHI 0 / MUL -> PUSHI 0;  x / PUSHI 1 / MOD -> PUSHI 0
+    (x tem de ser um PUSHI/PUSHG/PUSHL, sem efeitos laterais)
+    """
+    if len(out) < 2:
+        return None
+    k, op = _int(out[-2]), out[-1].op
+    if len(out) >= 3 and out[-3].op in (Op.PUSHI, Op.PUSHG, Op.PUSHL):
+        if (k == 0 and op is Op.MUL) or (k == 1 and op is Op.MOD):
+            return 3, [Instr(Op.PUSHI, 0, out[-3].line)]
+    if k == 2 and op is Op.MUL:
+        line = out[-2].line
+        return 2, [Instr(Op.DUP, 1, line), Instr(Op.ADD, None, line)]
+    return None
+
+def rule_jump_next(out):
+    """JUMP Lx seguido (só com etiquetas pelo meio) de Lx:  ->  sem o JUMP"""
+    if not out or out[-1].op is not Op.LABEL:
+        return None
+    target = out[-1].arg
+    j = len(out) - 1
+    while j > 0 and out[j - 1].op is Op.LABEL:
+        j -= 1
+    if j > 0 and out[j - 1].op is Op.JUMP and out[j - 1].arg is target:
+        return len(out) - j + 1, out[j:]
+    return None
+
+def rule_store_load(out):
+    """STOREG n / PUSHG n  ->  DUP 1 / STOREG n   (o mesmo para STOREL/PUSHL)"""
+    if len(out) < 2:
+        return None
+    store, load = out[-2], out[-1]
+    if store.arg == load.arg and (store.op, load.op) in ((Op.STOREG, Op.PUSHG), (Op.STOREL, Op.PUSHL)):
+        return 2, [Instr(Op.DUP, 1, store.line), store]
+    return None
+
+def rule_unreachable(out):
+    """instruções depois de JUMP/RETURN/STOP e antes da próxima etiqueta nunca são executadas"""
+    if len(out) >= 2 and out[-2].op in (Op.JUMP, Op.RETURN, Op.STOP) and out[-1].op is not Op.LABEL:
+        return 1, []
+    return None
+
+
+_ARITH = tuple(_FOLD)
+
+# tabela de regras (nome, função, opcodes da última instrução que a podem ativar; None = qualquer);
+# a ordem é a ordem de aplicação
+RULES = [
+    ('fold-const', rule_fold_const, _ARITH),
+    ('add-zero', rule_add_zero, (Op.ADD, Op.SUB)),
+    ('mul-one', rule_mul_one, (Op.MUL, Op.DIV)),
+    ('strength', rule_strength, (Op.MUL, Op.MOD)),
+    ('jump-next', rule_jump_next, (Op.LABEL,)),
+    ('store-load', rule_store_load, (Op.PUSHG, Op.PUSHL)),
+    ('unreachable', rule_unreachable, None),
+]
+
+RULE_NAMES = [name for name, _, _ in RULES] + ['dead-label', 'dead-store']
+
+
+class PeepholeOptimizer:
+    def __init__(self, rules=None):
+        """
+        :param rules: nomes das regras a aplicar (None = todas, ver RULE_NAMES).
+        'dead-label' remove etiquetas que nenhum JUMP/JZ/PUSHA referencia
+        (exceto as de início dos subprogramas, ver optimize);
+        'dead-store' remove DUP 1 / STOREG/STOREL de variáveis que nunca são lidas.
+        """
+        enabled = set(RULE_NAMES if rules is None else rules)
+        unknown = enabled - set(RULE_NAMES)
+        if unknown:
+            raise ValueError(f"regras peephole desconhecidas: {', '.join(sorted(unknown))}")
+        rules = [(name, fn, ops) for name, fn, ops in RULES if name in enabled]
+        # por opcode: as regras que uma instrução com esse opcode no fim de out pode ativar
+        self.rules = {op: [(name, fn) for name, fn, ops in rules if ops is None or op in ops] for op in Op}
+        self.dead_labels = 'dead-label' in enabled
+        self.dead_stores = 'dead-store' in enabled
+        self.entries = set() # etiquetas que 'dead-label' nunca remove
+        # por regra: nº de vezes aplicada e nº de instruções removidas
+        self.stats = {name: {'hits': 0, 'removed': 0} for name in RULE_NAMES if name in enabled}
+
+    def optimize(self, code, entries=()):
+        """
+        devolve uma nova lista de instruções otimizada
+        :param entries: etiquetas de início dos subprogramas (CodeGenerator.entries): ficam
+            mesmo sem chamadas, e com elas o código que se lhes segue
+        """
+        instrs = list(code)
+        self.entries = set(entries)
+
+        while True:
+            instrs = self._apply_rules(instrs)
+            # no fim de uma passagem nenhuma regra se aplica (ver _apply_rules):
+            # só a remoção de etiquetas e de escritas mortas pode criar novas oportunidades
+            changed = self.dead_labels and self._remove_dead_labels(instrs)
+            if self.dead_stores and self._remove_dead_stores(instrs):
+                changed = True
+            if not changed:
+                return instrs
+
+    def _apply_rules(self, instrs):
+        """
+        uma passagem linear: cada instrução entra no fim de out e as regras veem esse fim.
+        Uma substituição sai de out e volta para a entrada, para ser vista de novo (a janela recua
+        só no fim da lista). Cada prefixo de out já foi visto por todas as regras, por isso o
+        resultado não tem mais nada a otimizar.
+        """
+        rules = self.rules
+        stats = self.stats
+        out = []
+        pending = instrs[::-1] # a próxima instrução está no fim
+        while pending:
+            ins = pending.pop()
+            out.append(ins)
+            for name, fn in rules[ins.op]:
+                r = fn(out)
+                if r is not None:
+                    n, repl = r
+                    stats[name]['hits'] += 1
+                    stats[name]['removed'] += n - len(repl)
+                    del out[-n:]
+                    pending.extend(reversed(repl))
+                    break
+        return out
+
+    def _remove_dead_labels(self, instrs):
+        used = {ins.arg for ins in instrs if ins.op in (Op.JUMP, Op.JZ, Op.PUSHA)}
+        used |= self.entries
+        before = len(instrs)
+        instrs[:] = [ins for ins in instrs if ins.op is not Op.LABEL or ins.arg in used]
+        removed = before - len(instrs)
+        if removed:
+            self.stats['dead-label']['hits'] += removed
+            self.stats['dead-label']['removed'] += removed
+        return removed > 0
+
+    def _remove_dead_stores(self, instrs):
+        """
+        DUP 1 / STOREG n  ->  (nada), se nenhum PUSHG n lê a variável (o mesmo para STOREL n,
+        dentro do subprograma); sobram sobretudo do store-load sobre as variáveis escondidas
+        das funções expandidas. Os offsets negativos (parâmetros e resultado) não contam:
+        o resultado é lido pelo chamador depois do RETURN.
+        """
+        # cada subprograma começa na sua etiqueta de entrada: os slots locais só valem lá dentro
+        unit = 0
+        units = []
+        loaded = set() # n de PUSHG n e (unidade, n) de PUSHL n
+        for ins in instrs:
+            if ins.op is Op.LABEL and ins.arg in self.entries:
+                unit += 1
+            units.append(unit)
+            if ins.op is Op.PUSHG:
+                loaded.add(ins.arg)
+            elif ins.op is Op.PUSHL:
+                loaded.add((unit, ins.arg))
+
+        out = []
+        for ins, unit in zip(instrs, units):
+            if out and out[-1].op is Op.DUP and out[-1].arg == 1 and (
+                    (ins.op is Op.STOREG and ins.arg not in loaded)
+                    or (ins.op is Op.STOREL and ins.arg >= 0 and (unit, ins.arg) not in loaded)):
+                out.pop()
+                continue
+            out.append(ins)
+        removed = len(instrs) - len(out)
+        if removed:
+            instrs[:] = out
+            self.stats['dead-store']['hits'] += removed // 2
+            self.stats['dead-store']['removed'] += removed
+        return removed > 0
+
+    def report(self):
+        """texto com o resumo por regra"""
+        linhas = ["peephole:"]
+        for name, s in self.stats.items():
+            linhas.append(f"  {name:12} aplicada {s['hits']:5}x, {s['removed']:5} instruções removidas")
+        return "\n".join(linhas)
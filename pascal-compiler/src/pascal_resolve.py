@@ -0,0 +1,240 @@
+"""
+Resolução dos identificadores (entre as otimizações da AST e o CodeGenerator).
+- cada identificador é procurado uma só vez: os nós ID, ARRAY_ACCESS, ASSIGN, ARRAY_ASSIGN,
+  FOR, CALL_EXP e CALL_STMT ficam com o símbolo resolvido em node.sym
+- a disposição de cada frame (offsets das variáveis locais, partilha de slots) é calculada aqui
+  e fica em node.frame do PROGRAM e de cada FUNCTION/PROCEDURE
+- as variáveis escondidas (TEMP_BLOCK, ex.: as da expansão inline) são tratadas como variáveis
+  locais, também no corpo principal: partilham slots segundo os tempos de vida
+O gerador já não consulta a tabela de símbolos nem reconstrói os scopes dos subprogramas.
+"""
+from types import MappingProxyType
+from pascal_ast import Node, ArrayType, UNKNOWN
+from pascal_anasem import BUILTINS, array_layout
+from pascal_ir import Op
+from pascal_liveness import INFINITO, LiveRanges, SlotAllocator
+
+
+class Symbol:
+    """símbolo resolvido (imutável): partilhado por todos os usos do mesmo identificador"""
+    __slots__ = ('name', 'category', 'type', 'scope', 'offset', 'layout', 'push', 'store')
+
+    def __init__(self, name, category, type_info, scope, offset):
+        """
+        :param category: 'VAR', 'FUNCTION' ou 'PROCEDURE'
+        :param scope: 'GLOBAL' ou 'LOCAL'
+        :param offset: slot da variável (nos parâmetros, negativo em relação ao FP)
+        """
+        # arrays: o slot guarda o pointer (base) para o bloco na heap
+        layout = None
+        if category == 'VAR' and isinstance(type_info, ArrayType):
+            layout = MappingProxyType(array_layout(type_info))
+        # instruções de acesso ao slot, como pares (op, arg) (ver pascal_ir)
+        if scope == 'GLOBAL':
+            push, store = (Op.PUSHG, offset), (Op.STOREG, offset)
+        else:
+            push, store = (Op.PUSHL, offset), (Op.STOREL, offset)
+        for field, value in zip(self.__slots__, (name, category, type_info, scope, offset, layout, push, store)):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"o símbolo '{self.name}' é imutável")
+
+    def __repr__(self):
+        return f"Symbol({self.name}, {self.category}, {self.type!r}, {self.scope}, {self.offset})"
+
+
+class Frame:
+    """disposição de um frame: slots já ocupados pelas variáveis e intervalos dos ciclos"""
+    __slots__ = ('is_global', 'slots', 'loops', 'params', 'uninit')
+
+    def __init__(self, is_global, slots, loops):
+        self.is_global = is_global
+        self.slots = slots # SlotAllocator (o gerador trabalha sobre uma cópia)
+        self.loops = loops # id do nó WHILE/FOR -> intervalo (vazio sem partilha de slots)
+        self.params = []   # símbolos dos parâmetros, por ordem
+        self.uninit = []   # slots que uma chamada nova teria a 0 e que podem ser lidos antes de atribuídos
+                           # (variáveis locais escalares e o resultado de uma função)
+
+
+# campo com o identificador de cada tipo de nó que recebe um símbolo
+_NAMED = {
+    'ID': 'name',
+    'ARRAY_ACCESS': 'name',
+    'ASSIGN': 'name',
+    'ARRAY_ASSIGN': 'name',
+    'FOR': 'var',
+    'CALL_EXP': 'name',
+    'CALL_STMT': 'name',
+}
+
+
+class Resolver:
+    def __init__(self, reuse_slots=True):
+        """
+        :param reuse_slots: variáveis locais com tempos de vida disjuntos partilham slots do frame
+        """
+        self.reuse_slots = reuse_slots
+        self.bound = 0      # identificadores ligados a um símbolo
+        self.unresolved = 0 # identificadores sem declaração (já reportados pelo parser)
+        self.missing = []   # nomes desses identificadores, pela ordem em que aparecem
+
+    def resolve(self, ast):
+        """liga os símbolos e as disposições dos frames aos nós da AST (devolve a mesma AST)"""
+        if not ast or ast.kind != 'PROGRAM':
+            return ast
+
+        # scope global: builtins, variáveis globais (slots fixos) e subprogramas, pela ordem do programa
+        scope = {}
+        for name, type_info, category in BUILTINS:
+            scope[name] = Symbol(name, category, type_info, 'GLOBAL', 0)
+        offset = 0
+        temps = {}
+        for definition in ast.defs:
+            if definition.kind == 'VAR_BLOCK':
+                for decl in definition.decls:
+                    for name in decl.names:
+                        scope[name.lower()] = Symbol(name, 'VAR', decl.type, 'GLOBAL', offset)
+                        offset += 1
+            elif definition.kind == 'TEMP_BLOCK':
+                for decl in definition.decls:
+                    for name in decl.names:
+                        temps[name.lower()] = decl.type
+            elif definition.kind in ('FUNCTION', 'PROCEDURE'):
+                scope[definition.name.lower()] = self.subprogram_symbol(definition, 'GLOBAL', offset)
+        self.globals = scope
+
+        # variáveis escondidas do corpo principal: depois das globais, com slots partilhados
+        offsets = {}
+        ast.frame, _ = self.layout(True, ast.body, offset, list(temps), temps, offsets)
+        for name, type_info in temps.items():
+            scope[name] = Symbol(name, 'VAR', type_info, 'GLOBAL', offsets[name])
+        self.bind_decls(ast.defs, scope)
+        self.bind(ast.body, scope)
+
+        for definition in ast.defs:
+            if definition.kind in ('FUNCTION', 'PROCEDURE'):
+                self.resolve_subprogram(definition)
+        return ast
+
+    @staticmethod
+    def subprogram_symbol(node, scope, offset):
+        type_info = node.rettype if node.kind == 'FUNCTION' else UNKNOWN
+        return Symbol(node.name, node.kind, type_info, scope, offset)
+
+    def resolve_subprogram(self, node):
+        """
+        parâmetros com offsets negativos (até -1), variáveis locais com offsets positivos
+        (partilhados segundo os tempos de vida). Os subprogramas aninhados não são gerados:
+        só o nome fica no scope local.
+        Numa função, o próprio nome é o slot de retorno reservado pelo chamador (por baixo dos parâmetros).
+        """
+        local = {}
+        types = {}
+        params = []
+        total_params = sum(len(p.names) for p in node.params)
+        if node.kind == 'FUNCTION':
+            local[node.name.lower()] = Symbol(node.name, 'FUNCTION', node.rettype, 'LOCAL', -(total_params + 1))
+        index = 0
+        for decl in node.params:
+            for name in decl.names:
+                key = name.lower()
+                local[key] = Symbol(name, 'VAR', decl.type, 'LOCAL', -(total_params - index))
+                types[key] = decl.type
+                params.append(local[key])
+                index += 1
+
+        local_names = []
+        for definition in node.defs:
+            if definition.kind in ('VAR_BLOCK', 'TEMP_BLOCK'):
+                for decl in definition.decls:
+                    for name in decl.names:
+                        types[name.lower()] = decl.type
+                        local_names.append(name.lower())
+            elif definition.kind in ('FUNCTION', 'PROCEDURE'):
+                local[definition.name.lower()] = self.subprogram_symbol(definition, 'LOCAL', 0)
+
+        offsets = {}
+        node.frame, uninit = self.layout(False, node.body, 0, local_names, types, offsets)
+        for definition in node.defs:
+            if definition.kind in ('VAR_BLOCK', 'TEMP_BLOCK'):
+                for decl in definition.decls:
+                    for name in decl.names:
+                        key = name.lower()
+                        local[key] = Symbol(name, 'VAR', types[key], 'LOCAL', offsets[key])
+        node.frame.params = params
+        node.frame.uninit = [local[name] for name in dict.fromkeys(local_names) if name in uninit]
+        if node.kind == 'FUNCTION':
+            # o chamador reserva o resultado com PUSHI 0: conta se pode ser lido antes de atribuído
+            # ou se algum caminho chega ao fim sem o atribuir (a função devolve então 0)
+            key = node.name.lower()
+            live = LiveRanges(node.body, {key})
+            if key in live.uninit or key not in live.exit:
+                node.frame.uninit.append(local[key])
+
+        self.bind_decls(node.params, local)
+        self.bind_decls(node.defs, local)
+        self.bind(node.body, local)
+
+    def find(self, name, local):
+        """procura no scope local e depois no global"""
+        key = name.lower()
+        sym = local.get(key)
+        if sym is None:
+            sym = self.globals.get(key)
+        return sym
+
+    def layout(self, is_global, body, fixed, local_names, types, offsets):
+        """
+        Dá um offset a cada variável local, reutilizando os slots de variáveis que já morreram.
+        No frame global as variáveis globais (fixed) ocupam os primeiros slots durante o programa inteiro.
+        Devolve o Frame e as variáveis escalares que podem ser lidas antes de atribuídas.
+        """
+        scalars = {name for name in local_names if not isinstance(types[name], ArrayType)}
+        live = LiveRanges(body, scalars)
+        slots = SlotAllocator(fixed, self.reuse_slots)
+
+        # arrays (o pointer é guardado à entrada) e, sem partilha, todas as variáveis: frame inteiro
+        intervals = []
+        for name in local_names:
+            if self.reuse_slots and name in scalars:
+                # uma variável nunca usada não precisa de slot
+                if name in live.ranges:
+                    intervals.append((tuple(live.ranges[name]), name))
+                else:
+                    offsets[name] = 0
+            else:
+                intervals.append(((0, INFINITO), name))
+
+        # por ordem de início (linear scan): o slot livre de menor offset dá o menor nº de slots
+        for interval, name in sorted(intervals, key=lambda item: item[0][0]):
+            offsets[name] = slots.allocate(interval)
+        return Frame(is_global, slots, live.loops if self.reuse_slots else {}), live.uninit
+
+    def bind_decls(self, definitions, local):
+        """símbolos dos nomes declarados (o gerador aloca os arrays a partir deles)"""
+        for definition in definitions:
+            decls = [definition] if definition.kind == 'DECL' else \
+                    definition.decls if definition.kind in ('VAR_BLOCK', 'TEMP_BLOCK') else ()
+            for decl in decls:
+                decl.syms = [self.find(name, local) for name in decl.names]
+
+    def bind(self, node, local):
+        """liga o símbolo de cada identificador de um comando ou expressão"""
+        if isinstance(node, list):
+            for child in node:
+                self.bind(child, local)
+            return
+        if not isinstance(node, Node):
+            return
+        field = _NAMED.get(node.kind)
+        if field is not None:
+            sym = self.find(getattr(node, field), local)
+            node.sym = sym
+            if sym is None:
+                self.unresolved += 1
+                self.missing.append(getattr(node, field))
+            else:
+                self.bound += 1
+        for child in node.children():
+            self.bind(child, local)
@@ -0,0 +1,121 @@
+"""
+Estatísticas de uma compilação: tempo e memória de cada fase e contadores
+(tokens, nós da AST por tipo, consultas à tabela de símbolos, etiquetas e instruções por opcode).
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pascal_ast import Node
+
+
+def count_nodes(node, counts):
+    """conta os nós da AST por tipo"""
+    if isinstance(node, Node):
+        counts[node.kind] = counts.get(node.kind, 0) + 1
+        for child in node.children():
+            count_nodes(child, counts)
+    elif isinstance(node, list):
+        for child in node:
+            count_nodes(child, counts)
+    return counts
+
+
+class CompileStats:
+    def __init__(self, memory=False):
+        """
+        :param memory: mede também a memória alocada em cada fase (tracemalloc;
+            os tempos passam a incluir o custo do tracemalloc)
+        """
+        self.memory = memory
+        self.phases = {}   # fase -> {'ms', e com memória 'alloc_kb' e 'peak_kb'}
+        self.counters = {} # contador -> valor (ou dicionário por tipo)
+        self.cache_hit = False
+        self._tracing = False
+
+    @contextmanager
+    def phase(self, name):
+        """mede o bloco como uma fase (os tempos de fases repetidas somam-se)"""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.phases.setdefault(name, {'ms': 0.0})
+            entry['ms'] += (time.perf_counter() - start) * 1000
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                entry['alloc_kb'] = entry.get('alloc_kb', 0) + (current - base) / 1024
+                entry['peak_kb'] = max(entry.get('peak_kb', 0), (peak - base) / 1024)
+
+    def finish(self):
+        """fecha a recolha (pára o tracemalloc se foi iniciado aqui)"""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def count_tokens(self, tokenfunc):
+        """
+        tokenfunc para o parser que conta os tokens (por tipo) à medida que são lidos, sem os guardar.
+        O tempo passado dentro do lexer fica na fase 'lex', que é parte da fase em que o parser corre
+        (a memória do lexer conta nessa fase).
+        """
+        lex = self.phases.setdefault('lex', {'ms': 0.0})
+        counters = self.counters
+        counters['tokens'] = 0
+        by_type = counters['tokens_by_type'] = {}
+        clock = time.perf_counter
+
+        def token():
+            start = clock()
+            tok = tokenfunc()
+            lex['ms'] += (clock() - start) * 1000
+            if tok is not None:
+                counters['tokens'] += 1
+                by_type[tok.type] = by_type.get(tok.type, 0) + 1
+            return tok
+        return token
+
+    def count_ast(self, ast):
+        by_type = count_nodes(ast, {})
+        self.counters['ast_nodes'] = sum(by_type.values())
+        self.counters['ast_nodes_by_type'] = by_type
+
+    def count_code(self, code):
+        """etiquetas e instruções (por opcode) do código final"""
+        labels = 0
+        opcodes = {}
+        for line in code:
+            if line.startswith('//'):
+                continue # comentários de linha (opção lines)
+            if line.endswith(':'):
+                labels += 1
+            else:
+                op = line.split(None, 1)[0]
+                opcodes[op] = opcodes.get(op, 0) + 1
+        self.counters['labels'] = labels
+        self.counters['instructions'] = sum(opcodes.values())
+        self.counters['instructions_by_opcode'] = opcodes
+
+    def as_dict(self):
+        return {'cache_hit': self.cache_hit, 'phases': self.phases, 'counters': self.counters}
+
+    def report(self):
+        """texto legível (o mesmo formato dos relatórios das otimizações)"""
+        linhas = ["stats:" + (" (acerto na cache)" if self.cache_hit else "")]
+        for name, entry in self.phases.items():
+            linha = f"  {name:12} {entry['ms']:9.2f} ms"
+            if 'alloc_kb' in entry:
+                linha += f"  {entry['alloc_kb']:9.1f} KB alocados  pico {entry['peak_kb']:9.1f} KB"
+            linhas.append(linha)
+        for name, value in self.counters.items():
+            if isinstance(value, dict):
+                mais = sorted(value.items(), key=lambda item: (-item[1], item[0]))
+                linhas.append(f"  {name:12} " + ", ".join(f"{k} {v}" for k, v in mais))
+            else:
+                linhas.append(f"  {name:12} {value}")
+        return "\n".join(linhas)
@@ -0,0 +1,363 @@
+"""
+Executor local do código EWVM gerado pelo compilador (sem passar pela VM web).
+
+    python3 pascal_vm.py programa.vm [--max-steps N] < input.txt
+
+O texto é lido uma só vez: as etiquetas são resolvidas para índices e cada instrução
+fica já com o seu handler e o argumento convertido (despacho por tabela).
+"""
+import re
+import sys
+
+
+class VMError(Exception):
+    """erro de execução da máquina virtual"""
+
+
+class Address:
+    """endereço de memória: uma zona (pilha ou bloco da heap) e um índice dentro dela"""
+    __slots__ = ('mem', 'idx')
+
+    def __init__(self, mem, idx):
+        self.mem = mem
+        self.idx = idx
+
+    def __eq__(self, other):
+        return isinstance(other, Address) and self.mem is other.mem and self.idx == other.idx
+
+    def __repr__(self):
+        return f"<endereço {self.idx}>"
+
+
+# \\ ou \" dentro de uma string (ver pascal_ir.escape)
+_ESCAPE = re.compile(r'\\(["\\])')
+
+# nome de cada tipo de operando, para as mensagens de erro
+_KINDS = {int: 'um inteiro', str: 'uma string', Address: 'um endereço'}
+
+
+def parse_program(text):
+    """
+    Converte o texto EWVM numa lista de (opcode, argumento) e num dicionário
+    etiqueta -> índice da próxima instrução.
+    """
+    code = []
+    labels = {}
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith('//'):
+            continue
+        if line.endswith(':') and ' ' not in line:
+            labels[line[:-1]] = len(code)
+            continue
+        op, _, arg = line.partition(' ')
+        code.append((op.upper(), arg.strip()))
+    return code, labels
+
+
+class VM:
+    def __init__(self, text, stdin=None, stdout=None, max_steps=None):
+        """
+        Carrega um programa EWVM.
+        :param text: o programa (texto gerado pelo compilador)
+        :param stdin: função sem argumentos que devolve a próxima linha lida, ou None no fim
+            (por omissão, lê do sys.stdin)
+        :param stdout: função que recebe o texto escrito (por omissão, sys.stdout.write)
+        :param max_steps: limite de instruções executadas (None = sem limite)
+        """
+        code, self.labels = parse_program(text)
+        self.max_steps = max_steps
+        self.read_line = stdin or (lambda: sys.stdin.readline() or None)
+        self.write = stdout or sys.stdout.write
+        self.steps = 0
+
+        # cada instrução: (handler, argumento já convertido); ops guarda os nomes para os erros
+        self.ops = [op for op, _ in code]
+        self.program = []
+        for op, arg in code:
+            handler = self.DISPATCH.get(op)
+            if handler is None:
+                raise VMError(f"instrução desconhecida: {op}")
+            self.program.append((handler, self.decode(op, arg)))
+
+    def decode(self, op, arg):
+        if op in ('JUMP', 'JZ', 'PUSHA'):
+            if arg not in self.labels:
+                raise VMError(f"etiqueta desconhecida: {arg}")
+            return self.labels[arg]
+        if op in ('PUSHS', 'ERR'):
+            return _ESCAPE.sub(r'\1', arg[1:-1]) if len(arg) >= 2 and arg[0] == '"' else arg
+        if arg:
+            return int(arg)
+        return None
+
+    def run(self):
+        """executa o programa até STOP (ou até ao fim do código). Devolve o nº de instruções executadas."""
+        self.stack = []
+        self.frames = [] # (pc de retorno, fp) de cada CALL
+        self.fp = 0
+        self.gp = 0
+        self.pc = 0
+        self.running = True
+
+        program = self.program
+        size = len(program)
+        limit = self.max_steps
+        steps = 0
+        try:
+            while self.running and self.pc < size:
+                handler, arg = program[self.pc]
+                self.pc += 1
+                steps += 1
+                if limit is not None and steps > limit:
+                    raise VMError(f"limite de {limit} instruções excedido")
+                handler(self, arg)
+        except VMError as e:
+            raise VMError(f"{e} (instrução {self.pc - 1}: {self.ops[self.pc - 1]})") from None
+        finally:
+            self.steps = steps
+        return steps
+
+    #auxiliares
+    def pop(self):
+        try:
+            return self.stack.pop()
+        except IndexError:
+            raise VMError("pilha vazia") from None
+
+    def slot(self, base, n):
+        i = base + n
+        if i < 0 or i >= len(self.stack):
+            raise VMError(f"acesso fora da pilha: {i}")
+        return i
+
+    @staticmethod
+    def expect(value, kind):
+        """o operando tem de ser do tipo esperado (senão VMError, e não um erro do Python)"""
+        if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            raise VMError(f"era esperado {_KINDS[kind]}, encontrado {value!r}")
+        return value
+
+    def element(self, a, n):
+        """(zona de memória, índice) do elemento n a partir do endereço a"""
+        self.expect(a, Address)
+        i = a.idx + self.expect(n, int)
+        if i < 0 or i >= len(a.mem):
+            raise VMError(f"acesso fora dos limites: {i}")
+        return a.mem, i
+
+    #instruções
+    def i_start(self, _):
+        self.fp = len(self.stack)
+
+    def i_stop(self, _):
+        self.running = False
+
+    def i_pushi(self, n):
+        self.stack.append(n)
+
+    def i_pushn(self, n):
+        self.stack.extend([0] * n)
+
+    def i_pushs(self, s):
+        self.stack.append(s)
+
+    def i_pushg(self, n):
+        self.stack.append(self.stack[self.slot(self.gp, n)])
+
+    def i_pushl(self, n):
+        self.stack.append(self.stack[self.slot(self.fp, n)])
+
+    def i_storeg(self, n):
+        v = self.pop()
+        self.stack[self.slot(self.gp, n)] = v
+
+    def i_storel(self, n):
+        v = self.pop()
+        self.stack[self.slot(self.fp, n)] = v
+
+    def i_pushgp(self, _):
+        self.stack.append(Address(self.stack, self.gp))
+
+    def i_pushfp(self, _):
+        self.stack.append(Address(self.stack, self.fp))
+
+    def i_padd(self, _):
+        n = self.expect(self.pop(), int)
+        a = self.expect(self.pop(), Address)
+        self.stack.append(Address(a.mem, a.idx + n))
+
+    def i_allocn(self, _):
+        self.stack.append(Address([0] * self.expect(self.pop(), int), 0))
+
+    def i_alloc(self, n):
+        self.stack.append(Address([0] * n, 0))
+
+    def i_loadn(self, _):
+        n = self.pop()
+        mem, i = self.element(self.pop(), n)
+        self.stack.append(mem[i])
+
+    def i_storen(self, _):
+        v = self.pop()
+        n = self.pop()
+        mem, i = self.element(self.pop(), n)
+        mem[i] = v
+
+    def i_load(self, n):
+        mem, i = self.element(self.pop(), n)
+        self.stack.append(mem[i])
+
+    def i_store(self, n):
+        v = self.pop()
+        mem, i = self.element(self.pop(), n)
+        mem[i] = v
+
+    def i_pop(self, n):
+        for _ in range(n):
+            self.pop()
+
+    def i_dup(self, n):
+        if n > len(self.stack):
+            raise VMError("pilha vazia")
+        self.stack.extend(self.stack[-n:])
+
+    def i_swap(self, _):
+        b = self.pop()
+        a = self.pop()
+        self.stack.extend((b, a))
+
+    @staticmethod
+    def div(a, b):
+        """divisão inteira com truncatura para zero (como o div do Pascal)"""
+        if b == 0:
+            raise VMError("divisão por zero")
+        q = abs(a) // abs(b)
+        return q if (a >= 0) == (b >= 0) else -q
+
+    def binop(fn, kind=int):
+        """operação sobre os dois valores do topo, ambos do tipo kind"""
+        def handler(self, _):
+            b = self.expect(self.pop(), kind)
+            a = self.expect(self.pop(), kind)
+            self.stack.append(fn(a, b))
+        return handler
+
+    i_add = binop(lambda a, b: a + b)
+    i_sub = binop(lambda a, b: a - b)
+    i_mul = binop(lambda a, b: a * b)
+    i_div = binop(lambda a, b: VM.div(a, b))
+    i_mod = binop(lambda a, b: a - b * VM.div(a, b))
+    i_inf = binop(lambda a, b: int(a < b))
+    i_infeq = binop(lambda a, b: int(a <= b))
+    i_sup = binop(lambda a, b: int(a > b))
+    i_supeq = binop(lambda a, b: int(a >= b))
+    i_and = binop(lambda a, b: int(bool(a) and bool(b)))
+    i_or = binop(lambda a, b: int(bool(a) or bool(b)))
+    i_concat = binop(lambda a, b: a + b, str)
+    del binop
+
+    def i_equal(self, _):
+        # o gerador também compara strings (s = 'abc'): os dois operandos só têm de ser do mesmo tipo
+        b = self.pop()
+        a = self.expect(self.pop(), type(b))
+        self.stack.append(int(a == b))
+
+    def i_not(self, _):
+        self.stack.append(int(not self.expect(self.pop(), int)))
+
+    def i_jump(self, target):
+        self.pc = target
+
+    def i_jz(self, target):
+        if self.pop() == 0:
+            self.pc = target
+
+    def i_pusha(self, target):
+        self.stack.append(target)
+
+    def i_call(self, _):
+        target = self.pop()
+        self.frames.append((self.pc, self.fp))
+        self.fp = len(self.stack)
+        self.pc = target
+
+    def i_return(self, _):
+        if not self.frames:
+            raise VMError("RETURN sem CALL")
+        del self.stack[self.fp:]
+        self.pc, self.fp = self.frames.pop()
+
+    def i_read(self, _):
+        line = self.read_line()
+        if line is None:
+            raise VMError("fim do input")
+        self.stack.append(line.rstrip('\n'))
+
+    def i_atoi(self, _):
+        s = self.pop()
+        try:
+            self.stack.append(int(str(s).strip()))
+        except ValueError:
+            raise VMError(f"ATOI: valor inválido {s!r}") from None
+
+    def i_strlen(self, _):
+        self.stack.append(len(self.expect(self.pop(), str)))
+
+    def i_charat(self, _):
+        n = self.expect(self.pop(), int)
+        s = self.expect(self.pop(), str)
+        if not 0 <= n < len(s):
+            raise VMError(f"CHARAT fora dos limites: {n}")
+        self.stack.append(ord(s[n]))
+
+    def i_writei(self, _):
+        self.write(str(self.expect(self.pop(), int)))
+
+    def i_writes(self, _):
+        self.write(str(self.pop()))
+
+    def i_writechr(self, _):
+        self.write(chr(self.expect(self.pop(), int)))
+
+    def i_writeln(self, _):
+        self.write("\n")
+
+    def i_nop(self, _):
+        pass
+
+    def i_err(self, msg):
+        raise VMError(msg)
+
+    DISPATCH = {} # opcode -> handler (preenchida a seguir à classe)
+
+
+for _name in list(vars(VM)):
+    if _name.startswith('i_'):
+        VM.DISPATCH[_name[2:].upper()] = getattr(VM, _name)
+
+
+def run_text(text, inputs=(), max_steps=None):
+    """executa um programa com um input fixo (uma linha por elemento). Devolve (output, nº de instruções)."""
+    lines = iter(inputs)
+    out = []
+    vm = VM(text, stdin=lambda: next(lines, None), stdout=out.append, max_steps=max_steps)
+    vm.run()
+    return "".join(out), vm.steps
+
+
+if __name__ == "__main__":
+    import argparse
+
+    argp = argparse.ArgumentParser(usage="python3 pascal_vm.py <programa.vm> [--max-steps N]")
+    argp.add_argument("programa", help="código EWVM gerado pelo compilador")
+    argp.add_argument("--max-steps", type=int, default=None, help="limite de instruções executadas")
+    args = argp.parse_args()
+
+    with open(args.programa, 'r') as f:
+        vm = VM(f.read(), max_steps=args.max_steps)
+    try:
+        vm.run()
+    except VMError as e:
+        print(f"Erro de execução: {e}")
+        sys.exit(1)
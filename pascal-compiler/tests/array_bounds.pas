@@ -0,0 +1,26 @@
+program ArrayBounds;
+var
+  a: array[5..9] of integer;
+  b: array[0..4] of integer;
+  i, s: integer;
+
+procedure Local();
+var
+  c: array[3..4] of integer;
+begin
+  c[3] := 1;
+  c[4] := 2;
+  writeln(c[3] + c[4])
+end;
+
+begin
+  for i := 5 to 9 do
+    a[i] := i * 10;
+  for i := 0 to 4 do
+    b[i] := i;
+  s := 0;
+  for i := 5 to 9 do
+    s := s + a[i];
+  writeln(s, ' ', a[5], ' ', a[9], ' ', b[0], ' ', b[4]);
+  Local()
+end.
@@ -0,0 +1,32 @@
+program CfgJumps;
+var
+  i, j, pares, impares, total: integer;
+begin
+  pares := 0;
+  impares := 0;
+  total := 0;
+  i := 0;
+  while i < 6 do
+  begin
+    i := i + 1;
+    if i mod 2 = 0 then
+    begin
+      if i > 2 then
+        pares := pares + i
+      else
+        pares := pares + 100
+    end
+    else
+      impares := impares + i;
+    j := 0;
+    while j < i do
+    begin
+      if j > 3 then
+        j := i
+      else
+        j := j + 1;
+      total := total + 1
+    end
+  end;
+  writeln(pares, ' ', impares, ' ', total)
+end.
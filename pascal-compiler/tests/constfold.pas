@@ -0,0 +1,19 @@
+program ConstFold;
+var
+  x, y, z: integer;
+  b: boolean;
+begin
+  x := 2 * 3 + 4;
+  y := x div 3 - 1;
+  b := (x > 5) and (y <> 0);
+  if x > 100 then
+    writeln('nunca')
+  else
+    writeln('x=', x, ' y=', y);
+  z := 0;
+  while z < x do
+    z := z + y;
+  if b then
+    writeln('b');
+  writeln(z, ' ', 7 mod 3, ' ', 0 - x)
+end.
@@ -0,0 +1,24 @@
+program ForBounds;
+var
+  g0, g1, n, k: integer;
+begin
+  g0 := 4;
+  g1 := 0;
+  n := 0;
+  for g0 := (g0 div 4) to (g0 + g1) do
+    n := n + 1;
+  writeln(n);
+  g1 := 10;
+  n := 0;
+  for g1 := g1 - 7 downto g1 - 9 do
+    n := n + g1;
+  writeln(n);
+  n := 3;
+  k := 0;
+  for g0 := 1 to n do
+  begin
+    n := n + 1;
+    k := k + 1
+  end;
+  writeln(k, ' ', n)
+end.
@@ -0,0 +1,37 @@
+program InlineResult;
+var
+  bin: string;
+  n, k: integer;
+
+function isone(s: string): boolean;
+begin
+  isone := s[1] = '1'
+end;
+
+function sq(x: integer): integer;
+var
+  t: integer;
+begin
+  t := x * x;
+  sq := t + 1
+end;
+
+procedure Mostra(v: integer);
+var
+  r: integer;
+begin
+  r := sq(v) * 2;
+  writeln(r, ' ', isone('1'))
+end;
+
+begin
+  readln(bin);
+  if isone(bin) then
+    writeln('um')
+  else
+    writeln('zero');
+  readln(n);
+  k := sq(n) + sq(k);
+  writeln(k);
+  Mostra(k)
+end.
@@ -0,0 +1,28 @@
+program InlineStringParam;
+var
+  bin: string;
+  n: integer;
+
+function isone(s: string): boolean;
+begin
+  isone := s[1] = '1'
+end;
+
+function dobro(k: integer): integer;
+begin
+  dobro := k + k
+end;
+
+begin
+  readln(bin);
+  n := 3;
+  if isone(bin) then
+    writeln('yes')
+  else
+    writeln('no');
+  if isone('01') then
+    writeln('literal: yes')
+  else
+    writeln('literal: no');
+  writeln(dobro(n), ' ', dobro(21))
+end.
@@ -0,0 +1,20 @@
+program KeepUnused;
+var
+  x: integer;
+
+procedure Nunca(n: integer);
+begin
+  while n > 0 do
+    n := n - 1;
+  writeln('nunca ', n)
+end;
+
+function Dobro(n: integer): integer;
+begin
+  Dobro := n * 2
+end;
+
+begin
+  x := 5;
+  writeln(Dobro(x))
+end.
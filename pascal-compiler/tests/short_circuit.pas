@@ -0,0 +1,28 @@
+program ShortCircuit;
+var
+  d, i, n, soma: integer;
+  fim, b: boolean;
+begin
+  d := 0;
+  n := 10;
+  if (d <> 0) and (n div d > 1) then
+    writeln('nunca')
+  else
+    writeln('guarda');
+  if (d = 0) or (n div d > 1) then
+    writeln('ou');
+  i := 0;
+  soma := 0;
+  fim := false;
+  while (i < n) and not fim do
+  begin
+    i := i + 1;
+    if (d <> 0) and (n div d = i) then
+      soma := soma + 100;
+    soma := soma + i;
+    if not (i < 4) then
+      fim := true
+  end;
+  b := (i > 3) and not fim or (soma = 10);
+  writeln(i, ' ', soma, ' ', b)
+end.
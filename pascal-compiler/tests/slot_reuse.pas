@@ -0,0 +1,25 @@
+program SlotReuse;
+var
+  r: integer;
+
+function Calc(n: integer): integer;
+var
+  a, b, c, i, acc: integer;
+begin
+  a := n * 2;
+  b := a + 1;
+  acc := b;
+  c := 0;
+  for i := 1 to n do
+  begin
+    c := c + i;
+    acc := acc + c
+  end;
+  a := acc mod 7;
+  Calc := a + c
+end;
+
+begin
+  r := Calc(4);
+  writeln(r, ' ', Calc(1))
+end.
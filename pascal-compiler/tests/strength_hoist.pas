@@ -0,0 +1,28 @@
+program StrengthHoist;
+var
+  i, n, d, s, t: integer;
+begin
+  n := 7;
+  d := 3;
+  s := 0;
+  t := 0;
+  for i := 1 to n do
+  begin
+    s := s + i * 2 + (n div d) + (n mod 4);
+    t := t + i * 1 + i * 0 + i mod 1
+  end;
+  i := 0;
+  while i < n div d do
+    i := i + 1;
+  writeln(s, ' ', t, ' ', i);
+  { o divisor pode ser zero: a divisão não pode sair do if }
+  d := 0;
+  i := 0;
+  while i < 3 do
+  begin
+    if d <> 0 then
+      s := s + n div d;
+    i := i + 1
+  end;
+  writeln(s)
+end.
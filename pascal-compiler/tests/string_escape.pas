@@ -0,0 +1,9 @@
+program StringEscape;
+var
+  s: string;
+begin
+  writeln('aspas "x" e barra \ no fim\');
+  s := 'a\"b';
+  writeln(s, ' ', length(s));
+  writeln('it''s ', '"', s, '"')
+end.
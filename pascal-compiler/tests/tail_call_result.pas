@@ -0,0 +1,21 @@
+program TailCallResult;
+
+function f(n: integer): integer;
+begin
+  if n = 5 then
+    f := 99;
+  if n > 0 then
+    f := f(n - 1)
+end;
+
+function g(n: integer): integer;
+begin
+  if n > 0 then
+    g := g(n - 1)
+  else
+    g := n + 7
+end;
+
+begin
+  writeln(f(5), ' ', f(3), ' ', g(4))
+end.
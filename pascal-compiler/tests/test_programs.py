@@ -0,0 +1,125 @@
+"""
+Compila os programas de tests/ e executa-os no executor local (pascal_vm), com várias
+combinações de otimizações: o output tem de ser sempre o esperado.
+
+    python3 -m pytest -q tests
+"""
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS, '..', 'src'))
+
+from pascal_compiler import Compiler
+from pascal_codegen import code_to_text
+from pascal_vm import run_text, VMError
+
+# programa -> (linhas de input, output esperado)
+PROGRAMAS = {
+    'hello': ([], "Ola, Mundo!\n"),
+    'fatorial': (['5'], "Introduza um número inteiro positivo:\nFatorial de 5: 120\n"),
+    'bin_to_int': (['1011'], "Introduza uma string binária:\nO valor inteiro correspondente é: 11\n"),
+    'primo_check': (['17'], "Introduza um número inteiro positivo:\n17 é um número primo\n"),
+    'soma_array': (['1', '2', '3', '4', '5'], "Introduza 5 números inteiros:\nA soma dos números é: 15\n"),
+    # um programa por otimização
+    'constfold': ([], "x=10 y=2\nb\n10 1 -10\n"),
+    'keep_unused': ([], "10\n"),
+    'strength_hoist': ([], "91 28 2\n91\n"),
+    'for_bounds': ([], "4\n6\n3 6\n"),
+    'array_bounds': ([], "350 50 90 0 4\n3\n"),
+    'slot_reuse': ([], "11 5\n"),
+    'tail_call_result': ([], "0 0 7\n"),
+    'inline_string_param': (['1'], "yes\nliteral: no\n6 42\n"),
+    'short_circuit': ([], "guarda\nou\n4 10 1\n"),
+    'cfg_jumps': ([], "110 9 20\n"),
+    'string_escape': ([], 'aspas "x" e barra \\ no fim\\\na\\"b 4\nit\'s "a\\"b"\n'),
+    'writeln_merge': ([], "n=42 b=1 10 fim\n12\n\n42\n"),
+    'inline_result': (['10', '3'], "um\n11\n244 1\n"),
+}
+
+# combinações de opções do Compiler: as otimizações não podem mudar o output
+OPCOES = {
+    'omissao': {},
+    'sem_otimizacoes': {'constfold': False, 'prune': False, 'peephole': False, 'reuse_slots': False,
+                        'tail_calls': False, 'inline': False, 'cfg': False},
+    'sem_constfold': {'constfold': False},
+    'sem_remocao': {'prune': False},
+    'sem_peephole': {'peephole': False},
+    'sem_partilha': {'reuse_slots': False},
+    'sem_tail_calls': {'tail_calls': False},
+    'sem_inline': {'inline': False},
+    'sem_cfg': {'cfg': False},
+}
+
+MAX_STEPS = 1_000_000
+
+
+def compilar(nome, opcoes):
+    with open(os.path.join(TESTS, f"{nome}.pas")) as f:
+        source = f.read()
+    compiler = Compiler(options=opcoes)
+    code = compiler.compile(source)
+    assert code is not None and compiler.errors == 0
+    return code
+
+
+def executar(nome, opcoes, inputs):
+    output, _ = run_text(code_to_text(compilar(nome, opcoes)), inputs, max_steps=MAX_STEPS)
+    return output
+
+
+@pytest.mark.parametrize('opcoes', OPCOES.values(), ids=list(OPCOES))
+@pytest.mark.parametrize('nome', list(PROGRAMAS))
+def test_programa(nome, opcoes):
+    inputs, esperado = PROGRAMAS[nome]
+    assert executar(nome, opcoes, inputs) == esperado
+
+
+@pytest.mark.parametrize('opcoes', OPCOES.values(), ids=list(OPCOES))
+def test_subprograma_nao_chamado(opcoes):
+    """sem a remoção do callgraph (--keep-unused) um subprograma nunca chamado fica inteiro no código"""
+    code = compilar('keep_unused', {**opcoes, 'prune': False})
+    assert 'Nunca:' in code
+    assert '\tPUSHS "nunca "' in code and '\tSUP' in code
+
+
+@pytest.mark.parametrize('opcoes', [{}, {'no_inline': ['Mostra']}], ids=['omissao', 'locais'])
+def test_inline_sem_temporarios_mortos(opcoes):
+    """o resultado de uma função expandida não passa por uma variável escondida que ninguém lê"""
+    code = compilar('inline_result', opcoes)
+    for store, load in (('\tSTOREG ', '\tPUSHG '), ('\tSTOREL ', '\tPUSHL ')):
+        stored = {line.split()[1] for line in code if line.startswith(store)}
+        loaded = {line.split()[1] for line in code if line.startswith(load)}
+        assert stored <= loaded
+    assert {line for line in code if line.startswith('\tPUSHA')} <= {'\tPUSHA Mostra'}
+
+
+def test_writeln_constantes():
+    """os argumentos constantes seguidos de um writeln (também depois da propagação) são um só PUSHS"""
+    code = compilar('writeln_merge', {})
+    assert '\tPUSHS "n=42 b=1 10 fim"' in code
+    assert code.count('\tWRITES') == 2 and '\tWRITEI' in code
+
+
+@pytest.mark.parametrize('programa', [
+    "START\n\tPUSHI 1\n\tLOAD 0\nSTOP",          # LOAD sem endereço
+    "START\n\tPUSHI 3\n\tSTRLEN\nSTOP",          # STRLEN de um inteiro
+    "START\n\tPUSHS \"a\"\n\tPUSHI 1\n\tADD\nSTOP",
+    "START\n\tPUSHS \"a\"\n\tPUSHS \"b\"\n\tADD\nSTOP",   # não concatena
+    "START\n\tPUSHS \"a\"\n\tPUSHI 3\n\tMUL\nSTOP",       # não repete a string
+    "START\n\tPUSHS \"a\"\n\tPUSHS \"b\"\n\tINF\nSTOP",
+    "START\n\tPUSHS \"a\"\n\tPUSHI 1\n\tEQUAL\nSTOP",     # tipos diferentes
+    "START\n\tPUSHS \"a\"\n\tWRITEI\nSTOP",
+])
+def test_operando_invalido(programa):
+    """um operando do tipo errado é um erro da VM (e não um erro do Python nem um resultado)"""
+    with pytest.raises(VMError):
+        run_text(programa)
+
+
+def test_equal_strings():
+    """EQUAL também compara duas strings (o gerador usa-o em s = 'abc')"""
+    output, _ = run_text("START\n\tPUSHS \"ab\"\n\tPUSHS \"ab\"\n\tEQUAL\n\tWRITEI\nSTOP")
+    assert output == "1"
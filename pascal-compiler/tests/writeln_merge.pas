@@ -0,0 +1,12 @@
+program WritelnMerge;
+var
+  n: integer;
+  b: boolean;
+begin
+  n := 6 * 7;
+  b := n > 40;
+  writeln('n=', n, ' b=', b, ' ', true, false, ' fim');
+  writeln(1, 2);
+  writeln('');
+  writeln(n)
+end.